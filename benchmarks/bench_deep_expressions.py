@@ -0,0 +1,98 @@
+"""
+Stress benchmark of AST traversal on very deep expressions, comparing the recursive
+traversal of `BaseVisitor` against the explicit-stack traversal of `IterativeVisitor`,
+and timing `OpsConverterVisitor` on the same expressions.
+
+Each traversal runs under the default recursion limit, so that a traversal that
+cannot handle an expression is reported as failed. The Vyper front end is recursive,
+so the recursion limit is raised while the contracts are parsed and prepared.
+
+Usage: python benchmarks/bench_deep_expressions.py [--repeat N] [--depths 100,1000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+# Recursion limit while parsing contracts in the Vyper front end
+PARSE_RECURSION_LIMIT = 100_000
+
+
+def make_contract(depth: int) -> str:
+    """
+    Returns a contract with a function that returns a chain of `depth` divisions,
+    which is parsed as a left-nested tree of `BinOp` nodes.
+    """
+    expr = " / ".join(["x"] * (depth + 1))
+    return f"@external\ndef foo(x: uint256) -> uint256:\n    return {expr}\n"
+
+
+def parse(depth: int):
+    """
+    Returns the AST of a contract and its context, prepared for the passes to run.
+    """
+    from vyro.transpiler.context import ASTContext
+    from vyro.transpiler.passes import InitialisationVisitor
+    from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(PARSE_RECURSION_LIMIT)
+    try:
+        ast = get_vyper_ast_from_source(make_contract(depth), "bench_deep.vy")
+        context = ASTContext.get_context(ast)
+        InitialisationVisitor().visit(ast, ast, context)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    return ast, context
+
+
+def time_visitor(visitor_cls: type, depth: int, repeat: int):
+    """
+    Returns the average time to run a visitor on a freshly parsed contract, or `None`
+    if the visitor hits the recursion limit.
+    """
+    elapsed = 0.0
+    for _ in range(repeat):
+        ast, context = parse(depth)
+        start = time.perf_counter()
+        try:
+            visitor_cls().visit(ast, ast, context)
+        except RecursionError:
+            return None
+        elapsed += time.perf_counter() - start
+
+    return elapsed / repeat
+
+
+def main():
+    from vyro.transpiler.passes import OpsConverterVisitor
+    from vyro.transpiler.traversal import IterativeVisitor
+    from vyro.transpiler.visitor import BaseVisitor
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--depths", default="100,300,1000,3000")
+    args = parser.parse_args()
+
+    visitors = {
+        "recursive walk": BaseVisitor,
+        "iterative walk": IterativeVisitor,
+        "Oc pass": OpsConverterVisitor,
+    }
+
+    print(f"{'depth':>6}" + "".join(f"{name + ' (ms)':>22}" for name in visitors))
+    for depth in (int(i) for i in args.depths.split(",")):
+        row = f"{depth:>6}"
+        for visitor_cls in visitors.values():
+            elapsed = time_visitor(visitor_cls, depth, args.repeat)
+            row += f"{'RecursionError':>22}" if elapsed is None else f"{elapsed * 1000:>22.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark node dispatch in `BaseVisitor.visit` and `CairoWriter.write` on a full
+transpile of the `examples/` corpus, comparing the per-class dispatch tables against
+the previous `getattr` lookup of the visitor function on every node.
+
+Only the transpiler passes and the writer are timed. The Vyper ASTs are parsed
+before the measurement starts.
+
+Usage: python benchmarks/bench_dispatch.py [--repeat N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES = sorted((ROOT / "examples").glob("*.vy"))
+
+sys.path.insert(0, str(ROOT))
+
+from vyro.cairo.writer import CairoWriter, write  # noqa: E402
+from vyro.exceptions import UnsupportedNode  # noqa: E402
+from vyro.transpiler.transpile import transpile  # noqa: E402
+from vyro.transpiler.visitor import BaseVisitor  # noqa: E402
+from vyro.vyper.vyper_compile import get_vyper_ast  # noqa: E402
+
+
+def _legacy_visit(self, node, ast, context, *args):
+    node_type = type(node).__name__
+    visitor_fn = getattr(self, f"visit_{node_type}", None)
+    if visitor_fn is None:
+        raise UnsupportedNode(f"{node_type} node is not yet supported in visitor", node)
+    visitor_fn(node, ast, context, *args)
+
+
+def _legacy_write(self, node, *args):
+    node_type = type(node).__name__
+    write_fn = getattr(self, f"write_{node_type}", None)
+    if write_fn is None:
+        raise UnsupportedNode(f"{node_type} node is not yet supported in writer", node)
+    return write_fn(node, *args)
+
+
+@contextmanager
+def legacy_dispatch():
+    visit, write_ = BaseVisitor.visit, CairoWriter.write
+    BaseVisitor.visit, CairoWriter.write = _legacy_visit, _legacy_write
+    try:
+        yield
+    finally:
+        BaseVisitor.visit, CairoWriter.write = visit, write_
+
+
+def run() -> float:
+    # Passes modify the AST in place, so each run needs freshly parsed ASTs
+    trees = [get_vyper_ast(str(p)) for p in EXAMPLES]
+
+    start = time.perf_counter()
+    for vyper_ast in trees:
+        transpile(vyper_ast)
+        write(vyper_ast)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm up imports and caches
+    run()
+
+    results = {"table": [], "getattr": []}
+    for _ in range(args.repeat):
+        # Interleave the modes to reduce the effect of system noise
+        results["table"].append(run())
+        with legacy_dispatch():
+            results["getattr"].append(run())
+
+    print(f"{len(EXAMPLES)} contracts, median of {args.repeat} runs\n")
+    print(f"{'dispatch':<10}{'time (ms)':>12}")
+    for mode, times in results.items():
+        print(f"{mode:<10}{statistics.median(times) * 1000:>12.2f}")
+
+    speedup = statistics.median(results["getattr"]) / statistics.median(results["table"])
+    print(f"\nSpeedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark the Vyper front end (parsing, folding and semantic validation) on the
+`examples/` corpus, comparing folding a deep copy of the AST against folding in place.
+
+Each mode runs in a separate process so that the peak RSS of one mode does not
+hide that of the other.
+
+Usage: python benchmarks/bench_frontend.py [--repeat N]
+"""
+import argparse
+import copy
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES = sorted((ROOT / "examples").glob("*.vy"))
+
+sys.path.insert(0, str(ROOT))
+
+
+def _parse_copy(path: Path):
+    # Previous behaviour of `get_vyper_ast`
+    from vyper import ast as vy_ast
+    from vyper.compiler.phases import generate_ast
+    from vyper.semantics import validate_semantics
+
+    source_code = path.read_text() + "\n"
+    vyper_ast = generate_ast(source_code, 0, str(path))
+    vy_ast.validation.validate_literal_nodes(vyper_ast)
+    vyper_ast_folded = copy.deepcopy(vyper_ast)
+    vy_ast.folding.fold(vyper_ast_folded)
+    validate_semantics(vyper_ast_folded, None)
+    return vyper_ast_folded
+
+
+def _parse_inplace(path: Path):
+    from vyro.vyper.vyper_compile import get_vyper_ast
+
+    return get_vyper_ast(str(path))
+
+
+MODES = {"copy": _parse_copy, "inplace": _parse_inplace}
+
+
+def run_mode(mode: str, repeat: int) -> dict:
+    parse = MODES[mode]
+
+    # Warm up imports so that they are not included in the measurement
+    parse(EXAMPLES[0])
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        # Keep every tree alive to make the memory overhead of each mode visible
+        trees = [parse(p) for p in EXAMPLES]
+    elapsed = time.perf_counter() - start
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del trees
+
+    return {
+        "mode": mode,
+        "contracts": len(EXAMPLES),
+        "repeat": repeat,
+        "seconds": elapsed,
+        "peak_rss_kb": rss_after,
+        "peak_rss_delta_kb": rss_after - rss_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.repeat)))
+        return
+
+    results = []
+    for mode in MODES:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--repeat", str(args.repeat)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results.append(json.loads(proc.stdout))
+
+    print(f"{'mode':<10}{'time (s)':>12}{'peak RSS (KiB)':>18}{'RSS delta (KiB)':>18}")
+    for r in results:
+        print(
+            f"{r['mode']:<10}{r['seconds']:>12.3f}{r['peak_rss_kb']:>18}"
+            f"{r['peak_rss_delta_kb']:>18}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Measure the import time of the vyro CLI entry points and the wall time of commands
+that should start quickly.
+
+Import times are taken from `python -X importtime`. Results can be appended as a
+JSON line to a file so that start-up time can be tracked over time.
+
+Usage: python benchmarks/bench_import_time.py [--repeat N] [--append <file>]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "vyro._cli.__main__",
+    "vyro._cli.transpile",
+    "vyro._cli.transform",
+    "vyro.vyper.vyper_compile",
+    "vyro.transpiler.transpile",
+]
+
+MAIN = "import sys; from vyro._cli.__main__ import main; sys.argv[0] = 'vyro'; main()"
+
+COMMANDS = {
+    "vyro --version": ["--version"],
+    "vyro --help": ["--help"],
+    "vyro transpile --help": ["transpile", "--help"],
+    "vyro <typo>": ["transpil"],
+}
+
+
+def get_import_time(module: str) -> int:
+    """
+    Returns the cumulative import time of `module` in microseconds.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f"No import time reported for {module}")
+
+
+def get_command_time(argv: list) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", MAIN, *argv], cwd=ROOT, capture_output=True)
+    return time.perf_counter() - start
+
+
+def get_git_revision() -> str:
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+    )
+    return proc.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--append", metavar="FILE", help="Append results as a JSON line")
+    args = parser.parse_args()
+
+    imports = {
+        m: statistics.median(get_import_time(m) for _ in range(args.repeat)) for m in MODULES
+    }
+    commands = {
+        c: statistics.median(get_command_time(argv) for _ in range(args.repeat))
+        for c, argv in COMMANDS.items()
+    }
+
+    print(f"{'module':<32}{'import (ms)':>14}")
+    for m, us in imports.items():
+        print(f"{m:<32}{us / 1000:>14.1f}")
+
+    print(f"\n{'command':<32}{'wall (ms)':>14}")
+    for c, seconds in commands.items():
+        print(f"{c:<32}{seconds * 1000:>14.1f}")
+
+    if args.append:
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "revision": get_git_revision(),
+            "python": platform.python_version(),
+            "import_us": imports,
+            "command_s": commands,
+        }
+        with open(args.append, "a") as fh:
+            fh.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
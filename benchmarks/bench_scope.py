@@ -0,0 +1,118 @@
+"""
+Benchmark scope resolution (`get_scope` and `get_stmt_node`) on contracts with
+deeply nested `if` statements, comparing the previous implementation, which searched
+every descendant of the enclosing `If` node, against walking the parent chain.
+
+Usage: python benchmarks/bench_scope.py [--repeat N] [--depths 8,16,32,64]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+
+def make_contract(depth: int) -> str:
+    """
+    Returns a contract with a function that nests `depth` if statements, each with
+    an arithmetic statement before the next level and one in its `else` branch.
+    """
+    lines = ["@external", "def foo(x: uint256) -> uint256:", "    a: uint256 = x"]
+    for i in range(depth):
+        indent = "    " * (i + 1)
+        lines.append(f"{indent}if x > {i}:")
+        lines.append(f"{indent}    a = a * {i + 2} + x")
+    for i in reversed(range(depth)):
+        indent = "    " * (i + 1)
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    a = a - {i + 1}")
+    lines.append("    return a")
+    return "\n".join(lines) + "\n"
+
+
+def _get_scope_descendants(node):
+    # Previous behaviour of `get_scope`
+    from vyper import ast as vy_ast
+
+    scope_node = node.get_ancestor((vy_ast.FunctionDef, vy_ast.If))
+
+    if isinstance(scope_node, vy_ast.If):
+        body_nodes = []
+        for n in scope_node.body:
+            body_nodes.extend(n.get_descendants(include_self=True))
+
+        orelse_nodes = []
+        for n in scope_node.orelse:
+            orelse_nodes.extend(n.get_descendants(include_self=True))
+
+        if node in body_nodes:
+            return (scope_node, scope_node.body)
+        elif node in orelse_nodes:
+            return (scope_node, scope_node.orelse)
+        else:
+            return _get_scope_descendants(scope_node)
+
+    return (scope_node, scope_node.body)
+
+
+def time_scopes(depth: int, repeat: int) -> dict:
+    from vyper import ast as vy_ast
+
+    from vyro.transpiler.utils import get_scope
+    from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+    ast = get_vyper_ast_from_source(make_contract(depth), "bench_scope.vy")
+    fn_node = ast.get_children(vy_ast.FunctionDef)[0]
+    nodes = fn_node.get_descendants(vy_ast.BinOp)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for n in nodes:
+            _get_scope_descendants(n)
+    descendants = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for n in nodes:
+            get_scope(n)
+    parent_chain = time.perf_counter() - start
+
+    return {"nodes": len(nodes), "descendants": descendants, "parent_chain": parent_chain}
+
+
+def time_transpile(depth: int, repeat: int) -> float:
+    from vyro.api import transpile_source
+
+    source = make_contract(depth)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        transpile_source(source)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--depths", default="8,16,32,64")
+    args = parser.parse_args()
+
+    depths = [int(i) for i in args.depths.split(",")]
+
+    print(
+        f"{'depth':>6}{'nodes':>8}{'descendants (ms)':>20}{'parent chain (ms)':>20}"
+        f"{'transpile (ms)':>18}"
+    )
+    for depth in depths:
+        r = time_scopes(depth, args.repeat)
+        transpile = time_transpile(depth, args.repeat)
+        print(
+            f"{depth:>6}{r['nodes']:>8}{r['descendants'] * 1000:>20.2f}"
+            f"{r['parent_chain'] * 1000:>20.2f}{transpile * 1000:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
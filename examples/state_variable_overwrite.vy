@@ -0,0 +1,17 @@
+# @version ^0.3.5
+
+a: public(uint256)
+b: public(HashMap[uint256, uint256])
+
+@external
+def set_a_augassign(x: uint256, y: uint256):
+    self.a = x
+    self.a += y
+
+@external
+def set_b_in_branches(k: uint256, x: uint256, c: bool):
+    self.b[k] = x
+    if c:
+        self.b[k] = x + 1
+    else:
+        self.b[k] = x + 2
@@ -494,6 +494,17 @@ EXPECTATIONS = [
             ("view_a_assign", [[123, 123], 1234], [[123, 123], 1234]),
         ),
     ),
+    (
+        "state_variable_overwrite",
+        (
+            ("set_a_augassign", [[1, 2], None], [[1, 2], None]),
+            ("a", [[], 3], [[], 3]),
+            ("set_b_in_branches", [[1, 5, True], None], [[1, 5, TRUE], None]),
+            ("b", [[1], 6], [[1], 6]),
+            ("set_b_in_branches", [[1, 5, False], None], [[1, 5, FALSE], None]),
+            ("b", [[1], 7], [[1], 7]),
+        ),
+    ),
     (
         "state_variable_uint256",
         (
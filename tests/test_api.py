@@ -0,0 +1,40 @@
+import pytest
+from vyper.exceptions import UndeclaredDefinition
+
+import vyro
+from vyro.cairo.writer import write
+from vyro.transpiler.transpile import transpile
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+
+@pytest.mark.parametrize("filename", ["ERC20", "state_variable_uint256"])
+def test_transpile_source(filename):
+    """
+    Test that transpiling from a source string matches transpiling from a file.
+    """
+    file_path = f"examples/{filename}.vy"
+    with open(file_path) as fh:
+        source = fh.read()
+
+    result = vyro.transpile_source(source, options=vyro.TranspileOptions(name=file_path))
+
+    vyper_ast = get_vyper_ast(file_path)
+    transpile(vyper_ast)
+    assert result.cairo == write(vyper_ast)
+
+    assert "Uint256" in result.import_directives["starkware.cairo.common.uint256"]
+    assert set(result.timings) == {"parse", "transpile", "write", "total"}
+    assert result.diagnostics == []
+
+
+def test_transpile_source_error():
+    """
+    Test that an invalid contract raises an exception.
+    """
+    source = """
+@external
+def foo():
+    self.bar = 1
+"""
+    with pytest.raises(UndeclaredDefinition):
+        vyro.transpile_source(source)
@@ -0,0 +1,108 @@
+import os
+import subprocess
+import sys
+
+from vyro._cli import transpile as transpile_cli
+from vyro.transpiler.transpile import PASSES
+from vyro.utils import cache as cache_module
+from vyro.utils.cache import PASS_LIST, SIZE_INDEX, TranspileCache
+
+
+def test_pass_list():
+    """
+    Test that the pass list in the key of the cache matches the transpiler passes.
+    """
+    assert PASS_LIST == ",".join(f"{k}:{v.__name__}" for k, v in PASSES.items())
+
+
+def test_get_key(tmp_path, monkeypatch):
+    cache = TranspileCache(tmp_path)
+    key = cache.get_key(b"x: uint256")
+
+    assert len(key) == 64
+    assert cache.get_key(b"x: uint256") == key
+    assert cache.get_key(b"x: int128") != key
+
+    # Keys change when the list of passes changes
+    monkeypatch.setattr(cache_module, "PASS_LIST", PASS_LIST + ",X:NewVisitor")
+    assert TranspileCache(tmp_path).get_key(b"x: uint256") != key
+
+
+def test_get_put(tmp_path):
+    cache = TranspileCache(tmp_path)
+    key = cache.get_key(b"x: uint256")
+
+    assert cache.get(key) is None
+    cache.put(key, "%lang starknet")
+    assert cache.get(key) == "%lang starknet"
+
+    # Replacing an entry does not count its previous size
+    cache.put(key, "%lang")
+    assert (tmp_path / SIZE_INDEX).read_text() == "5"
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = TranspileCache(tmp_path, max_size=25)
+    keys = [cache.get_key(bytes([i])) for i in range(3)]
+
+    cache.put(keys[0], "a" * 10)
+    cache.put(keys[1], "b" * 10)
+    os.utime(cache._get_path(keys[0]), (1000, 1000))
+    os.utime(cache._get_path(keys[1]), (2000, 2000))
+
+    # Reading an entry marks it as recently used
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[2], "c" * 10)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert (tmp_path / SIZE_INDEX).read_text() == "20"
+
+
+def test_size_index_is_rebuilt(tmp_path):
+    cache = TranspileCache(tmp_path)
+    cache.put(cache.get_key(b"a"), "a" * 10)
+    (tmp_path / SIZE_INDEX).unlink()
+
+    cache.put(cache.get_key(b"b"), "b" * 10)
+    assert (tmp_path / SIZE_INDEX).read_text() == "20"
+
+
+def test_no_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    output = tmp_path / "erc20.cairo"
+
+    argv = ["vyro", "transpile", "examples/ERC20.vy", "--output", str(output)]
+    monkeypatch.setattr(sys, "argv", [*argv, "--no-cache", "--cache-dir", str(cache_dir)])
+    transpile_cli.main()
+    assert output.exists()
+    assert not cache_dir.exists()
+
+    monkeypatch.setattr(sys, "argv", [*argv, "--cache-dir", str(cache_dir)])
+    transpile_cli.main()
+    assert len(list(cache_dir.glob("*/*.cairo"))) == 1
+
+
+def test_cache_hit_does_not_import_transpiler(tmp_path):
+    """
+    Test that a contract that is in the cache is not transpiled, and that the
+    transpiler is not imported to look it up.
+    """
+    argv = ["vyro", "transpile", "examples/ERC20.vy", "--cache-dir", str(tmp_path)]
+    code = (
+        "import sys\n"
+        f"sys.argv = {argv!r}\n"
+        "from vyro._cli.transpile import main\n"
+        "main()\n"
+        "print('vyro.transpiler.transpile' in sys.modules)\n"
+    )
+
+    results = []
+    for _ in range(2):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+        results.append(output.splitlines()[-1])
+
+    assert results == ["True", "False"]
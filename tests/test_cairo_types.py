@@ -0,0 +1,63 @@
+import pytest
+from vyper.semantics.types.indexable.mapping import MappingDefinition
+from vyper.semantics.types.value.address import AddressDefinition
+from vyper.semantics.types.value.numeric import Uint8Definition, Uint256Definition
+
+import vyro
+from vyro.cairo.types import CairoMappingDefinition, CairoUint256Definition, FeltDefinition
+from vyro.exceptions import TranspilerPanic
+from vyro.transpiler.utils import get_cairo_type
+
+
+def test_interned_types():
+    assert FeltDefinition.get_instance() is FeltDefinition.get_instance()
+    assert FeltDefinition.get_instance() is not CairoUint256Definition.get_instance()
+    assert FeltDefinition.get_instance(is_constant=True) is not FeltDefinition.get_instance()
+
+    with pytest.raises(TranspilerPanic):
+        FeltDefinition.get_instance().is_constant = True
+
+
+def test_get_cairo_type():
+    # Types are converted to the same instance for every node
+    assert get_cairo_type(Uint256Definition()) is get_cairo_type(Uint256Definition())
+    assert get_cairo_type(Uint256Definition()) is CairoUint256Definition.get_instance()
+    assert get_cairo_type(Uint8Definition()) is FeltDefinition.get_instance()
+    assert get_cairo_type(AddressDefinition(is_public=True)) is FeltDefinition.get_instance(
+        is_public=True
+    )
+
+    mapping_typ = get_cairo_type(
+        MappingDefinition(Uint256Definition(), AddressDefinition(), "HashMap")
+    )
+    assert isinstance(mapping_typ, CairoMappingDefinition)
+    assert mapping_typ.key_types == (FeltDefinition.get_instance(),)
+    assert mapping_typ.value_type is CairoUint256Definition.get_instance()
+    assert (
+        get_cairo_type(MappingDefinition(Uint256Definition(), AddressDefinition(), "HashMap"))
+        is mapping_typ
+    )
+
+
+def test_interned_types_are_bounded():
+    """
+    Test that transpiling a module again does not intern new types, e.g. for
+    mappings of structs, which are created for each module.
+    """
+    source = """
+struct Pair:
+    a: uint256
+    b: uint256
+
+p: HashMap[address, Pair]
+q: HashMap[address, HashMap[address, uint256]]
+
+@external
+def set_p(k: address, x: uint256):
+    self.p[k].a = x
+"""
+    vyro.transpile_source(source)
+    count = len(CairoMappingDefinition._instances)
+
+    vyro.transpile_source(source)
+    assert len(CairoMappingDefinition._instances) == count
@@ -0,0 +1,140 @@
+import json
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from vyro._cli import serve as serve_cli
+from vyro._cli.serve import INVALID_PARAMS, METHOD_NOT_FOUND, PARSE_ERROR
+
+CODE = (
+    "import sys\n"
+    "sys.argv = ['vyro', 'serve', '-j', '1']\n"
+    "from vyro._cli.serve import main\n"
+    "main()\n"
+)
+
+
+def _serve(requests):
+    """
+    Send lines to a server on stdin, and return its responses keyed by request id.
+    """
+    stdin = "".join(r if isinstance(r, str) else json.dumps(r) + "\n" for r in requests)
+    process = subprocess.run(
+        [sys.executable, "-c", CODE],
+        input=stdin,
+        capture_output=True,
+        check=True,
+        text=True,
+        timeout=300,
+    )
+    responses = [json.loads(i) for i in process.stdout.splitlines()]
+    return {r["id"]: r for r in responses}
+
+
+def _request(request_id, method, params=None):
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        request["params"] = params
+    return request
+
+
+def test_serve_stdio():
+    """
+    Test that requests are answered until the server is shut down, and that
+    malformed requests are answered with an error without stopping the server.
+    """
+    with open("examples/constants.vy") as f:
+        source = f.read()
+
+    responses = _serve(
+        [
+            "{not json\n",
+            _request(1, "transpile", {"source": source, "name": "constants.vy"}),
+            _request(2, "compile", {"source": source}),
+            _request(3, "transpile", {"name": "constants.vy"}),
+            # The second request is served from the function cache of the worker
+            _request(4, "transpile", {"source": source, "name": "constants.vy"}),
+            _request(5, "shutdown"),
+            # Requests after a shutdown are not read
+            _request(6, "transpile", {"source": source}),
+        ]
+    )
+
+    assert sorted(responses, key=str) == [1, 2, 3, 4, 5, None]
+
+    assert responses[None]["error"]["code"] == PARSE_ERROR
+
+    result = responses[1]["result"]
+    assert result["cairo"].startswith("%lang starknet")
+    assert result["diagnostics"] == []
+    assert "total" in result["timings"]
+
+    assert responses[2]["error"]["code"] == METHOD_NOT_FOUND
+    assert responses[3]["error"]["code"] == INVALID_PARAMS
+    assert responses[4]["result"]["cairo"] == result["cairo"]
+    assert responses[5] == {"jsonrpc": "2.0", "id": 5, "result": None}
+
+
+def test_serve_stdio_diagnostics():
+    """
+    Test that errors in a contract are returned as diagnostics in the result.
+    """
+    source = "@external\ndef foo() -> uint256:\n    return x\n"
+    responses = _serve([_request(1, "transpile", {"source": source}), _request(2, "shutdown")])
+
+    diagnostics = responses[1]["result"]["diagnostics"]
+    assert len(diagnostics) == 1
+    assert diagnostics[0]["severity"] == "error"
+
+
+@pytest.mark.parametrize("jobs", ["foo", "0"])
+def test_serve_invalid_jobs(monkeypatch, jobs):
+    monkeypatch.setattr(sys, "argv", ["vyro", "serve", "-j", jobs])
+    with pytest.raises(SystemExit) as e:
+        serve_cli.main()
+
+    assert "Expected an integer of 1 or more" in str(e.value.code)
+
+
+def test_serve_socket_not_a_socket(tmp_path, monkeypatch):
+    """
+    Test that a path that is not a socket is not replaced by the server.
+    """
+    path = tmp_path / "ERC20.vy"
+    path.write_text("x: uint256")
+
+    monkeypatch.setattr(sys, "argv", ["vyro", "serve", "--socket", str(path)])
+    with pytest.raises(SystemExit) as e:
+        serve_cli.main()
+
+    assert "is not a socket" in str(e.value.code)
+    assert path.read_text() == "x: uint256"
+
+
+def test_serve_socket(tmp_path):
+    """
+    Test that a stale socket is replaced, and that the socket is removed once the
+    server is shut down.
+    """
+    path = tmp_path / "vyro.sock"
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(str(path))
+
+    code = CODE.replace("'-j', '1'", f"'-j', '1', '--socket', {str(path)!r}")
+    process = subprocess.Popen([sys.executable, "-c", code], stderr=subprocess.PIPE, text=True)
+    try:
+        assert process.stderr.readline().strip() == f"Listening on {path}"
+
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(path))
+            client.sendall((json.dumps(_request(1, "shutdown")) + "\n").encode())
+            response = json.loads(client.makefile().readline())
+
+        assert response == {"jsonrpc": "2.0", "id": 1, "result": None}
+        assert process.wait(timeout=60) == 0
+    finally:
+        process.kill()
+
+    assert not path.exists()
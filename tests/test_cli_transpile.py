@@ -0,0 +1,114 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from vyro._cli import transpile as transpile_cli
+from vyro._cli.transpile import _expand_paths, _get_output_path
+
+
+@pytest.fixture
+def contracts(tmp_path):
+    """
+    A directory of contracts, one of which cannot be transpiled.
+    """
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+
+    shutil.copy("examples/constants.vy", src / "a.vy")
+    shutil.copy("examples/event.vy", src / "sub" / "b.vy")
+    (src / "sub" / "bad.vy").write_text("@external\ndef foo() -> uint256:\n    return x\n")
+
+    return src
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["vyro", "transpile", *args, "--no-cache"])
+    transpile_cli.main()
+
+
+def test_expand_paths(contracts):
+    a = contracts / "a.vy"
+    b = contracts / "sub" / "b.vy"
+    bad = contracts / "sub" / "bad.vy"
+
+    assert _expand_paths([str(contracts)]) == [a, b, bad]
+
+    # Contracts matched by more than one pattern are only returned once
+    paths = _expand_paths([str(b), str(contracts / "**" / "*.vy"), str(contracts), str(b)])
+    assert paths == [b, a, bad]
+
+    assert _expand_paths([str(contracts / "*.cairo")]) == []
+
+
+def test_get_output_path():
+    base = Path("/contracts")
+    path = Path("/contracts/tokens/ERC20.vy")
+
+    assert _get_output_path(path, base, "build") == Path("build/tokens/ERC20.cairo")
+    assert _get_output_path(path, path.parent, "build") == Path("build/ERC20.cairo")
+
+
+def test_batch_failure(contracts, tmp_path, monkeypatch, capsys):
+    """
+    Test that a contract that fails to transpile does not stop the other contracts
+    from being written, and that the batch exits with an error.
+    """
+    out = tmp_path / "out"
+    with pytest.raises(SystemExit) as e:
+        _run(monkeypatch, str(contracts), "--output-dir", str(out), "-j", "1")
+
+    assert e.value.code == 1
+    assert (out / "a.cairo").exists()
+    assert (out / "sub" / "b.cairo").exists()
+    assert not (out / "sub" / "bad.cairo").exists()
+
+    stdout = capsys.readouterr().out
+    assert f"FAILED  {contracts / 'sub' / 'bad.vy'}" in stdout
+    assert "Transpiled 2 of 3 contracts." in stdout
+
+
+def test_batch_jobs(contracts, tmp_path, monkeypatch):
+    """
+    Test that contracts transpiled in a process pool give the same output as
+    contracts transpiled one at a time.
+    """
+    (contracts / "sub" / "bad.vy").unlink()
+
+    outputs = []
+    for jobs in ("1", "2"):
+        out = tmp_path / f"out_{jobs}"
+        _run(monkeypatch, str(contracts), "--output-dir", str(out), "-j", jobs)
+        outputs.append({p.relative_to(out): p.read_text() for p in out.rglob("*.cairo")})
+
+    assert sorted(outputs[0]) == [Path("a.cairo"), Path("sub/b.cairo")]
+    assert outputs[0] == outputs[1]
+
+
+def test_single_contract_output_dir(contracts, tmp_path, monkeypatch):
+    """
+    Test that a single contract is written to the top of the output directory, as
+    paths are mirrored relative to the directory of the contract.
+    """
+    out = tmp_path / "out"
+    _run(monkeypatch, str(contracts / "sub" / "b.vy"), "--output-dir", str(out))
+
+    assert [p.relative_to(out) for p in out.rglob("*.cairo")] == [Path("b.cairo")]
+
+
+@pytest.mark.parametrize("jobs", ["foo", "0", "-2"])
+def test_invalid_jobs(contracts, monkeypatch, jobs):
+    with pytest.raises(SystemExit) as e:
+        _run(monkeypatch, str(contracts), "-j", jobs)
+
+    assert "Expected an integer of 1 or more" in str(e.value.code)
+
+
+def test_tree_diff_invalid_function(contracts, tmp_path, monkeypatch):
+    args = ["--tree-diff-dir", str(tmp_path / "diffs"), "--tree-diff-function", "fooo"]
+    with pytest.raises(SystemExit) as e:
+        _run(monkeypatch, str(contracts / "a.vy"), *args)
+
+    assert e.value.code == "Invalid function - 'fooo' does not exist"
+    assert not (tmp_path / "diffs").exists()
@@ -0,0 +1,49 @@
+from vyper import ast as vy_ast
+from vyper.utils import checksum_encode
+
+import vyro
+from vyro.transpiler.passes import constant_handler
+from vyro.transpiler.transpile import transpile
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+ADDRESSES = [checksum_encode(f"0x{i:040x}") for i in range(1, 11)]
+
+
+def _get_source(count: int) -> str:
+    lines = ["@external", "def foo() -> bool:"]
+    for i in range(count):
+        lines.append(f"    a{i}: bool = {i % 2 == 0}")
+        lines.append(f"    b{i}: address = {ADDRESSES[i % len(ADDRESSES)]}")
+    lines.append("    return a0")
+    return "\n".join(lines) + "\n"
+
+
+def test_many_literals(monkeypatch):
+    """
+    Test that thousands of literals are each converted, and that each distinct value
+    is only converted once.
+    """
+    calls = []
+
+    def hex_to_int(value):
+        calls.append(value)
+        return int(value, 16)
+
+    monkeypatch.setattr(constant_handler, "hex_to_int", hex_to_int)
+
+    count = 2000
+    vyper_ast = get_vyper_ast_from_source(_get_source(count), "literals.vy")
+    transpile(vyper_ast)
+
+    assert not vyper_ast.get_descendants((vy_ast.Hex, vy_ast.NameConstant))
+    assert sorted(calls) == ADDRESSES
+
+    fn_node = vyper_ast.get_children(vy_ast.FunctionDef)[0]
+    names = [n.id for n in fn_node.get_descendants(vy_ast.Name) if n.id in ("TRUE", "FALSE")]
+    assert names.count("TRUE") == names.count("FALSE") == count // 2
+
+
+def test_literals_output():
+    result = vyro.transpile_source(_get_source(4))
+    assert " : felt = 2;" in result.cairo
+    assert " : felt = FALSE;" in result.cairo
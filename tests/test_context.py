@@ -0,0 +1,53 @@
+import threading
+
+from vyro.transpiler.context import ASTContext, NodeIdAllocator
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+
+def _get_node_ids(d: dict):
+    for k, v in d.items():
+        if k == "node_id":
+            yield v
+        elif isinstance(v, dict):
+            yield from _get_node_ids(v)
+        elif isinstance(v, list):
+            for i in v:
+                if isinstance(i, dict):
+                    yield from _get_node_ids(i)
+
+
+def test_get_context_last_id():
+    """
+    Test that the context starts from the largest node ID in the AST.
+    """
+    vyper_ast = get_vyper_ast("examples/ERC20.vy")
+    ctx = ASTContext.get_context(vyper_ast)
+
+    assert ctx.last_id == max(_get_node_ids(vyper_ast.to_dict()))
+    assert ctx.reserve_id() == ctx.last_id
+
+
+def test_shared_allocator():
+    """
+    Test that a shared allocator reserves unique IDs across contexts and threads.
+    """
+    allocator = NodeIdAllocator()
+    contexts = [
+        ASTContext.get_context(get_vyper_ast(f"examples/{i}.vy"), allocator)
+        for i in ("ERC20", "struct")
+    ]
+    start = allocator.last_id
+
+    reserved = []
+
+    def reserve(ctx):
+        ids = [ctx.reserve_id() for _ in range(1000)]
+        reserved.extend(ids)
+
+    threads = [threading.Thread(target=reserve, args=(c,)) for c in contexts * 4]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(reserved) == list(range(start + 1, start + 8001))
@@ -0,0 +1,51 @@
+import vyro
+
+SOURCE = """
+enum Roles:
+    ADMIN
+    STAFF
+    USER
+
+r: Roles
+
+@external
+def set_r(x: Roles):
+    self.r = Roles.USER
+
+@external
+@view
+def is_staff(x: Roles) -> bool:
+    return x in (Roles.ADMIN | Roles.STAFF)
+"""
+
+
+def test_enum_constants():
+    """
+    Test that enum members are declared once as module-level constants.
+    """
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    for name, value in (("ADMIN", 1), ("STAFF", 2), ("USER", 4)):
+        assert cairo.count(f"const Roles_{name} = {value};") == 1
+
+    assert "bitwise_or(Roles_ADMIN, Roles_STAFF)" in cairo
+    assert "r_STORAGE.write(Roles_USER);" in cairo
+
+
+def test_enum_256_constants():
+    members = "\n".join(f"    M{i}" for i in range(256))
+    source = f"""
+enum Roles:
+{members}
+
+@external
+@view
+def is_last(x: Roles) -> bool:
+    return x == Roles.M255
+"""
+    cairo = vyro.transpile_source(source).cairo
+
+    assert "const Roles_M0_LOW = 1;" in cairo
+    assert "const Roles_M0_HIGH = 0;" in cairo
+    assert f"const Roles_M255_HIGH = {2**127};" in cairo
+    assert "Uint256(low=Roles_M255_LOW, high=Roles_M255_HIGH)" in cairo
@@ -0,0 +1,34 @@
+import pytest
+
+from vyro.transpiler import features
+from vyro.transpiler.features import scan_features
+from vyro.transpiler.transpile import PASSES, get_passes
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+
+@pytest.mark.parametrize(
+    "contract,expected",
+    [
+        ("ERC20", {features.ASSERT, features.CONSTRUCTOR, features.EVENT, features.MSG_SENDER}),
+        ("block_number", {features.BLOCK_CONSTANT}),
+        ("enum", {features.ENUM}),
+        ("if", {features.IF}),
+        ("static_nested_array", {features.STATIC_ARRAY}),
+        ("state_variable_mapping", set()),
+    ],
+)
+def test_scan_features(contract, expected):
+    vyper_ast = get_vyper_ast(f"examples/{contract}.vy")
+    assert scan_features(vyper_ast) == expected
+
+
+def test_get_passes():
+    """
+    Test that passes are skipped when none of their triggers are present.
+    """
+    passes = get_passes(frozenset({features.ENUM}))
+    assert "EC" in passes
+    assert "SA" not in passes and "Ev" not in passes
+
+    # Passes without triggers are always run
+    assert all(k in passes for k, v in PASSES.items() if v.TRIGGERS is None)
@@ -0,0 +1,65 @@
+import re
+
+from vyro.api import TranspileOptions, transpile_source
+from vyro.transpiler.function_cache import FunctionCache, get_function_keys
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+SOURCE = """
+a: uint256
+b: public(uint256)
+
+@external
+def get_a() -> uint256:
+    return self.a
+
+@external
+def set_b(x: uint256):
+    self.b = x + 1
+"""
+
+
+def _normalise(cairo: str) -> list:
+    # Temporary names and the order of imports depend on which functions are cached
+    cairo = re.sub(r"VYRO_VAR_\d+", "VYRO_VAR", cairo)
+    return sorted(", ".join(sorted(line.split(", "))) for line in cairo.splitlines())
+
+
+def _get_keys(source: str) -> dict:
+    vyper_ast = get_vyper_ast_from_source(source)
+    return {fn.name: key for fn, key in get_function_keys(vyper_ast).items()}
+
+
+def test_function_keys():
+    """
+    Test that the key of a function only changes if the function or a declaration
+    that it references changes.
+    """
+    keys = _get_keys(SOURCE)
+
+    changed = _get_keys(SOURCE.replace("x + 1", "x + 2"))
+    assert changed["get_a"] == keys["get_a"]
+    assert changed["set_b"] != keys["set_b"]
+
+    changed = _get_keys(SOURCE.replace("b: public(uint256)", "b: uint256"))
+    assert changed["get_a"] == keys["get_a"]
+    assert changed["set_b"] != keys["set_b"]
+
+
+def test_cached_output():
+    """
+    Test that stitching cached functions gives the same output as transpiling the
+    whole contract.
+    """
+    for contract in ("ERC20", "assert_int128", "immutable", "static_array"):
+        with open(f"examples/{contract}.vy") as fh:
+            source = fh.read()
+
+        expected = transpile_source(source).cairo
+
+        cache = FunctionCache()
+        options = TranspileOptions(function_cache=cache)
+        assert transpile_source(source, options=options).cairo == expected
+        assert len(cache) > 0
+
+        cached = transpile_source(source, options=options).cairo
+        assert _normalise(cached) == _normalise(expected)
@@ -0,0 +1,65 @@
+import pytest
+from vyper import ast as vy_ast
+
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.node_index import NodeIndex
+from vyro.transpiler.transpile import PASSES
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+CONTRACTS = ["ERC20", "constants", "enum", "msg_sender_duplicate", "struct"]
+
+
+def _check_index(index: NodeIndex, ast: vy_ast.Module):
+    nodes = ast.get_descendants()
+
+    for typ in {type(n) for n in nodes}:
+        expected = ast.get_descendants(typ)
+        assert sorted(map(id, index.get_descendants(ast, typ))) == sorted(map(id, expected))
+
+    for name in {n.id for n in nodes if isinstance(n, vy_ast.Name)}:
+        expected = ast.get_descendants(vy_ast.Name, {"id": name})
+        result = index.get_descendants(ast, vy_ast.Name, {"id": name})
+        assert sorted(map(id, result)) == sorted(map(id, expected))
+
+    for fn in ast.get_children(vy_ast.FunctionDef):
+        expected = fn.get_descendants(vy_ast.Name)
+        result = index.get_descendants(fn, vy_ast.Name)
+        assert sorted(map(id, result)) == sorted(map(id, expected))
+
+
+@pytest.mark.parametrize("contract", CONTRACTS)
+def test_node_index(contract):
+    """
+    Test that the node index returns the same nodes as `get_descendants` after
+    each transpiler pass.
+    """
+    vyper_ast = get_vyper_ast(f"examples/{contract}.vy")
+    context = ASTContext.get_context(vyper_ast)
+    index = NodeIndex.attach(vyper_ast)
+    _check_index(index, vyper_ast)
+
+    for visitor in PASSES.values():
+        visitor().visit(vyper_ast, vyper_ast, context)
+        _check_index(index, vyper_ast)
+
+
+def test_search_within_function():
+    """
+    Test that a search within a function only checks the nodes of that function,
+    and that removed nodes are dropped from the index once they are found.
+    """
+    vyper_ast = get_vyper_ast("examples/ERC20.vy")
+    index = NodeIndex.attach(vyper_ast)
+    fn = vyper_ast.get_children(vy_ast.FunctionDef)[0]
+
+    candidates = index._get_candidates(vy_ast.Name, None, index._tops[id(fn)])
+    assert sorted(map(id, candidates)) == sorted(map(id, fn.get_descendants(vy_ast.Name)))
+
+    stmt = fn.body.pop()
+    fn._children.remove(stmt)
+    removed = [stmt, *stmt.get_descendants()]
+
+    assert index.get_descendants(fn) == fn.get_descendants()
+    for n in removed:
+        assert id(n) not in index._tops
+        assert id(n) not in index._parents
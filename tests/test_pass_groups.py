@@ -0,0 +1,81 @@
+from vyper import ast as vy_ast
+
+from vyro.cairo.writer import write
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.transpile import PASSES, get_pass_groups, transpile
+from vyro.transpiler.visitor import BaseVisitor
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+
+class _Fusable(BaseVisitor):
+    NODE_TYPES = (vy_ast.arg,)
+
+
+class _DependentFusable(BaseVisitor):
+    NODE_TYPES = (vy_ast.Name,)
+    RUNS_AFTER = ("A",)
+
+
+def test_get_pass_groups():
+    """
+    Test that fusable passes are moved back to the nearest group of fusable passes,
+    unless they must run after one of the passes in between or in that group.
+    """
+    passes = {"A": _Fusable, "B": _Fusable, "C": BaseVisitor, "D": _Fusable, "E": _Fusable}
+    assert get_pass_groups(passes) == [["A", "B", "D", "E"], ["C"]]
+
+    passes = {"A": _Fusable, "B": _DependentFusable, "C": _Fusable}
+    assert get_pass_groups(passes) == [["A"], ["B", "C"]]
+
+    passes = {"A": BaseVisitor, "B": _Fusable, "C": BaseVisitor, "D": _DependentFusable}
+    assert get_pass_groups(passes) == [["A"], ["B", "D"], ["C"]]
+
+    passes = {"B": _Fusable, "A": BaseVisitor, "D": _DependentFusable}
+    assert get_pass_groups(passes) == [["B"], ["A"], ["D"]]
+
+
+def test_pass_groups_are_fused():
+    """
+    Test that the passes of the transpiler are fused into fewer traversals.
+    """
+    groups = get_pass_groups(PASSES)
+    assert len(groups) == 15
+    assert ["SC", "IfH", "Ev"] in groups
+    assert ["Ah", "If", "Rv", "Ar"] in groups
+    assert ["Sw", "Tf", "CI"] in groups
+
+
+def test_runs_after_order():
+    """
+    Test that the passes that a pass runs after come before it in `PASSES`, and
+    in an earlier group once passes are fused.
+    """
+    keys = list(PASSES)
+    for idx, (k, v) in enumerate(PASSES.items()):
+        assert all(keys.index(i) < idx for i in v.RUNS_AFTER), k
+
+    groups = get_pass_groups(PASSES)
+    for idx, group in enumerate(groups):
+        earlier = {k for g in groups[:idx] for k in g}
+        for k in group:
+            assert earlier.issuperset(PASSES[k].RUNS_AFTER), k
+
+
+def test_fused_passes_output():
+    """
+    Test that running fused passes in a single traversal gives the same output as
+    running each pass separately in the same order.
+    """
+    keys = [k for g in get_pass_groups(PASSES) for k in g]
+    for contract in ("ERC20", "event", "struct", "if_nested", "internal_fns"):
+        path = f"examples/{contract}.vy"
+
+        fused_ast = get_vyper_ast(path)
+        transpile(fused_ast)
+
+        separate_ast = get_vyper_ast(path)
+        context = ASTContext.get_context(separate_ast)
+        for k in keys:
+            PASSES[k]().visit(separate_ast, separate_ast, context)
+
+        assert write(fused_ast) == write(separate_ast)
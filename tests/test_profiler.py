@@ -0,0 +1,92 @@
+import json
+
+from vyro.transpiler.context import ASTContext, NodeIdAllocator
+from vyro.transpiler.features import scan_features
+from vyro.transpiler.passes import ArgsConverterVisitor, CairoImporterVisitor, InitialisationVisitor
+from vyro.transpiler.profiler import PassProfiler
+from vyro.transpiler.transpile import get_pass_groups, get_passes, transpile
+from vyro.transpiler.traversal import IterativeVisitor
+from vyro.transpiler.visitor import BaseVisitor, CompositeVisitor
+from vyro.vyper.vyper_compile import get_vyper_ast
+
+CONTRACT = "examples/ERC20.vy"
+
+
+class _IterativeVisitor(IterativeVisitor):
+    pass
+
+
+def _count_visits(visitor: BaseVisitor) -> int:
+    ast = get_vyper_ast(CONTRACT)
+    context = ASTContext.get_context(ast)
+    InitialisationVisitor().visit(ast, ast, context)
+
+    profiler = PassProfiler(trace_memory=False)
+    with profiler.profile("T", visitor, context):
+        visitor.visit(ast, ast, context)
+
+    assert visitor.visit_hook is None
+    return profiler.records[0]["visits"]
+
+
+def test_profile_visits():
+    """
+    Test that every node is counted once, whether a pass recurses through `visit`,
+    walks the tree with an explicit stack or is fused with other passes.
+    """
+    count = _count_visits(BaseVisitor())
+    assert count > 0
+
+    assert _count_visits(_IterativeVisitor()) == count
+    assert _count_visits(CairoImporterVisitor()) == count
+    assert (
+        _count_visits(CompositeVisitor([ArgsConverterVisitor(), CairoImporterVisitor()])) == count
+    )
+
+
+def test_profile_report():
+    ast = get_vyper_ast(CONTRACT)
+    # Passes are profiled separately, in the order that they run when fused
+    passes = [k for g in get_pass_groups(get_passes(scan_features(ast))) for k in g]
+
+    profiler = PassProfiler(trace_memory=False)
+    transpile(ast, profiler=profiler)
+
+    records = json.loads(profiler.report("json"))
+    assert [r["pass"] for r in records] == passes
+    for r in records:
+        assert r["visits"] > 0
+        assert set(r) == {"pass", "name", "visits", "wall", "cpu", "nodes_created"}
+
+    table = profiler.report("table").splitlines()
+    assert table[0].split()[:2] == ["pass", "name"]
+    # A row for each pass, and a row for the totals
+    assert len(table) == len(passes) + 4
+    assert table[-1].split()[0] == "Total"
+    assert int(table[-1].split()[3]) == sum(r["visits"] for r in records)
+
+
+class _SharedAllocator(NodeIdAllocator):
+    """
+    An allocator that another transpile reserves an ID from after every ID it
+    reserves for this one.
+    """
+
+    def reserve(self) -> int:
+        node_id = super().reserve()
+        super().reserve()
+        return node_id
+
+
+def test_profile_nodes_created_shared_allocator():
+    """
+    Test that IDs reserved by other transpiles sharing an allocator are not counted.
+    """
+    records = []
+    for allocator in (None, _SharedAllocator()):
+        profiler = PassProfiler(trace_memory=False)
+        transpile(get_vyper_ast(CONTRACT), allocator=allocator, profiler=profiler)
+        records.append([r["nodes_created"] for r in profiler.records])
+
+    assert sum(records[0]) > 0
+    assert records[0] == records[1]
@@ -0,0 +1,88 @@
+from vyper import ast as vy_ast
+
+from vyro.transpiler.utils import get_scope, get_stmt_node, insert_statement_before
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+SOURCE = """
+@external
+def foo(x: uint256) -> uint256:
+    a: uint256 = x
+    if x > 1:
+        a = a + 1
+        if x > 2:
+            a = a + 2
+    else:
+        a = a - 1
+    return a
+"""
+
+
+def _get_function():
+    ast = get_vyper_ast_from_source(SOURCE, "scope.vy")
+    return ast.get_children(vy_ast.FunctionDef)[0]
+
+
+def test_get_scope():
+    fn_node = _get_function()
+    outer_if = fn_node.body[1]
+    inner_if = outer_if.body[1]
+
+    # Statement in the body of the function
+    ann_assign = fn_node.body[0]
+    assert get_scope(ann_assign.value) == (fn_node, fn_node.body)
+    assert get_stmt_node(ann_assign.value) is ann_assign
+
+    # Statements in the body and `orelse` of an `If` node
+    add = outer_if.body[0].value
+    assert get_scope(add)[0] is outer_if and get_scope(add)[1] is outer_if.body
+    assert get_stmt_node(add) is outer_if.body[0]
+
+    sub = outer_if.orelse[0].value
+    assert get_scope(sub)[0] is outer_if and get_scope(sub)[1] is outer_if.orelse
+
+    nested = inner_if.body[0].value.right
+    assert get_scope(nested)[0] is inner_if
+
+    # Nodes in the test of an `If` node are in the scope of the `If` node
+    assert get_scope(inner_if.test.left)[0] is outer_if
+    assert get_scope(outer_if.test)[0] is fn_node
+
+
+def test_get_scope_after_mutation():
+    """
+    Test that scopes reflect the tree after it has been mutated.
+    """
+    fn_node = _get_function()
+    outer_if = fn_node.body[1]
+    add = outer_if.body[0].value
+
+    assert get_stmt_node(add) is outer_if.body[0]
+
+    # Move the statement out of the `If` node
+    stmt = outer_if.body.pop(0)
+    outer_if._children.remove(stmt)
+    insert_statement_before(stmt, outer_if, fn_node, fn_node.body)
+
+    assert get_scope(add) == (fn_node, fn_node.body)
+    assert get_stmt_node(add) is stmt
+
+
+def test_get_scope_after_direct_mutation():
+    """
+    Test that scopes reflect the tree after a pass edits `body` and `_parent`
+    directly, without the helpers in `vyro.transpiler.utils`.
+    """
+    fn_node = _get_function()
+    outer_if = fn_node.body[1]
+    stmt = outer_if.body[0]
+    add = stmt.value
+
+    assert get_scope(add) == (outer_if, outer_if.body)
+
+    outer_if.body.remove(stmt)
+    outer_if._children.remove(stmt)
+    fn_node.body.insert(0, stmt)
+    fn_node._children.add(stmt)
+    stmt._parent = fn_node
+
+    assert get_scope(add) == (fn_node, fn_node.body)
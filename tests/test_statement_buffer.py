@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from vyper import ast as vy_ast
+
+from vyro.transpiler.statement_buffer import StatementEditBuffer, get_statement_buffer
+from vyro.transpiler.utils import (
+    get_scope,
+    insert_statement_after,
+    insert_statement_before,
+    replace_in_tree,
+)
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+SOURCE = """
+@external
+def foo(x: uint256) -> uint256:
+    a: uint256 = x
+    if x > 1:
+        a = a + 1
+    return a
+"""
+
+
+def _get_function():
+    ast = get_vyper_ast_from_source(SOURCE, "buffer.vy")
+    return ast, ast.get_children(vy_ast.FunctionDef)[0]
+
+
+def _create_pass(node_id: int) -> vy_ast.Pass:
+    return vy_ast.Pass(node_id=node_id, ast_type="Pass")
+
+
+def _insert_random(fn_node: vy_ast.FunctionDef, seed: int):
+    rng = random.Random(seed)
+    anchors = list(fn_node.body)
+    for i in range(50):
+        node = _create_pass(10_000 + i)
+        anchor = rng.choice(anchors)
+        if rng.random() < 0.5:
+            insert_statement_before(node, anchor, fn_node, fn_node.body)
+        else:
+            insert_statement_after(node, anchor, fn_node, fn_node.body)
+        anchors.append(node)
+
+
+def test_buffered_insertions_match_immediate_insertions():
+    """
+    Test that insertions relative to statements and to inserted statements result in
+    the same order of statements whether they are buffered or not.
+    """
+    for seed in range(10):
+        _, fn_node = _get_function()
+        _insert_random(fn_node, seed)
+        expected = [i.node_id for i in fn_node.body]
+
+        _, fn_node = _get_function()
+        with StatementEditBuffer.activate():
+            _insert_random(fn_node, seed)
+            assert len(fn_node.body) == 3
+
+        assert get_statement_buffer() is None
+        assert [i.node_id for i in fn_node.body] == expected
+
+
+def test_buffered_insertions_scope_and_replacement():
+    ast, fn_node = _get_function()
+    if_node = fn_node.body[1]
+    stmt = if_node.body[0]
+
+    with StatementEditBuffer.activate():
+        node = _create_pass(10_000)
+        insert_statement_before(node, stmt, if_node, if_node.body)
+
+        # Statements are in the scope of the list they are pending insertion into
+        assert get_scope(node) == (if_node, if_node.body)
+
+        # Statements inserted around a statement are kept when it is replaced
+        new_stmt = _create_pass(10_001)
+        replace_in_tree(ast, stmt, new_stmt)
+        insert_statement_after(_create_pass(10_002), new_stmt, if_node, if_node.body)
+
+        # The replaced statement is no longer an anchor
+        with pytest.raises(ValueError):
+            insert_statement_after(_create_pass(10_003), stmt, if_node, if_node.body)
+
+    assert [i.node_id for i in if_node.body] == [10_000, 10_001, 10_002]
@@ -0,0 +1,52 @@
+import vyro
+
+SOURCE = """
+x: uint256
+y: HashMap[address, uint256]
+
+@external
+def read_twice() -> uint256:
+    return self.x + self.x
+
+@external
+def read_after_write(a: uint256) -> uint256:
+    b: uint256 = self.x
+    self.x = a
+    return b + self.x
+
+@external
+def read_key_twice(a: address) -> uint256:
+    return self.y[a] + self.y[a]
+
+@internal
+def _set_x():
+    self.x = 1
+
+@external
+def read_after_call() -> uint256:
+    b: uint256 = self.x
+    self._set_x()
+    return b + self.x
+"""
+
+
+def _get_function(cairo: str, name: str) -> str:
+    return cairo.split(f"func {name}{{", 1)[1].split("\n}", 1)[0]
+
+
+def test_storage_read_elimination():
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    # Repeated reads of the same variable and keys are read once
+    assert _get_function(cairo, "read_twice").count("x_STORAGE.read(") == 1
+    assert _get_function(cairo, "read_key_twice").count("y_STORAGE.read(") == 1
+
+    # A read after a write uses the written value
+    assert _get_function(cairo, "read_after_write").count("x_STORAGE.read(") == 1
+
+
+def test_storage_read_elimination_call():
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    # A call to a function that could write to storage requires another read
+    assert _get_function(cairo, "read_after_call").count("x_STORAGE.read(") == 2
@@ -0,0 +1,72 @@
+import vyro
+
+SOURCE = """
+x: uint256
+y: HashMap[address, uint256]
+
+@external
+def write_twice(a: uint256, b: uint256):
+    self.x = a
+    self.x += b
+
+@external
+def write_key_twice(k: address, a: uint256):
+    self.y[k] = a
+    self.y[k] = a + 1
+
+@external
+def write_in_branches(a: uint256, c: bool):
+    self.x = a
+    if c:
+        self.x = 1
+    else:
+        self.x = 2
+
+@external
+def write_in_one_branch(a: uint256, c: bool):
+    self.x = a
+    if c:
+        self.x = 1
+
+@internal
+def _get_x() -> uint256:
+    return self.x
+
+@external
+def write_before_call(a: uint256) -> uint256:
+    self.x = a
+    b: uint256 = self._get_x()
+    self.x = b
+    return b
+
+@external
+def write_before_return(a: uint256, c: bool) -> uint256:
+    self.x = a
+    if c:
+        return a
+    self.x = 1
+    return 1
+"""
+
+
+def _get_function(cairo: str, name: str) -> str:
+    return cairo.split(f"func {name}{{", 1)[1].split("\n}", 1)[0]
+
+
+def test_storage_write_elimination():
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    # Writes that are overwritten on every path are removed
+    assert _get_function(cairo, "write_twice").count("x_STORAGE.write(") == 1
+    assert _get_function(cairo, "write_key_twice").count("y_STORAGE.write(") == 1
+    assert _get_function(cairo, "write_in_branches").count("x_STORAGE.write(") == 2
+
+
+def test_storage_write_elimination_observed():
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    # Writes that are not overwritten on every path, or that can be observed by a
+    # call or a return, are kept
+    assert _get_function(cairo, "write_in_one_branch").count("x_STORAGE.write(") == 2
+    assert _get_function(cairo, "write_before_call").count("x_STORAGE.write(") == 2
+    assert _get_function(cairo, "write_before_return").count("x_STORAGE.write(") == 2
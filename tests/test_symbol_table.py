@@ -0,0 +1,174 @@
+import pytest
+from vyper import ast as vy_ast
+
+from vyro.exceptions import TranspilerPanic
+from vyro.transpiler.node_index import NodeIndex
+from vyro.transpiler.symbol_table import (
+    ARGUMENT,
+    CONSTANT,
+    ENUM,
+    EVENT,
+    FUNCTION,
+    IMMUTABLE,
+    LOCAL,
+    STORAGE,
+    STRUCT,
+    Symbol,
+    get_symbol_table,
+)
+from vyro.transpiler.transpile import transpile
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+SOURCE = """
+enum Roles:
+    ADMIN
+
+struct Point:
+    x: uint256
+
+event Transfer:
+    value: uint256
+
+LIMIT: constant(uint256) = 10
+OWNER: immutable(address)
+total: uint256
+
+@external
+def __init__():
+    OWNER = msg.sender
+
+@external
+def foo(x: uint256) -> uint256:
+    a: uint256 = x + self.total
+    for i in range(3):
+        a += i
+    self.total = a
+    return a + self._bar()
+
+@internal
+def _bar() -> uint256:
+    return self.total
+"""
+
+
+def _get_module():
+    ast = get_vyper_ast_from_source(SOURCE, "symbols.vy")
+    NodeIndex.attach(ast)
+    return ast
+
+
+def test_declarations():
+    ast = _get_module()
+    table = get_symbol_table(ast)
+    foo = ast.get_children(vy_ast.FunctionDef, {"name": "foo"})[0]
+
+    kinds = {
+        "Roles": ENUM,
+        "Point": STRUCT,
+        "Transfer": EVENT,
+        "LIMIT": CONSTANT,
+        "OWNER": IMMUTABLE,
+        "total": STORAGE,
+        "foo": FUNCTION,
+        "_bar": FUNCTION,
+    }
+    for name, kind in kinds.items():
+        assert table.get(name).kind == kind
+
+    assert table.get("x", foo).kind == ARGUMENT
+    assert table.get("a", foo).kind == LOCAL
+    assert table.get("i", foo).kind == LOCAL
+    assert table.get("a") is None
+    assert table.get("total", foo).kind == STORAGE
+
+    assert [i.name for i in table.get_symbols(FUNCTION)] == ["__init__", "foo", "_bar"]
+    assert get_symbol_table(foo) is table
+
+
+def test_references():
+    ast = _get_module()
+    table = get_symbol_table(ast)
+    foo = ast.get_children(vy_ast.FunctionDef, {"name": "foo"})[0]
+
+    total_refs = table.get_references(table.get("total"))
+    assert len(total_refs) == 3
+    assert all(isinstance(i, vy_ast.Attribute) for i in total_refs)
+
+    assert len(table.get_references(table.get("_bar"))) == 1
+
+    owner_refs = table.get_references(table.get("OWNER"))
+    assert len(owner_refs) == 1
+    assert owner_refs[0].get_ancestor(vy_ast.FunctionDef).name == "__init__"
+
+    # The declaration of a local variable is not a reference
+    a_refs = table.get_references(table.get("a", foo))
+    assert len(a_refs) == 3
+    assert all(i.get_ancestor(vy_ast.FunctionDef) is foo for i in a_refs)
+
+    # References that are removed from the module are no longer returned
+    ret = foo.body[-1]
+    foo.body.remove(ret)
+    foo._children.remove(ret)
+    assert len(table.get_references(table.get("a", foo))) == 2
+
+
+def test_updated_by_passes():
+    """
+    Test that the declarations that passes rename, add or remove are updated in the
+    symbol table.
+    """
+    source = """
+enum Roles:
+    ADMIN
+
+OWNER: immutable(address)
+
+@external
+def __init__():
+    OWNER = msg.sender
+
+@external
+def baz() -> uint256:
+    arr: uint256[2] = [1, 2]
+    return arr[0]
+
+@external
+def is_admin(role: Roles) -> bool:
+    return role == Roles.ADMIN
+"""
+    ast = get_vyper_ast_from_source(source, "symbols.vy")
+    transpile(ast)
+    table = get_symbol_table(ast)
+    baz = ast.get_children(vy_ast.FunctionDef, {"name": "baz"})[0]
+
+    assert table.get("__init__") is None
+    constructor = table.get("constructor")
+    assert constructor.kind == FUNCTION
+    assert constructor.node.name == "constructor"
+    assert [i.name for i in table.get_symbols(FUNCTION)] == ["constructor", "baz", "is_admin"]
+
+    assert table.get("arr", baz) is None
+    array = table.get("baz_arr_MEM")
+    assert array.kind == STORAGE
+    assert array.node in ast.body
+
+    assert table.get("Roles_ADMIN").kind == CONSTANT
+
+
+def test_update_errors():
+    ast = _get_module()
+    table = get_symbol_table(ast)
+    total = table.get("total")
+
+    with pytest.raises(TranspilerPanic):
+        table.declare(Symbol("total", STORAGE, total.node))
+    with pytest.raises(TranspilerPanic):
+        table.rename(total, "LIMIT")
+
+    renamed = table.rename(total, "supply")
+    with pytest.raises(TranspilerPanic):
+        table.remove(total)
+
+    table.remove(renamed)
+    assert table.get("supply") is None
+    assert table.get("total") is None
@@ -0,0 +1,40 @@
+import vyro
+
+SOURCE = """
+x: uint256
+
+@external
+def foo(a: uint256, b: uint256) -> bool:
+    c: uint256 = a
+    e: uint256 = b
+    e = e + 1
+    self.x = e
+    assert c > 0
+    return True
+"""
+
+
+def test_temp_forwarding():
+    cairo = vyro.transpile_source(SOURCE).cairo
+
+    # Copies of arguments and literals are forwarded
+    assert "tempvar c : Uint256 = a;" in cairo
+    assert "return (TRUE,);" in cairo
+
+    # A variable that is reassigned is not forwarded
+    assert "x_STORAGE.write(e);" not in cairo
+
+
+def test_temp_forwarding_reduces_temporaries():
+    with open("examples/ERC20.vy") as fh:
+        source = fh.read()
+
+    cairo = vyro.transpile_source(source).cairo
+    assert "let VYRO_VAR_" in cairo
+
+    # No temporary is a copy of another name
+    for line in cairo.splitlines():
+        line = line.strip()
+        if line.startswith("let VYRO_VAR_"):
+            value = line.split(" = ", 1)[1].rstrip(";")
+            assert not value.isidentifier() and not value.lstrip("-").isdigit(), line
@@ -0,0 +1,81 @@
+import sys
+
+import pytest
+from vyper import ast as vy_ast
+
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.passes import InitialisationVisitor, OpsConverterVisitor
+from vyro.transpiler.traversal import IterativeVisitor
+from vyro.transpiler.visitor import BaseVisitor
+from vyro.vyper.vyper_compile import get_vyper_ast, get_vyper_ast_from_source
+
+CONTRACTS = ["ERC20", "if", "enum", "static_nested_array", "struct"]
+
+
+class RecordingVisitor(BaseVisitor):
+    def __init__(self):
+        self.visited = []
+
+    def visit(self, node, ast, context):
+        self.visited.append(id(node))
+        super().visit(node, ast, context)
+
+
+def _record(self, node, ast, context):
+    self.visited.append(id(node))
+
+
+# Iterative visitor with a pre-order hook for every node class supported by `BaseVisitor`
+RecordingIterativeVisitor = type(
+    "RecordingIterativeVisitor",
+    (IterativeVisitor,),
+    {
+        "__init__": RecordingVisitor.__init__,
+        **{
+            f"enter_{name[len('visit_'):]}": _record
+            for name in dir(BaseVisitor)
+            if name.startswith("visit_") and name != "visit_node"
+        },
+    },
+)
+
+
+@pytest.mark.parametrize("contract", CONTRACTS)
+def test_iterative_visitor_order(contract):
+    """
+    Test that `IterativeVisitor` visits nodes in the same order as `BaseVisitor`.
+    """
+    vyper_ast = get_vyper_ast(f"examples/{contract}.vy")
+
+    recursive = RecordingVisitor()
+    recursive.visit(vyper_ast, vyper_ast, None)
+
+    iterative = RecordingIterativeVisitor()
+    iterative.visit(vyper_ast, vyper_ast, None)
+
+    assert iterative.visited == recursive.visited
+
+
+def test_deep_expression():
+    """
+    Test that operations nested deeper than the recursion limit are converted.
+    """
+    depth = sys.getrecursionlimit()
+    expr = " / ".join(["x"] * (depth + 1))
+    source = f"@external\ndef foo(x: uint256) -> uint256:\n    return {expr}\n"
+
+    # The Vyper front end is recursive
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(limit * 20)
+    try:
+        vyper_ast = get_vyper_ast_from_source(source, "deep.vy")
+        context = ASTContext.get_context(vyper_ast)
+        InitialisationVisitor().visit(vyper_ast, vyper_ast, context)
+    finally:
+        sys.setrecursionlimit(limit)
+
+    OpsConverterVisitor().visit(vyper_ast, vyper_ast, context)
+
+    fn_node = vyper_ast.get_children(vy_ast.FunctionDef)[0]
+    assert len(fn_node.body) == depth + 1
+    assert not any(isinstance(i.value, vy_ast.BinOp) for i in fn_node.body)
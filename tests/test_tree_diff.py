@@ -0,0 +1,85 @@
+import pytest
+from vyper import ast as vy_ast
+
+from vyro.transpiler.features import scan_features
+from vyro.transpiler.node_index import NodeIndex
+from vyro.transpiler.transpile import PASSES, get_passes, transpile
+from vyro.transpiler.tree_diff import TreeDiffWriter, diff_snapshots, take_snapshot
+from vyro.transpiler.utils import replace_in_tree
+from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+SOURCE = """
+total: uint256
+
+@external
+def __init__(x: uint256):
+    self.total = x + 1
+"""
+
+
+def test_tree_diff_files(tmp_path):
+    """
+    Test that a diff is written for each selected pass, named after its position
+    in `PASSES` rather than among the passes that run.
+    """
+    ast = get_vyper_ast_from_source(SOURCE, "tree_diff.vy")
+    assert len(get_passes(scan_features(ast))) < len(PASSES)
+    transpile(ast, tree_diff=TreeDiffWriter(tmp_path, passes=["Ch", "Sv"]))
+
+    ch = tmp_path / f"{list(PASSES).index('Ch'):02d}_Ch.diff"
+    sv = tmp_path / f"{list(PASSES).index('Sv'):02d}_Sv.diff"
+    assert sorted(tmp_path.iterdir()) == [ch, sv]
+
+    # Renamed nodes are reported as changed rather than removed and added
+    lines = ch.read_text().splitlines()
+    assert lines[0] == "# Pass Ch (ConstructorHandler): 2 changes"
+    assert lines[1].startswith("~ FunctionDef#")
+    assert lines[2] == "    name: '__init__' -> 'constructor'"
+
+    lines = sv.read_text().splitlines()
+    assert lines[0].startswith("# Pass Sv (StorageVarVisitor): ")
+    assert any(i.startswith("- Attribute#") and "attr='total'" in i for i in lines)
+    assert any(i.startswith("+ CairoStorageWrite#") for i in lines)
+
+
+def test_tree_diff_function(tmp_path):
+    """
+    Test that a function is followed once a pass renames it, and that a function
+    that does not exist is an error.
+    """
+    ast = get_vyper_ast_from_source(SOURCE, "tree_diff.vy")
+    transpile(ast, tree_diff=TreeDiffWriter(tmp_path, "__init__", passes=["Sv"]))
+
+    lines = (tmp_path / f"{list(PASSES).index('Sv'):02d}_Sv.diff").read_text().splitlines()
+    assert lines[0].endswith("changes in function __init__")
+    assert any(i.startswith("+ CairoStorageWrite#") for i in lines)
+
+    ast = get_vyper_ast_from_source(SOURCE, "tree_diff.vy")
+    with pytest.raises(ValueError):
+        transpile(ast, tree_diff=TreeDiffWriter(tmp_path, "__int__"))
+
+
+def test_snapshot_keys():
+    """
+    Test that nodes are keyed by their `node_id`, and that operators which share
+    a `node_id` are all recorded.
+    """
+    source = "@external\ndef foo(a: uint256, b: uint256) -> uint256:\n    return a + b + a\n"
+    ast = get_vyper_ast_from_source(source, "tree_diff.vy")
+    NodeIndex.attach(ast)
+    snapshot = take_snapshot(ast)
+
+    ops = ast.get_descendants(vy_ast.Add)
+    assert len(ops) == 2 and ops[0].node_id == ops[1].node_id
+    assert len([s for s in snapshot.values() if isinstance(s.node, vy_ast.Add)]) == 2
+    assert snapshot[ast.body[0].node_id].node is ast.body[0]
+    assert diff_snapshots(snapshot, take_snapshot(ast)) == []
+
+    # A node replaced with a copy that keeps its `node_id` is changed, not replaced
+    name_node = ast.get_descendants(vy_ast.Name, {"id": "b"})[0]
+    copy = vy_ast.Name.from_node(name_node, id="c")
+    copy._metadata["type"] = name_node._metadata["type"]
+    replace_in_tree(ast, name_node, copy)
+
+    lines = diff_snapshots(snapshot, take_snapshot(ast))
+    assert lines == [f"~ Name#{copy.node_id} id='c' type=uint256 (line 3)", "    id: 'b' -> 'c'"]
@@ -0,0 +1,69 @@
+import os
+
+from vyro.utils.output import write_cairo_if_changed
+from vyro.utils.watch import ContractWatcher
+
+
+def _touch(path, offset=1):
+    """
+    Move the modification time of a file forward, as the resolution of the clock
+    may be too coarse for consecutive writes to differ.
+    """
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset * 1_000_000_000))
+
+
+def test_poll(tmp_path):
+    a = tmp_path / "a.vy"
+    b = tmp_path / "sub" / "b.vy"
+    b.parent.mkdir()
+    a.write_text("x: uint256")
+    b.write_text("y: uint256")
+    (tmp_path / "c.cairo").write_text("%lang starknet")
+
+    watcher = ContractWatcher(tmp_path)
+    assert watcher.poll() == ([a, b], [])
+    assert watcher.poll() == ([], [])
+
+    # Changed contents are reported, even if the size is the same
+    a.write_text("x: uint128")
+    _touch(a)
+    assert watcher.poll() == ([a], [])
+
+    b.unlink()
+    assert watcher.poll() == ([], [b])
+
+    b.write_text("y: uint256")
+    assert watcher.poll() == ([b], [])
+
+
+def test_poll_touched(tmp_path):
+    """
+    Test that a contract whose modification time changes without a change to its
+    contents is not reported.
+    """
+    a = tmp_path / "a.vy"
+    a.write_text("x: uint256")
+
+    watcher = ContractWatcher(tmp_path)
+    watcher.poll()
+
+    a.write_text("x: uint256")
+    _touch(a)
+    assert watcher.poll() == ([], [])
+
+
+def test_write_cairo_if_changed(tmp_path):
+    path = tmp_path / "out" / "a.cairo"
+
+    assert write_cairo_if_changed("%lang starknet\n", str(path)) is True
+    assert path.read_text() == "%lang starknet\n"
+
+    _touch(path, -10)
+    mtime = path.stat().st_mtime_ns
+
+    assert write_cairo_if_changed("%lang starknet\n", str(path)) is False
+    assert path.stat().st_mtime_ns == mtime
+
+    assert write_cairo_if_changed("%lang starknet\n\n", str(path)) is True
+    assert path.stat().st_mtime_ns != mtime
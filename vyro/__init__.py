@@ -0,0 +1,12 @@
+_API = ("Diagnostic", "TranspileOptions", "TranspileResult", "transpile_source")
+
+
+def __getattr__(name):
+    # The API is imported on first use, so that importing vyro (e.g. for the CLI)
+    # does not import the Vyper front end and the transpiler
+    if name in _API:
+        from vyro import api
+
+        return getattr(api, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,15 @@
 import importlib
+import os
 import sys
-import traceback
-from pathlib import Path
 
 from vyro._config import __version__
-from vyro.utils.docopt import docopt, levenshtein_norm
 
 __doc__ = """Usage: vyro <command> [<args>...] [options <args>]
 
 Commands:
   transform             Print the Vyper AST to console.
   transpile             Transpile a Vyper contract to Cairo.
+  serve                 Start a long-running transpile server.
   test                  Run test cases in the tests/ folder.
 
 Options:
@@ -19,13 +18,24 @@ Options:
 """
 
 
+# Commands whose standard output is machine-readable, and must not include the banner
+QUIET_COMMANDS = ("serve",)
+
+
 def main():
 
-    print(f"Vyro v{__version__} - Transpiler for Vyper to Cairo\n")
+    banner_file = sys.stderr if sys.argv[1:2] and sys.argv[1] in QUIET_COMMANDS else sys.stdout
+    print(f"Vyro v{__version__} - Transpiler for Vyper to Cairo\n", file=banner_file)
 
     if "--version" in sys.argv:
         sys.exit()
 
+    # Imported after the `--version` check to keep start-up fast. Command modules
+    # are also only imported once the command is known, and defer their own heavy
+    # imports (Vyper, cairo-lang and the transpiler passes) until after parsing
+    # their arguments.
+    from vyro.utils.docopt import docopt, levenshtein_norm
+
     if len(sys.argv) < 2 or sys.argv[1].startswith("-"):
         # this call triggers a SystemExit
         docopt(__doc__, ["vyro", "-h"])
@@ -35,7 +45,11 @@ def main():
         sys.argv[sys.argv.index("-i")] = "-I"
 
     cmd = sys.argv[1]
-    cmd_list = [i.stem for i in Path(__file__).parent.glob("[!_]*.py")]
+    cmd_list = [
+        i[:-3]
+        for i in os.listdir(os.path.dirname(__file__))
+        if i.endswith(".py") and not i.startswith("_")
+    ]
     if cmd not in cmd_list:
         distances = sorted([(i, levenshtein_norm(cmd, i)) for i in cmd_list], key=lambda k: k[1])
         if distances[0][1] <= 0.2:
@@ -47,6 +61,8 @@ def main():
     try:
         importlib.import_module(f"vyro._cli.{cmd}").main()
     except Exception as e:
+        import traceback
+
         tb_item = sys.exc_info()[2]
         traceback.print_tb(tb_item)
         print(e)
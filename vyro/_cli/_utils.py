@@ -0,0 +1,20 @@
+import sys
+from typing import Optional
+
+
+def get_jobs(value: Optional[str]) -> Optional[int]:
+    """
+    Parse the `--jobs` option of a command, and exit with a usage message if it is
+    not a positive integer. Returns None if the option is not given.
+    """
+    if value is None:
+        return None
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+
+    if jobs < 1:
+        sys.exit(f"Invalid --jobs '{value}'. Expected an integer of 1 or more.")
+    return jobs
@@ -0,0 +1,286 @@
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+from vyro._cli._utils import get_jobs
+from vyro.utils.docopt import docopt
+
+if TYPE_CHECKING:
+    from vyro.transpiler.function_cache import FunctionCache
+
+__doc__ = """Usage: vyro serve [options]
+
+Options:
+  --help -h             Display this message.
+  --socket <path>       Listen on a Unix socket instead of stdin and stdout.
+  --jobs -j <jobs>      Number of worker processes.
+
+Starts a long-running transpile server, so that the Vyper front end and the
+transpiler only need to be imported once.
+
+Requests and responses are JSON-RPC 2.0 messages, one per line. Requests are
+handled by a pool of worker processes, so responses may be sent out of order.
+
+Methods:
+  transpile             Transpile `source` to Cairo. Returns `cairo`,
+                        `import_directives`, `diagnostics` and `timings`.
+  transform             Parse `source`. Returns the Vyper AST as `ast`,
+                        `diagnostics` and `timings`.
+  shutdown              Stop the server once pending requests are answered.
+
+Both `transpile` and `transform` take the contract source text as `source`,
+and optionally a contract `name` that is used in error messages.
+
+Each worker keeps the Cairo output of the functions it has transpiled, so only
+the functions that have changed are transpiled again.
+"""
+
+JSONRPC_VERSION = "2.0"
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+METHODS = ("transpile", "transform", "shutdown")
+
+# Function cache of the worker process
+_function_cache: Optional["FunctionCache"] = None
+
+
+def _warm_up():
+    """
+    Import the Vyper front end and the transpiler when a worker process starts, so
+    that the first request does not pay for it.
+    """
+    import vyro.api  # noqa: F401
+    import vyro.cairo.writer  # noqa: F401
+    import vyro.transpiler.transpile  # noqa: F401
+    import vyro.vyper.vyper_compile  # noqa: F401
+
+
+def _get_function_cache() -> "FunctionCache":
+    from vyro.transpiler.function_cache import FunctionCache
+
+    global _function_cache
+    if _function_cache is None:
+        _function_cache = FunctionCache()
+    return _function_cache
+
+
+def _run(method: str, source: str, name: str) -> dict:
+    """
+    Handle a transpile or transform request in a worker process.
+
+    Errors raised by Vyper or the transpiler are reported as diagnostics instead of
+    being propagated, so that the client receives them as part of the result.
+    """
+    from vyro.api import TranspileOptions, transpile_source
+    from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+    result: dict = {"diagnostics": [], "timings": {}}
+    start = time.perf_counter()
+    try:
+        if method == "transform":
+            vyper_ast = get_vyper_ast_from_source(source, name)
+            result["timings"]["parse"] = time.perf_counter() - start
+            result["ast"] = vyper_ast.to_dict()
+        else:
+            options = TranspileOptions(name=name, function_cache=_get_function_cache())
+            r = transpile_source(source, options=options)
+            result["cairo"] = r.cairo
+            result["import_directives"] = r.import_directives
+            result["diagnostics"] = [asdict(d) for d in r.diagnostics]
+            result["timings"] = r.timings
+
+    except Exception as e:
+        result["diagnostics"].append(
+            {"severity": "error", "category": type(e).__name__, "message": str(e).strip()}
+        )
+
+    result["timings"]["total"] = time.perf_counter() - start
+    return result
+
+
+def _get_response(request_id: Any, result: Any = None, error: Optional[dict] = None) -> dict:
+    response = {"jsonrpc": JSONRPC_VERSION, "id": request_id}
+    if error is not None:
+        response["error"] = error
+    else:
+        response["result"] = result
+    return response
+
+
+def _get_error(code: int, message: str) -> dict:
+    return {"code": code, "message": message}
+
+
+class TranspileServer:
+    """
+    Dispatches JSON-RPC requests to a process pool.
+
+    Each connection provides a `respond` callable that writes one response. It is
+    called from the thread that completes a request, so it must be thread-safe.
+    """
+
+    def __init__(self, jobs: Optional[int] = None) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.executor = ProcessPoolExecutor(max_workers=jobs, initializer=_warm_up)
+        self.shutdown_requested = threading.Event()
+
+    def handle(self, line: str, respond: Callable[[dict], None]) -> Optional[Future]:
+        """
+        Handle a single line received from a client.
+
+        Returns a future that is resolved once the response to a request handled by
+        the process pool has been sent, or None if the request was answered directly.
+        """
+
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            respond(_get_response(None, error=_get_error(PARSE_ERROR, f"Parse error: {e}")))
+            return
+
+        if not isinstance(request, dict) or request.get("jsonrpc") != JSONRPC_VERSION:
+            respond(_get_response(None, error=_get_error(INVALID_REQUEST, "Invalid request")))
+            return
+
+        # Requests without an id are notifications, and are not answered
+        is_notification = "id" not in request
+        request_id = request.get("id")
+
+        def reply(result: Any = None, error: Optional[dict] = None):
+            if not is_notification:
+                respond(_get_response(request_id, result, error))
+
+        method = request.get("method")
+        if method not in METHODS:
+            reply(error=_get_error(METHOD_NOT_FOUND, f"Method not found: {method}"))
+            return
+
+        if method == "shutdown":
+            self.shutdown_requested.set()
+            reply()
+            return
+
+        params = request.get("params", {})
+        if not isinstance(params, dict) or not isinstance(params.get("source"), str):
+            reply(error=_get_error(INVALID_PARAMS, "Expected a `source` string parameter"))
+            return
+
+        name = params.get("name", "<unknown>")
+        future = self.executor.submit(_run, method, params["source"], str(name))
+        replied: Future = Future()
+
+        def on_done(f):
+            try:
+                reply(f.result())
+            except Exception as e:
+                # Only raised if the worker process itself failed
+                reply(error=_get_error(INTERNAL_ERROR, f"{type(e).__name__}: {e}"))
+            finally:
+                replied.set_result(None)
+
+        future.add_done_callback(on_done)
+        return replied
+
+    def close(self):
+        # Waits for pending requests, so that every request is answered
+        self.executor.shutdown(wait=True)
+
+
+def _serve_stdio(server: TranspileServer):
+    lock = threading.Lock()
+
+    def respond(response: dict):
+        with lock:
+            sys.stdout.write(json.dumps(response, default=str) + "\n")
+            sys.stdout.flush()
+
+    for line in sys.stdin:
+        if line.strip():
+            server.handle(line, respond)
+        if server.shutdown_requested.is_set():
+            break
+
+
+def _get_file_id(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _serve_socket(server: TranspileServer, path: str):
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            lock = threading.Lock()
+
+            def respond(response: dict):
+                data = (json.dumps(response, default=str) + "\n").encode()
+                with lock:
+                    try:
+                        self.wfile.write(data)
+                        self.wfile.flush()
+                    except OSError:
+                        # The client has disconnected
+                        pass
+
+            pending = []
+            for line in self.rfile:
+                if line.strip():
+                    replied = server.handle(line.decode(), respond)
+                    if replied is not None:
+                        pending.append(replied)
+                if server.shutdown_requested.is_set():
+                    # `shutdown` blocks until `serve_forever` returns
+                    threading.Thread(target=unix_server.shutdown).start()
+                    break
+
+            # Answer every request before the connection is closed
+            wait(pending)
+
+    # Only a stale socket, e.g. left by a server that was killed, is replaced
+    if os.path.lexists(path):
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            sys.exit(f"Invalid socket - '{path}' exists and is not a socket")
+        os.unlink(path)
+
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as unix_server:
+        created = _get_file_id(path)
+        print(f"Listening on {path}", file=sys.stderr)
+        try:
+            unix_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # The path may have been replaced since, e.g. by another server
+            if _get_file_id(path) == created:
+                os.unlink(path)
+
+
+def main():
+    args = docopt(__doc__)
+
+    server = TranspileServer(get_jobs(args["--jobs"]))
+
+    try:
+        if args["--socket"]:
+            _serve_socket(server, args["--socket"])
+        else:
+            _serve_stdio(server)
+    finally:
+        server.close()
@@ -1,7 +1,6 @@
 import json
 
 from vyro.utils.docopt import docopt
-from vyro.vyper.vyper_compile import get_vyper_ast
 
 __doc__ = """Usage: vyro transform [<contract>]
 
@@ -16,6 +15,8 @@ def main():
     args = docopt(__doc__)
 
     if args["<contract>"]:
+        from vyro.vyper.vyper_compile import get_vyper_ast
+
         path = args["<contract>"]
 
         # Get Vyper AST
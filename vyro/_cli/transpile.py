@@ -1,55 +1,358 @@
+import glob
 import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from vyro.cairo.writer import write
-from vyro.transpiler.transpile import transpile
+from vyro._cli._utils import get_jobs
 from vyro.utils.docopt import docopt
-from vyro.utils.output import write_cairo
-from vyro.vyper.vyper_compile import get_vyper_ast
+from vyro.utils.output import write_cairo, write_cairo_if_changed
 
-__doc__ = """Usage: vyro transpile [<contract>] [options]
+if TYPE_CHECKING:
+    from vyro.transpiler.function_cache import FunctionCache
+    from vyro.transpiler.tree_diff import TreeDiffWriter
+    from vyro.utils.cache import TranspileCache
+
+# Note: the Vyper front end and the transpiler are imported when they are first used,
+# so that `vyro transpile --help` and argument errors do not pay for their import.
+
+__doc__ = """Usage: vyro transpile [<contract>...] [options]
 
 Arguments
-  [<contract>]          Name of Vyper contract to compile.
+  [<contract>...]       Vyper contracts to compile. Accepts file paths, glob
+                        patterns and directories (searched recursively for .vy files).
 
 Options:
   --help -h             Display this message.
   --output <file>       Write the transpiled Cairo to a file.
+  --output-dir <dir>    Write the transpiled Cairo of each contract to a directory.
+  --jobs -j <jobs>      Number of contracts to transpile in parallel.
   --print-output        Print the transpiled Cairo to console.
   --print-tree          Print the transpiled AST to console.
+  --no-cache            Do not read from or write to the transpilation cache.
+  --cache-dir <dir>     Directory of the transpilation cache.
+  --watch <dir>         Watch a directory and transpile contracts when they change.
+  --profile-passes      Print the time, visits, created nodes and peak memory of
+                        each transpiler pass.
+  --profile-format <format>
+                        Format of the profile report, `table` or `json`.
+                        [default: table]
+  --tree-diff-dir <dir> Write the nodes added, removed or changed by each
+                        transpiler pass to a directory.
+  --tree-diff-function <name>
+                        Limit the tree diffs to a single function.
+  --tree-diff-passes <passes>
+                        Limit the tree diffs to a comma-separated list of
+                        passes, e.g. `Sv,Oc`.
+
+Transpiles the contract source file. If more than one contract is given, the
+contracts are transpiled in a process pool and a summary is printed at the end.
 
-Transpiles the contract source file
+The transpiled Cairo is cached by the contents of each contract, so unchanged
+contracts are not transpiled again.
+
+In watch mode, the Cairo output is written next to each contract, or to the
+directory given by --output-dir. Only contracts whose contents have changed are
+transpiled again, and within them only the functions that have changed. Output
+files are only written if the Cairo has changed.
 """
 
 
+def _expand_paths(patterns: List[str]) -> List[Path]:
+    """
+    Resolve file paths, glob patterns and directories into a list of contract paths.
+    """
+    paths = []
+    for p in patterns:
+        if os.path.isdir(p):
+            matches = sorted(Path(p).rglob("*.vy"))
+        elif glob.has_magic(p):
+            matches = sorted(Path(i) for i in glob.glob(p, recursive=True))
+        else:
+            matches = [Path(p)]
+
+        for m in matches:
+            if m not in paths:
+                paths.append(m)
+
+    return paths
+
+
+def _get_output_path(path: Path, base: Path, output_dir: str) -> Path:
+    """
+    Mirror the location of `path` relative to `base` in `output_dir`.
+    """
+    return Path(output_dir) / path.relative_to(base).with_suffix(".cairo")
+
+
+def _get_cairo(
+    path: Path, cache: Optional["TranspileCache"], function_cache: Optional["FunctionCache"] = None
+) -> str:
+    """
+    Returns the transpiled Cairo for a contract, using the caches if provided.
+    """
+    from vyro.api import TranspileOptions, transpile_source
+
+    source = path.read_bytes()
+    if cache is not None:
+        key = cache.get_key(source)
+        output = cache.get(key)
+        if output is not None:
+            return output
+
+    options = TranspileOptions(name=str(path), function_cache=function_cache)
+    output = transpile_source(source.decode(), options=options).cairo
+
+    if cache is not None:
+        cache.put(key, output)
+
+    return output
+
+
+def _get_cache(args) -> Optional["TranspileCache"]:
+    from vyro.utils.cache import TranspileCache
+
+    if args["--no-cache"]:
+        return None
+    return TranspileCache(args["--cache-dir"])
+
+
+def _get_tree_diff(args) -> Optional["TreeDiffWriter"]:
+    if not args["--tree-diff-dir"]:
+        if args["--tree-diff-function"] or args["--tree-diff-passes"]:
+            sys.exit("--tree-diff-function and --tree-diff-passes require --tree-diff-dir.")
+        return None
+
+    from vyro.transpiler.transpile import PASSES
+    from vyro.transpiler.tree_diff import TreeDiffWriter
+
+    passes = None
+    if args["--tree-diff-passes"]:
+        passes = [i.strip() for i in args["--tree-diff-passes"].split(",")]
+        invalid = [i for i in passes if i not in PASSES]
+        if invalid:
+            sys.exit(f"Invalid passes: {', '.join(invalid)}. Expected one of: {', '.join(PASSES)}")
+
+    return TreeDiffWriter(args["--tree-diff-dir"], args["--tree-diff-function"], passes)
+
+
+def _transpile_file(
+    path: Path, output_file: Optional[Path], print_output: bool, cache_dir: Optional[str]
+) -> Tuple[Path, Optional[str], Optional[str]]:
+    """
+    Transpile a single contract in a worker process.
+
+    Returns a tuple of the contract path, the transpiled Cairo if it is to be printed,
+    and the error message if transpilation failed. Exceptions are not propagated
+    so that one failing contract does not abort the rest of the batch.
+    """
+    from vyro.utils.cache import TranspileCache
+
+    try:
+        cache = TranspileCache(cache_dir) if cache_dir else None
+        output = _get_cairo(path, cache)
+
+        if output_file:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            write_cairo(output, str(output_file))
+
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {str(e).strip()}"
+
+    return path, output if print_output else None, None
+
+
+def _transpile_batch(paths: List[Path], args):
+    output_dir = args["--output-dir"]
+    print_output = args["--print-output"]
+    jobs = get_jobs(args["--jobs"]) or os.cpu_count()
+
+    cache = _get_cache(args)
+    cache_dir = str(cache.cache_dir) if cache is not None else None
+
+    # Output paths mirror the contracts relative to their common directory, so a
+    # single contract is written to `<output-dir>/<name>.cairo`
+    base = Path(os.path.commonpath([p.resolve().parent for p in paths]))
+    tasks = [
+        (
+            p,
+            _get_output_path(p.resolve(), base, output_dir) if output_dir else None,
+            print_output,
+            cache_dir,
+        )
+        for p in paths
+    ]
+
+    if jobs == 1:
+        results = [_transpile_file(*t) for t in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_transpile_file, *zip(*tasks)))
+
+    failed = []
+    for path, output, error in results:
+        if error is None:
+            print(f"OK      {path}")
+            if output:
+                print(output)
+        else:
+            print(f"FAILED  {path}\n        {error}")
+            failed.append(path)
+
+    print(f"\nTranspiled {len(results) - len(failed)} of {len(results)} contracts.")
+
+    if failed:
+        sys.exit(1)
+
+
+def _transpile_changed(
+    path: Path,
+    output_file: Path,
+    cache: Optional["TranspileCache"],
+    function_cache: "FunctionCache",
+):
+    """
+    Transpile a contract that changed in watch mode, and report the result.
+    """
+    import time
+
+    start = time.perf_counter()
+    try:
+        output = _get_cairo(path, cache, function_cache)
+        written = write_cairo_if_changed(output, str(output_file))
+    except Exception as e:
+        print(f"FAILED     {path}\n           {type(e).__name__}: {str(e).strip()}")
+        return
+
+    elapsed = time.perf_counter() - start
+    status = "UPDATED" if written else "UNCHANGED"
+    print(f"{status:<11}{path} -> {output_file} ({elapsed:.2f}s)")
+
+
+def _watch(directory: str, args):
+    from vyro.transpiler.function_cache import FunctionCache
+    from vyro.utils.watch import ContractWatcher
+
+    if not os.path.isdir(directory):
+        sys.exit(f"Invalid directory - '{directory}' does not exist")
+
+    output_dir = args["--output-dir"]
+    base = Path(directory).resolve()
+    cache = _get_cache(args)
+    function_cache = FunctionCache()
+
+    watcher = ContractWatcher(directory)
+    changed, removed = watcher.poll()
+
+    print(f"Watching {directory} for changes. Press Ctrl+C to stop.\n")
+    try:
+        while True:
+            for path in changed:
+                if output_dir:
+                    output_file = _get_output_path(path.resolve(), base, output_dir)
+                else:
+                    output_file = path.with_suffix(".cairo")
+                _transpile_changed(path, output_file, cache, function_cache)
+
+            for path in removed:
+                print(f"REMOVED    {path}")
+
+            changed, removed = watcher.wait()
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     args = docopt(__doc__)
 
-    if args["<contract>"]:
-        path = args["<contract>"]
-        print_tree = args["--print-tree"]
-        print_output = args["--print-output"]
+    if args["--watch"]:
+        if args["<contract>"] or args["--output"]:
+            sys.exit("--watch cannot be used with contracts or --output. Use --output-dir instead.")
+        if args["--print-tree"] or args["--print-output"] or args["--jobs"]:
+            sys.exit("--watch cannot be used with --print-tree, --print-output or --jobs.")
+        if args["--profile-passes"] or args["--tree-diff-dir"]:
+            sys.exit("--watch cannot be used with --profile-passes or --tree-diff-dir.")
+
+        _watch(args["--watch"], args)
+        return
+
+    if not args["<contract>"]:
+        return
+
+    paths = _expand_paths(args["<contract>"])
+    if not paths:
+        sys.exit("No Vyper contracts found.")
+
+    if len(paths) > 1 or args["--output-dir"] or args["--jobs"]:
+        if args["--output"]:
+            sys.exit("--output can only be used with a single contract. Use --output-dir instead.")
+        if args["--print-tree"] or args["--profile-passes"] or args["--tree-diff-dir"]:
+            sys.exit(
+                "--print-tree, --profile-passes and --tree-diff-dir can only be used with a "
+                "single contract."
+            )
+
+        _transpile_batch(paths, args)
+        return
+
+    path = paths[0]
+    print_tree = args["--print-tree"]
+    print_output = args["--print-output"]
+
+    profiler = None
+    if args["--profile-passes"]:
+        from vyro.transpiler.profiler import PROFILE_FORMATS, PassProfiler
+
+        if args["--profile-format"] not in PROFILE_FORMATS:
+            sys.exit(f"Invalid profile format. Expected one of: {', '.join(PROFILE_FORMATS)}")
+        profiler = PassProfiler()
+
+    tree_diff = _get_tree_diff(args)
+
+    if print_tree or profiler or tree_diff:
+        from vyro.cairo.writer import write
+        from vyro.transpiler.transpile import transpile
+        from vyro.vyper.vyper_compile import get_vyper_ast
 
         # Get Vyper AST
-        vyper_ast = get_vyper_ast(path)
+        vyper_ast = get_vyper_ast(str(path))
+
+        if tree_diff and tree_diff.function:
+            from vyro.transpiler.tree_diff import get_function
+
+            if get_function(vyper_ast, tree_diff.function) is None:
+                sys.exit(f"Invalid function - '{tree_diff.function}' does not exist")
 
         # Transpile
-        transpile(vyper_ast, print_tree=print_tree)
+        transpile(vyper_ast, print_tree=print_tree, profiler=profiler, tree_diff=tree_diff)
 
         # Get transpiled Cairo in str format
         output = write(vyper_ast)
+    else:
+        output = _get_cairo(path, _get_cache(args))
 
-        # Write to output file
-        output_file = args["--output"]
-        if output_file:
-            write_cairo(output, output_file)
+    # Write to output file
+    output_file = args["--output"]
+    if output_file:
+        write_cairo(output, output_file)
+
+    # Print Cairo output to console
+    if print_output:
+        print(output)
+
+    if print_tree:
+        ast_dict = vyper_ast.to_dict()
+        print("\n\n=============== Transpiled AST ===============\n\n")
+        print(json.dumps(ast_dict, sort_keys=True, indent=4))
 
-        # Print Cairo output to console
-        if print_output:
-            print(output)
+    if profiler:
+        print("\n\n=============== Pass profile ===============\n\n")
+        print(profiler.report(args["--profile-format"]))
 
-        if print_tree:
-            ast_dict = vyper_ast.to_dict()
-            print("\n\n=============== Transpiled AST ===============\n\n")
-            print(json.dumps(ast_dict, sort_keys=True, indent=4))
+    if tree_diff:
+        print(f"\nTree diffs written to {tree_diff.output_dir}")
 
-        print(f"\nSuccessfully transpiled {path}!")
+    print(f"\nSuccessfully transpiled {path}!")
@@ -0,0 +1,121 @@
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from vyro.transpiler.function_cache import FunctionCache
+
+__all__ = ["Diagnostic", "TranspileOptions", "TranspileResult", "transpile_source"]
+
+
+@dataclass
+class TranspileOptions:
+    """
+    Options for `transpile_source`.
+
+    Attributes
+    ----------
+    name : str
+        Name of the contract, used in error messages.
+    function_cache : FunctionCache, optional
+        Cache of the Cairo output of each function. If provided, only the functions
+        that are not in the cache are transpiled.
+    """
+
+    name: str = "<unknown>"
+    function_cache: Optional["FunctionCache"] = None
+
+
+@dataclass
+class Diagnostic:
+    """
+    A message reported while transpiling that did not cause it to fail.
+    """
+
+    severity: str
+    category: str
+    message: str
+
+
+@dataclass
+class TranspileResult:
+    """
+    Result of `transpile_source`.
+
+    Attributes
+    ----------
+    cairo : str
+        The transpiled Cairo source.
+    import_directives : Dict[str, List[str]]
+        Names imported by the Cairo source, keyed by module.
+    timings : Dict[str, float]
+        Time taken by each phase in seconds.
+    diagnostics : List[Diagnostic]
+        Warnings raised while transpiling.
+    """
+
+    cairo: str
+    import_directives: Dict[str, List[str]] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+
+
+def transpile_source(source: str, *, options: Optional[TranspileOptions] = None) -> TranspileResult:
+    """
+    Transpile Vyper source code to Cairo without reading from or writing to disk.
+
+    Arguments
+    ---------
+    source : str
+        Vyper source code.
+    options : TranspileOptions, optional
+        Transpilation options.
+
+    Returns
+    -------
+    TranspileResult
+        The Cairo source, together with its imports, timings and diagnostics.
+        Vyper and vyro exceptions are raised if the source cannot be transpiled.
+    """
+    from vyro.cairo.writer import write
+    from vyro.transpiler.transpile import transpile
+    from vyro.vyper.vyper_compile import get_vyper_ast_from_source
+
+    if options is None:
+        options = TranspileOptions()
+
+    timings = {}
+    start = time.perf_counter()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+
+        t = time.perf_counter()
+        vyper_ast = get_vyper_ast_from_source(source, options.name)
+        timings["parse"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        cache = options.function_cache
+        if cache is None:
+            transpile(vyper_ast)
+        else:
+            from vyro.transpiler.function_cache import apply_function_cache, update_function_cache
+
+            keys = apply_function_cache(vyper_ast, cache)
+            body = list(vyper_ast.body)
+            transpile(vyper_ast)
+            update_function_cache(vyper_ast, cache, keys, body)
+        timings["transpile"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        cairo = write(vyper_ast)
+        timings["write"] = time.perf_counter() - t
+
+    timings["total"] = time.perf_counter() - start
+
+    import_directives = {
+        k: sorted(v) for k, v in vyper_ast._metadata.get("import_directives", {}).items()
+    }
+    diagnostics = [Diagnostic("warning", w.category.__name__, str(w.message)) for w in caught]
+
+    return TranspileResult(cairo, import_directives, timings, diagnostics)
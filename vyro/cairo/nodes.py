@@ -1,7 +1,18 @@
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 
 from vyper import ast as vy_ast
 
+from vyro.transpiler.node_index import get_node_index
+
+
+def _add_to_node_index(node: vy_ast.VyperNode, parent: Optional[vy_ast.VyperNode]):
+    # `VyperNode.__init__` adds the node to the children of `parent` directly, so the
+    # node index of the module must be updated here
+    if parent is not None:
+        index = get_node_index(parent)
+        if index is not None:
+            index.add(node, parent)
+
 
 class CairoAssert(vy_ast.Assign):
     """Wrapper class for Cairo assert"""
@@ -9,6 +20,7 @@ class CairoAssert(vy_ast.Assign):
     def __init__(self, parent: Optional[vy_ast.VyperNode] = None, **kwargs: dict):
         self.ast_type = "CairoAssert"
         super().__init__(parent, **kwargs)
+        _add_to_node_index(self, parent)
 
 
 class CairoIfTest(vy_ast.Compare):
@@ -17,6 +29,7 @@ class CairoIfTest(vy_ast.Compare):
     def __init__(self, parent: Optional[vy_ast.VyperNode] = None, **kwargs: dict):
         self.ast_type = "CairoIfTest"
         super().__init__(parent, **kwargs)
+        _add_to_node_index(self, parent)
 
 
 class CairoStorageWrite(vy_ast.Assign):
@@ -25,6 +38,7 @@ class CairoStorageWrite(vy_ast.Assign):
     def __init__(self, parent: Optional[vy_ast.VyperNode] = None, **kwargs: dict):
         self.ast_type = "CairoStorageWrite"
         super().__init__(parent, **kwargs)
+        _add_to_node_index(self, parent)
 
 
 class CairoStorageRead(vy_ast.Assign):
@@ -35,6 +49,25 @@ class CairoStorageRead(vy_ast.Assign):
     def __init__(self, parent: Optional[vy_ast.VyperNode] = None, **kwargs: dict):
         self.ast_type = "CairoStorageRead"
         super().__init__(parent, **kwargs)
+        _add_to_node_index(self, parent)
 
         if kwargs.get("args"):
             self.args = kwargs["args"]
+
+
+class CairoCachedFunction(vy_ast.Pass):
+    """Placeholder for a function whose Cairo output is taken from the function cache"""
+
+    name: str = ""
+    cairo: str = ""
+    imports: FrozenSet[str] = frozenset()
+    storage_vars: Tuple[str, ...] = ()
+
+    def __init__(self, parent: Optional[vy_ast.VyperNode] = None, **kwargs: dict):
+        self.ast_type = "CairoCachedFunction"
+        super().__init__(parent, **kwargs)
+        _add_to_node_index(self, parent)
+
+        for k in ("name", "cairo", "imports", "storage_vars"):
+            if k in kwargs:
+                setattr(self, k, kwargs[k])
@@ -1,8 +1,54 @@
+from typing import Dict, Sequence, Tuple
+
+from vyper.semantics.types.bases import BaseTypeDefinition
 from vyper.semantics.types.value.numeric import ValueTypeDefinition
 
+from vyro.exceptions import TranspilerPanic
+
 
 class CairoTypeDefinition(ValueTypeDefinition):
-    """Wrapper class"""
+    """
+    Wrapper class
+
+    Instances returned by `get_instance` are interned, i.e. a single instance is
+    shared by every node of that type, and cannot be modified.
+    """
+
+    # Interned instances of each class, keyed by the arguments of `get_instance`
+    _instances: Dict[tuple, "CairoTypeDefinition"] = {}
+
+    _is_interned = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __setattr__(self, name, value):
+        if self._is_interned:
+            raise TranspilerPanic(f"Interned `{self}` type cannot be modified")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def get_instance(
+        cls, is_constant: bool = False, is_public: bool = False, is_immutable: bool = False
+    ) -> "CairoTypeDefinition":
+        """
+        Returns the interned instance of the type with the given flags.
+        """
+        key = (is_constant, is_public, is_immutable)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(is_constant=is_constant, is_public=is_public, is_immutable=is_immutable)
+            instance._intern(key)
+        return instance
+
+    def _intern(self, key: tuple):
+        object.__setattr__(self, "_is_interned", True)
+        type(self)._instances[key] = self
+
+
+def _is_interned(typ: BaseTypeDefinition) -> bool:
+    return isinstance(typ, CairoTypeDefinition) and typ._is_interned
 
 
 class FeltDefinition(CairoTypeDefinition):
@@ -24,3 +70,37 @@ class CairoMappingDefinition(CairoTypeDefinition):
 
     def __repr__(self):
         return str(self.value_type)
+
+    @classmethod
+    def get_instance(  # type: ignore[override]
+        cls,
+        is_constant: bool,
+        is_public: bool,
+        is_immutable: bool,
+        key_types: Sequence[BaseTypeDefinition],
+        value_type: BaseTypeDefinition,
+    ) -> "CairoMappingDefinition":
+        """
+        Returns the interned instance of the mapping with the given flags, key types and
+        value type.
+
+        Key types and the value type are compared by identity, so the mapping is only
+        interned if they are interned types themselves. Otherwise, e.g. for struct
+        values that are created for each module, a new instance is returned so that
+        the types of a module are not kept alive.
+        """
+        if not all(_is_interned(i) for i in (*key_types, value_type)):
+            return cls(is_constant, is_public, is_immutable, tuple(key_types), value_type)
+
+        key: Tuple = (
+            is_constant,
+            is_public,
+            is_immutable,
+            tuple(id(i) for i in key_types),
+            id(value_type),
+        )
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(is_constant, is_public, is_immutable, tuple(key_types), value_type)
+            instance._intern(key)
+        return instance  # type: ignore[return-value]
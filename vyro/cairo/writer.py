@@ -1,5 +1,5 @@
 from string import ascii_lowercase as alc
-from typing import List
+from typing import Callable, Dict, List, Optional
 
 from vyper import ast as vy_ast
 from vyper.semantics.types.function import StateMutability
@@ -13,6 +13,13 @@ EXCLUDED_SEMICOLON_NODES = (vy_ast.If, vy_ast.Assert)
 
 
 class CairoWriter:
+    # Writer functions keyed by node class, filled the first time a node class is written
+    _dispatch: Dict[type, Optional[Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
     def __init__(self) -> None:
         self.header: str = "%lang starknet\n"
         self.imports: List[str] = []
@@ -82,11 +89,16 @@ class CairoWriter:
         return cairo
 
     def write(self, node, *args):
-        node_type = type(node).__name__
-        write_fn = getattr(self, f"write_{node_type}", None)
+        node_type = type(node)
+        try:
+            write_fn = self._dispatch[node_type]
+        except KeyError:
+            write_fn = getattr(type(self), f"write_{node_type.__name__}", None)
+            self._dispatch[node_type] = write_fn
+
         if write_fn is None:
-            raise UnsupportedNode(f"{node_type} node is not yet supported in writer", node)
-        return write_fn(node, *args)
+            raise UnsupportedNode(f"{node_type.__name__} node is not yet supported in writer", node)
+        return write_fn(self, node, *args)
 
     def write_arg(self, node):
         typ = node._metadata.get("type")
@@ -187,6 +199,10 @@ class CairoWriter:
         value_str = self.write(node.value)
         return f"assert {target_str} = {value_str}"
 
+    def write_CairoCachedFunction(self, node):
+        self.storage_vars.extend(node.storage_vars)
+        self.functions.append(node.cairo)
+
     def write_CairoIfTest(self, node):
         left_str = self.write(node.left)
 
@@ -264,7 +280,8 @@ class CairoWriter:
         self.write(node.value)
 
     def write_EnumDef(self, node):
-        pass
+        for name, value in node._metadata.get("constants", []):
+            self.constants.append(f"const {name} = {value};")
 
     def write_Eq(self, node):
         pass
@@ -443,10 +460,11 @@ class CairoWriter:
         pass
 
     def write_Module(self, node):
-        # Add import directives
+        # Add import directives, sorted so that they do not depend on the order in
+        # which passes added them
         imports = node._metadata.get("import_directives")
-        for k, v in imports.items():
-            imported = ", ".join(v)
+        for k, v in sorted(imports.items()):
+            imported = ", ".join(sorted(v))
             self.imports.append(f"from {k} import {imported}\n")
 
         for i in node.body:
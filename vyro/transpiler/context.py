@@ -1,41 +1,97 @@
+import threading
+from typing import Dict, Optional, Tuple
+
 from vyper import ast as vy_ast
+from vyper.ast.nodes import DICT_AST_SKIPLIST
+
+# Cache of the child fields of each node class
+_NODE_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
 
+def _get_node_fields(node_type: type) -> Tuple[str, ...]:
+    fields = _NODE_FIELDS.get(node_type)
+    if fields is None:
+        fields = tuple(i for i in node_type.get_fields() if i not in DICT_AST_SKIPLIST)
+        _NODE_FIELDS[node_type] = fields
+    return fields
 
-def _get_largest_node_id(d: dict):
+
+def get_largest_node_id(vyper_module: vy_ast.VyperNode) -> int:
     """
-    Walks the AST dict to get the largest `node_id`.
+    Walks the AST to get the largest `node_id`.
+
+    The same fields as `VyperNode.to_dict` are visited, but the tree is walked
+    directly instead of serializing it first.
     """
-    for k, v in d.items():
-        if k == "node_id":
-            yield v
-        elif isinstance(v, dict):
-            for i in _get_largest_node_id(v):
-                yield i
-        elif isinstance(v, list):
-            for i in v:
-                if isinstance(i, dict):
-                    for j in _get_largest_node_id(i):
-                        yield j
+    largest = 0
+    stack = [vyper_module]
+    while stack:
+        node = stack.pop()
+        # Nodes created by the transpiler may not have an ID
+        node_id = getattr(node, "node_id", None)
+        if node_id is not None and node_id > largest:
+            largest = node_id
 
+        for field in _get_node_fields(type(node)):
+            value = getattr(node, field, None)
+            if isinstance(value, vy_ast.VyperNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(i for i in value if isinstance(i, vy_ast.VyperNode))
 
-class ASTContext:
-    def __init__(self):
-        self.last_id = 0
+    return largest
 
-    @classmethod
-    def get_context(cls, vyper_module: vy_ast.Module) -> "ASTContext":
-        ctx = cls()
 
-        ast_dict = vyper_module.to_dict()
+class NodeIdAllocator:
+    """
+    Thread-safe allocator of node IDs.
+
+    An allocator can be shared by the contexts of several modules, in which case
+    the IDs it reserves are unique across all of them.
+    """
 
-        largest = 0
-        for node_id in _get_largest_node_id(ast_dict):
-            if node_id > largest:
-                largest = node_id
+    def __init__(self, last_id: int = 0) -> None:
+        self._last_id = last_id
+        self._lock = threading.Lock()
 
-        ctx.last_id = largest
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def advance_to(self, node_id: int):
+        """
+        Ensure that IDs up to and including `node_id` are not reserved.
+        """
+        with self._lock:
+            if node_id > self._last_id:
+                self._last_id = node_id
+
+    def reserve(self) -> int:
+        with self._lock:
+            self._last_id += 1
+            return self._last_id
+
+
+class ASTContext:
+    def __init__(self, allocator: Optional[NodeIdAllocator] = None):
+        self.allocator = allocator if allocator is not None else NodeIdAllocator()
+
+        # Number of IDs reserved by this context, which excludes the IDs reserved
+        # by other contexts sharing the allocator
+        self.reserved = 0
+
+    @property
+    def last_id(self) -> int:
+        return self.allocator.last_id
+
+    @classmethod
+    def get_context(
+        cls, vyper_module: vy_ast.Module, allocator: Optional[NodeIdAllocator] = None
+    ) -> "ASTContext":
+        ctx = cls(allocator)
+        ctx.allocator.advance_to(get_largest_node_id(vyper_module))
         return ctx
 
     def reserve_id(self):
-        self.last_id += 1
-        return self.last_id
+        self.reserved += 1
+        return self.allocator.reserve()
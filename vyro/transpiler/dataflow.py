@@ -0,0 +1,241 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from vyper import ast as vy_ast
+
+from vyro.cairo.import_directives import IMPORT_DIRECTIVES
+from vyro.cairo.nodes import CairoAssert, CairoStorageRead, CairoStorageWrite
+from vyro.transpiler.utils import set_parent
+
+# Helpers for the optimization passes that run on the lowered AST, i.e. once the
+# statements of each function are in the form that they are written in Cairo.
+
+# Key of a storage slot, as the name of the storage variable and the keys of each
+# argument
+StorageKey = Tuple[str, Tuple[tuple, ...]]
+
+
+def get_statements(
+    body: List[vy_ast.VyperNode],
+) -> List[Tuple[vy_ast.VyperNode, List[vy_ast.VyperNode]]]:
+    """
+    Returns the statements in a list of statements and in the `If` and `For`
+    statements nested in it, in the order they are written, together with the list
+    of statements that each one is in.
+    """
+    statements = []
+    stack = [body]
+    while stack:
+        stmts = stack.pop()
+        nested = []
+        for stmt in stmts:
+            statements.append((stmt, stmts))
+            if isinstance(stmt, vy_ast.If):
+                nested.extend([stmt.body, stmt.orelse])
+            elif isinstance(stmt, vy_ast.For):
+                nested.append(stmt.body)
+        stack.extend(reversed(nested))
+
+    return statements
+
+
+def _get_fields(node: vy_ast.VyperNode) -> List[str]:
+    # Fields of a node that can hold child nodes. The arguments of a storage read are
+    # not a field of `Assign`, so they are not in `_children`.
+    fields = [i for i in type(node).get_fields() if i not in ("src", "node_source_code")]
+    if isinstance(node, CairoStorageRead):
+        fields.append("args")
+    return fields
+
+
+def get_children(node: vy_ast.VyperNode) -> List[vy_ast.VyperNode]:
+    """
+    Returns the children of a node that are written to Cairo, including the
+    arguments of a `CairoStorageRead`.
+    """
+    children = []
+    for field in _get_fields(node):
+        value = getattr(node, field, None)
+        if isinstance(value, vy_ast.VyperNode):
+            children.append(value)
+        elif isinstance(value, list):
+            children.extend(i for i in value if isinstance(i, vy_ast.VyperNode))
+    return children
+
+
+def replace_child(parent: vy_ast.VyperNode, old_node: vy_ast.VyperNode, new_node: vy_ast.VyperNode):
+    """
+    Replace a child of a node, including the arguments of a `CairoStorageRead` and
+    statements in a list of statements.
+    """
+    for field in _get_fields(parent):
+        value = getattr(parent, field, None)
+        if value is old_node:
+            setattr(parent, field, new_node)
+            break
+        if isinstance(value, list) and any(i is old_node for i in value):
+            value[next(idx for idx, i in enumerate(value) if i is old_node)] = new_node
+            break
+
+    parent._children.discard(old_node)
+    set_parent(new_node, parent)
+
+
+def get_assignment_targets(stmt: vy_ast.VyperNode) -> List[vy_ast.Name]:
+    """
+    Returns the names that are assigned by a statement.
+    """
+    if isinstance(stmt, (CairoAssert, CairoStorageWrite)):
+        return []
+    if not isinstance(stmt, (vy_ast.Assign, vy_ast.AnnAssign, vy_ast.AugAssign, vy_ast.For)):
+        return []
+
+    target = stmt.target
+    if isinstance(target, vy_ast.Tuple):
+        return [i for i in target.elements if isinstance(i, vy_ast.Name)]
+    if isinstance(target, vy_ast.Name):
+        return [target]
+    return []
+
+
+def count_assignments(fn_node: vy_ast.FunctionDef) -> Dict[str, int]:
+    """
+    Returns the number of times that each name is assigned in a function, counting
+    arguments as assigned once.
+
+    Names that are assigned at most once (e.g. temporary variables) have the same
+    value wherever they are visible, and names that are not assigned at all are
+    constants e.g. `TRUE`.
+    """
+    assignments: Dict[str, int] = defaultdict(int)
+    for a in fn_node.args.args:
+        assignments[a.arg] += 1
+
+    for stmt, _ in get_statements(fn_node.body):
+        for t in get_assignment_targets(stmt):
+            assignments[t.id] += 1
+
+    return assignments
+
+
+def get_expressions(stmt: vy_ast.VyperNode) -> List[vy_ast.VyperNode]:
+    """
+    Returns the expression nodes of a statement, excluding nested statements.
+    """
+    if isinstance(stmt, vy_ast.If):
+        roots = [stmt.test]
+    elif isinstance(stmt, vy_ast.For):
+        roots = [stmt.iter]
+    else:
+        roots = get_children(stmt)
+
+    nodes = []
+    stack = list(roots)
+    while stack:
+        n = stack.pop()
+        nodes.append(n)
+        stack.extend(get_children(n))
+
+    return nodes
+
+
+def may_write_storage(stmt: vy_ast.VyperNode) -> bool:
+    """
+    Returns whether a statement calls a function that could write to storage, i.e.
+    a function that is not imported from a library. Nested statements are not checked.
+    """
+    for n in get_expressions(stmt):
+        if not isinstance(n, vy_ast.Call):
+            continue
+
+        func = n.func
+        if isinstance(func, vy_ast.Name) and func.id in IMPORT_DIRECTIVES:
+            continue
+        # Events are emitted with `Event.emit(...)`
+        if isinstance(func, vy_ast.Attribute) and func.attr == "emit":
+            continue
+        return True
+
+    return False
+
+
+def get_storage_name(stmt: vy_ast.VyperNode) -> Optional[str]:
+    """
+    Returns the name of the storage variable that a `CairoStorageRead` reads or a
+    `CairoStorageWrite` writes.
+    """
+    if isinstance(stmt, CairoStorageRead):
+        node = stmt.value
+    elif isinstance(stmt, CairoStorageWrite):
+        node = stmt.target
+    else:
+        return None
+    return node.id if isinstance(node, vy_ast.Name) else None
+
+
+def get_written_storage(stmts: List[vy_ast.VyperNode]) -> Tuple[Set[str], bool]:
+    """
+    Returns the storage variables that are written by a list of statements,
+    including nested statements, and whether they call a function that could write
+    to any storage variable.
+    """
+    written = set()
+    has_call = False
+    for stmt, _ in get_statements(stmts):
+        if isinstance(stmt, CairoStorageWrite):
+            written.add(get_storage_name(stmt))
+        has_call = has_call or may_write_storage(stmt)
+
+    return written, has_call
+
+
+def get_value_key(node: vy_ast.VyperNode, assignments: Dict[str, int]) -> Optional[tuple]:
+    """
+    Returns a key of an expression that is equal for expressions that always have
+    the same value in the function, or None if the expression may change.
+
+    `assignments` is the number of times that each name is assigned in the
+    function, as returned by `count_assignments`.
+    """
+    if isinstance(node, vy_ast.Int):
+        return ("Int", node.value)
+
+    if isinstance(node, vy_ast.Name):
+        if assignments.get(node.id, 0) > 1:
+            return None
+        return ("Name", node.id)
+
+    # `Uint256` literals
+    if (
+        isinstance(node, vy_ast.Call)
+        and isinstance(node.func, vy_ast.Name)
+        and node.func.id == "Uint256"
+        and not node.args
+    ):
+        keywords = []
+        for k in node.keywords:
+            value_key = get_value_key(k.value, assignments)
+            if value_key is None:
+                return None
+            keywords.append((k.arg, value_key))
+        return ("Uint256", tuple(keywords))
+
+    return None
+
+
+def get_storage_key(stmt: vy_ast.VyperNode, assignments: Dict[str, int]) -> Optional[StorageKey]:
+    """
+    Returns the key of the storage slot that a `CairoStorageRead` reads or a
+    `CairoStorageWrite` writes, or None if the arguments may change.
+    """
+    storage_name = get_storage_name(stmt)
+    if storage_name is None:
+        return None
+
+    # The last value of a write is the value that is written, and the others are
+    # the arguments of the storage variable
+    args = stmt.args if isinstance(stmt, CairoStorageRead) else stmt.value[:-1]
+    arg_keys = tuple(get_value_key(a, assignments) for a in args)
+    if None in arg_keys:
+        return None
+    return (storage_name, arg_keys)
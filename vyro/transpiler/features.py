@@ -0,0 +1,79 @@
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+from vyper import ast as vy_ast
+from vyper.semantics.types.indexable.sequence import ArrayDefinition
+
+# Constructs that passes act on, used as `TRIGGERS` of passes
+ASSERT = "assert"
+BLOCK_CONSTANT = "block_constant"
+CONSTRUCTOR = "constructor"
+ENUM = "enum"
+EVENT = "event"
+IF = "if"
+MSG_SENDER = "msg_sender"
+STATIC_ARRAY = "static_array"
+
+
+def _scan_AnnAssign(node: vy_ast.AnnAssign) -> Optional[str]:
+    # Memory arrays are annotated with a subscript e.g. `uint256[3]`
+    if isinstance(node.annotation, vy_ast.Subscript):
+        return STATIC_ARRAY
+    return None
+
+
+def _scan_Attribute(node: vy_ast.Attribute) -> Optional[str]:
+    if not isinstance(node.value, vy_ast.Name):
+        return None
+
+    if node.value.id == "block":
+        return BLOCK_CONSTANT
+    if node.value.id == "msg" and node.attr == "sender":
+        return MSG_SENDER
+    return None
+
+
+def _scan_FunctionDef(node: vy_ast.FunctionDef) -> Optional[str]:
+    if node.name == "__init__":
+        return CONSTRUCTOR
+    return None
+
+
+def _scan_VariableDecl(node: vy_ast.VariableDecl) -> Optional[str]:
+    if isinstance(node._metadata.get("type"), ArrayDefinition):
+        return STATIC_ARRAY
+    return None
+
+
+FEATURE_SCANNERS: Dict[type, Callable[[vy_ast.VyperNode], Optional[str]]] = {
+    vy_ast.AnnAssign: _scan_AnnAssign,
+    vy_ast.Assert: lambda node: ASSERT,
+    vy_ast.Attribute: _scan_Attribute,
+    vy_ast.EnumDef: lambda node: ENUM,
+    vy_ast.EventDef: lambda node: EVENT,
+    vy_ast.FunctionDef: _scan_FunctionDef,
+    vy_ast.If: lambda node: IF,
+    vy_ast.Log: lambda node: EVENT,
+    vy_ast.VariableDecl: _scan_VariableDecl,
+}
+
+
+def scan_features(ast: vy_ast.Module) -> FrozenSet[str]:
+    """
+    Returns the constructs that are present in a module, in a single walk of the AST.
+
+    The scan is run on the Vyper AST before the first pass, so it only detects
+    constructs in the source code and not those created by passes.
+    """
+    features = set()
+    stack: List[vy_ast.VyperNode] = [ast]
+    while stack:
+        node = stack.pop()
+        scanner = FEATURE_SCANNERS.get(type(node))
+        if scanner is not None:
+            feature = scanner(node)
+            if feature is not None:
+                features.add(feature)
+
+        stack.extend(node._children)
+
+    return frozenset(features)
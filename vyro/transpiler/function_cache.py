@@ -0,0 +1,234 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from vyper import ast as vy_ast
+
+from vyro.cairo.import_directives import IMPORT_DIRECTIVES, add_builtin_to_module
+from vyro.cairo.nodes import CairoCachedFunction
+from vyro.cairo.writer import CairoWriter
+
+# Default upper bound for the number of cached functions
+DEFAULT_MAX_ENTRIES = 4096
+
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Local definitions in Cairo e.g. `let x : felt = ...` or `let (x : felt) = ...`
+LOCAL_DEFINITION_RE = re.compile(r"\b(?:let|tempvar|local)\s+\(?\s*([A-Za-z_][A-Za-z0-9_]*)")
+
+# Module-level declarations that functions can reference by name
+DECLARATION_TYPES = (
+    vy_ast.EnumDef,
+    vy_ast.EventDef,
+    vy_ast.InterfaceDef,
+    vy_ast.StructDef,
+    vy_ast.VariableDecl,
+)
+
+
+@dataclass(frozen=True)
+class CachedFunction:
+    """
+    Cairo output of a function.
+
+    Attributes
+    ----------
+    cairo : str
+        The Cairo function.
+    imports : FrozenSet[str]
+        Names in `IMPORT_DIRECTIVES` that are used by the Cairo function.
+    storage_vars : Tuple[str, ...]
+        Storage variables that were added to the module for the function, e.g. for
+        memory arrays.
+    """
+
+    cairo: str
+    imports: FrozenSet[str]
+    storage_vars: Tuple[str, ...]
+
+
+def _get_identifiers(source: str) -> Set[str]:
+    return set(IDENTIFIER_RE.findall(source))
+
+
+def _get_declaration_name(node: vy_ast.VyperNode) -> str:
+    if isinstance(node, vy_ast.VariableDecl):
+        return node.target.id
+    return node.name
+
+
+def _get_signature(node: vy_ast.FunctionDef) -> str:
+    """
+    Returns the source of the decorators, arguments and return type of a function.
+    """
+    parts = [d.node_source_code for d in node.decorator_list]
+    parts.append(node.name)
+    parts.extend(f"{a.arg}: {a.annotation.node_source_code}" for a in node.args.args)
+    if node.returns:
+        parts.append(node.returns.node_source_code)
+    return "\n".join(parts)
+
+
+def get_function_keys(ast: vy_ast.Module) -> Dict[vy_ast.FunctionDef, str]:
+    """
+    Returns the cache key of each function in a module.
+
+    The key covers the source of the function, and the source of the module-level
+    declarations and the signatures of the functions that it references, directly
+    or through other declarations. References are found by name in the source,
+    because constants have already been folded in the AST.
+    """
+    # Source of each declaration that can be referenced by name
+    sources: Dict[str, str] = {}
+    for node in ast.body:
+        if isinstance(node, DECLARATION_TYPES):
+            sources[_get_declaration_name(node)] = node.node_source_code
+        elif isinstance(node, vy_ast.FunctionDef):
+            sources[node.name] = _get_signature(node)
+
+    keys = {}
+    for fn in ast.body:
+        if not isinstance(fn, vy_ast.FunctionDef):
+            continue
+
+        fn_source = "\n".join([_get_signature(fn), fn.node_source_code])
+
+        referenced = set()
+        stack = [fn_source]
+        while stack:
+            for name in _get_identifiers(stack.pop()):
+                if name in sources and name not in referenced and name != fn.name:
+                    referenced.add(name)
+                    stack.append(sources[name])
+
+        h = hashlib.sha256(fn_source.encode())
+        for name in sorted(referenced):
+            h.update(b"\0")
+            h.update(name.encode())
+            h.update(b"\0")
+            h.update(sources[name].encode())
+        keys[fn] = h.hexdigest()
+
+    return keys
+
+
+class FunctionCache:
+    """
+    In-memory cache of the Cairo output of each function, so that only the functions
+    of a contract that have changed need to be transpiled again.
+
+    Entries are keyed by `get_function_keys`. The least recently used entries are
+    evicted first once the cache holds `max_entries` functions.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedFunction]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedFunction]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedFunction):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def apply_function_cache(ast: vy_ast.Module, cache: FunctionCache) -> Dict[vy_ast.FunctionDef, str]:
+    """
+    Replace the functions of a module that are in the cache with placeholders, before
+    the module is transpiled.
+
+    Returns the cache keys of the functions that are left to be transpiled.
+    """
+    keys = get_function_keys(ast)
+
+    hits = {fn: cache.get(key) for fn, key in keys.items()}
+
+    # `ConstructorHandler` converts the types of immutables and replaces references
+    # to them in other functions while visiting the constructor, so the constructor
+    # is always transpiled if there are immutables
+    if any(isinstance(i, vy_ast.VariableDecl) and i.is_immutable for i in ast.body):
+        for fn in hits:
+            if fn.name == "__init__":
+                hits[fn] = None
+
+    for fn, entry in hits.items():
+        if entry is None:
+            continue
+
+        placeholder = CairoCachedFunction(
+            node_id=fn.node_id,
+            name=fn.name,
+            cairo=entry.cairo,
+            imports=entry.imports,
+            storage_vars=entry.storage_vars,
+        )
+        ast.body[ast.body.index(fn)] = placeholder
+        ast._children.discard(fn)
+
+    return {fn: key for fn, key in keys.items() if hits[fn] is None}
+
+
+def update_function_cache(
+    ast: vy_ast.Module,
+    cache: FunctionCache,
+    keys: Dict[vy_ast.FunctionDef, str],
+    body: List[vy_ast.VyperNode],
+):
+    """
+    Add the imports of cached functions to a transpiled module, and store the Cairo
+    output of the functions that were transpiled in the cache.
+
+    `body` is the body of the module before it was transpiled.
+    """
+    for node in ast.body:
+        if isinstance(node, CairoCachedFunction):
+            for name in sorted(node.imports):
+                add_builtin_to_module(ast, name)
+
+    # Storage variables that were added to the module by passes, keyed by the name
+    # of the storage variable in Cairo (see `generate_storage_var_stub`)
+    declared = {id(i) for i in body}
+    added_storage_vars = {}
+    for node in ast.body:
+        if isinstance(node, vy_ast.VariableDecl) and id(node) not in declared:
+            writer = CairoWriter()
+            writer.write(node)
+            added_storage_vars[f"{node.target.id}_STORAGE"] = writer.storage_vars[0]
+
+    # Names that are defined in the module, and therefore not imported
+    module_names = {_get_declaration_name(i) for i in body if isinstance(i, DECLARATION_TYPES)}
+    module_names.update(
+        i.name for i in body if isinstance(i, (vy_ast.FunctionDef, CairoCachedFunction))
+    )
+
+    for fn, key in keys.items():
+        writer = CairoWriter()
+        writer.write(fn)
+        cairo = writer.functions[0]
+
+        # An identifier that is used but not defined in the function or the module
+        # must be imported
+        identifiers = _get_identifiers(cairo)
+        defined = module_names | {fn.name} | {a.arg for a in fn.args.args}
+        defined.update(LOCAL_DEFINITION_RE.findall(cairo))
+        entry = CachedFunction(
+            cairo=cairo,
+            imports=frozenset(i for i in identifiers - defined if i in IMPORT_DIRECTIVES),
+            storage_vars=tuple(v for k, v in added_storage_vars.items() if k in identifiers),
+        )
+        cache.put(key, entry)
@@ -0,0 +1,292 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from vyper import ast as vy_ast
+from vyper.ast.nodes import _node_filter, _sort_nodes
+
+# Key of the index in the metadata of the `Module` node
+NODE_INDEX_KEY = "node_index"
+
+
+def get_root(node: vy_ast.VyperNode) -> vy_ast.VyperNode:
+    """
+    Returns the topmost ancestor of a node.
+    """
+    while getattr(node, "_parent", None) is not None:
+        node = node._parent
+    return node
+
+
+def get_node_index(node: vy_ast.VyperNode) -> Optional["NodeIndex"]:
+    """
+    Returns the index of the module that a node belongs to, if there is one.
+    """
+    root = get_root(node)
+    if isinstance(root, vy_ast.Module):
+        return root._metadata.get(NODE_INDEX_KEY)
+    return None
+
+
+# Nodes of a bucket of the index, keyed by the top-level node that they are under
+# and then by identity, because nodes compare equal by their fields
+_Bucket = Dict[Optional[int], Dict[int, vy_ast.VyperNode]]
+
+
+def _new_bucket() -> _Bucket:
+    return defaultdict(dict)
+
+
+class NodeIndex:
+    """
+    Index of the nodes of a module by node class, by `Name.id` and by `Attribute.attr`.
+
+    The index returns the same results as `VyperNode.get_descendants`. Nodes are
+    grouped by the top-level nodes of the module (e.g. functions) that they are
+    under, so that a search within a function only checks the candidates in that
+    function instead of the whole module. It is kept up to date as follows:
+      - Nodes are added to the index when they are attached to the module with
+        `set_parent`, `replace_in_tree` or `add_to_body` in `vyro.transpiler.utils`.
+      - Nodes that are removed from the module are not removed from the index right
+        away. Instead, each candidate is checked to still be reachable from the node
+        being searched when the index is queried, and removed if it is not.
+      - `reindex` must be called after changing the `id` of a `Name` node or the
+        `attr` of an `Attribute` node.
+
+    Reachability follows the `_children` of each node, as `get_descendants` does.
+    The `_parent` of a node cannot be relied on because some nodes are shared between
+    parents (e.g. after constant folding), so the index records the parents that each
+    node has been seen under instead.
+    """
+
+    def __init__(self, module: vy_ast.Module) -> None:
+        self.module = module
+
+        self._by_type: Dict[type, _Bucket] = defaultdict(_new_bucket)
+        self._by_name: Dict[str, _Bucket] = defaultdict(_new_bucket)
+        self._by_attr: Dict[str, _Bucket] = defaultdict(_new_bucket)
+        self._parents: Dict[int, Dict[int, vy_ast.VyperNode]] = defaultdict(dict)
+
+        # Top-level nodes that each node has been seen under, by identity. Nodes
+        # whose top-level node is unknown are grouped under None, and are candidates
+        # for every search.
+        self._tops: Dict[int, Set[Optional[int]]] = {}
+
+        # Key each `Name` and `Attribute` node was indexed under
+        self._keys: Dict[int, str] = {}
+
+        self.add(module)
+
+    @classmethod
+    def attach(cls, module: vy_ast.Module) -> "NodeIndex":
+        """
+        Build an index for a module, and store it in the metadata of the module.
+        """
+        index = cls(module)
+        module._metadata[NODE_INDEX_KEY] = index
+        return index
+
+    def add(self, node: vy_ast.VyperNode, parent: Optional[vy_ast.VyperNode] = None):
+        """
+        Add a node and its descendants to the index.
+        """
+        stack = [(node, parent)]
+        while stack:
+            n, p = stack.pop()
+            if p is not None:
+                self._parents[id(n)][id(p)] = p
+
+            if p is self.module:
+                tops = {id(n)}
+            elif p is not None:
+                tops = self._tops.get(id(p), {None})
+            else:
+                tops = {None}
+
+            self._add_node(n, tops)
+            stack.extend((c, n) for c in n._children)
+
+    def _get_buckets(self, node: vy_ast.VyperNode) -> List[_Bucket]:
+        buckets = [self._by_type[type(node)]]
+        key = self._keys.get(id(node))
+        if key is not None:
+            buckets.append((self._by_name if isinstance(node, vy_ast.Name) else self._by_attr)[key])
+        return buckets
+
+    def _add_node(self, node: vy_ast.VyperNode, tops: Set[Optional[int]]):
+        key = id(node)
+        if key not in self._tops:
+            self._tops[key] = set()
+            if isinstance(node, vy_ast.Name):
+                self._keys[key] = node.id
+            elif isinstance(node, vy_ast.Attribute):
+                self._keys[key] = node.attr
+
+        node_tops = self._tops[key]
+        for bucket in self._get_buckets(node):
+            for top in tops - node_tops:
+                bucket[top][key] = node
+        node_tops |= tops
+
+    def _unindex_node(self, node: vy_ast.VyperNode):
+        key = id(node)
+        for bucket in self._get_buckets(node):
+            for top in self._tops.get(key, ()):
+                bucket[top].pop(key, None)
+        self._keys.pop(key, None)
+
+    def _remove_node(self, node: vy_ast.VyperNode):
+        self._unindex_node(node)
+
+        key = id(node)
+        self._tops.pop(key, None)
+        self._parents.pop(key, None)
+        for c in node._children:
+            parents = self._parents.get(id(c))
+            if parents is not None:
+                parents.pop(key, None)
+
+    def reindex(self, node: vy_ast.VyperNode):
+        """
+        Update the index after the `id` of a `Name` node or the `attr` of an
+        `Attribute` node has changed.
+        """
+        tops = self._tops.get(id(node))
+        if tops is None:
+            return
+
+        self._unindex_node(node)
+        del self._tops[id(node)]
+        self._add_node(node, tops)
+
+    def _get_candidates(
+        self,
+        node_type: Union[type, Tuple[type, ...], None],
+        filters: Optional[dict],
+        tops: Optional[Set[Optional[int]]],
+    ) -> List[vy_ast.VyperNode]:
+        buckets: List[_Bucket] = []
+        if filters and node_type is vy_ast.Name and isinstance(filters.get("id"), str):
+            buckets.append(self._by_name.get(filters["id"], {}))
+        elif filters and node_type is vy_ast.Attribute and isinstance(filters.get("attr"), str):
+            buckets.append(self._by_attr.get(filters["attr"], {}))
+        else:
+            for typ, bucket in self._by_type.items():
+                if node_type is None or issubclass(typ, node_type):
+                    buckets.append(bucket)
+
+        # A node that is under several top-level nodes is only returned once
+        candidates: Dict[int, vy_ast.VyperNode] = {}
+        for bucket in buckets:
+            if tops is None:
+                groups = list(bucket.values())
+            else:
+                groups = [bucket[t] for t in (*tops, None) if t in bucket]
+            for nodes in groups:
+                candidates.update(nodes)
+        return list(candidates.values())
+
+    def get_descendants(
+        self,
+        node: vy_ast.VyperNode,
+        node_type: Union[type, Tuple[type, ...], None] = None,
+        filters: Optional[dict] = None,
+        include_self: bool = False,
+        reverse: bool = False,
+    ) -> List[vy_ast.VyperNode]:
+        """
+        Equivalent of `node.get_descendants(node_type, filters, include_self, reverse)`.
+        """
+        reachability = _Reachability(self, node)
+        if not reachability.get(node)[0]:
+            # Only nodes in the module are indexed
+            return node.get_descendants(node_type, filters, include_self, reverse)
+
+        # Descendants of a node are under the same top-level nodes, unless the node
+        # is the module itself
+        tops = None if node is self.module else self._tops.get(id(node))
+
+        result = []
+        for c in self._get_candidates(node_type, filters, tops):
+            if c is node and not include_self:
+                continue
+
+            in_module, paths = reachability.get(c)
+            if not in_module:
+                # The node has been removed since it was indexed
+                self._remove_node(c)
+                continue
+
+            if c is node:
+                paths = 1
+            if not paths or not _node_filter(c, filters):
+                continue
+
+            if node_type is None or isinstance(c, node_type):
+                result.extend([c] * paths)
+
+        result = _sort_nodes(result)
+        if reverse:
+            result.reverse()
+        return result
+
+
+class _Reachability:
+    """
+    Memoized check of whether nodes can be reached from the module through the
+    `_children` of each node, and of the number of paths from a given ancestor.
+
+    A node that is a child of several nodes is returned once for each path by
+    `get_descendants`, so the number of paths is needed to return the same results.
+    """
+
+    def __init__(self, index: NodeIndex, ancestor: vy_ast.VyperNode) -> None:
+        self.index = index
+        self.ancestor = ancestor
+        self._results: Dict[int, Tuple[bool, int]] = {
+            id(index.module): (True, 1 if index.module is ancestor else 0)
+        }
+        self._children: Dict[int, set] = {}
+
+    def _get_parents(self, node: vy_ast.VyperNode) -> List[vy_ast.VyperNode]:
+        # Parents that still have `node` as a child
+        parents = []
+        for p in self.index._parents.get(id(node), {}).values():
+            children = self._children.get(id(p))
+            if children is None:
+                children = self._children[id(p)] = {id(i) for i in p._children}
+            if id(node) in children:
+                parents.append(p)
+        return parents
+
+    def get(self, node: vy_ast.VyperNode) -> Tuple[bool, int]:
+        """
+        Returns whether a node can be reached from the module, and the number of
+        paths to the node from the ancestor.
+        """
+        results = self._results
+        visiting = set()
+        stack = [node]
+        while stack:
+            n = stack[-1]
+            if id(n) in results:
+                stack.pop()
+                continue
+
+            parents = self._get_parents(n)
+            pending = [p for p in parents if id(p) not in results and id(p) not in visiting]
+            if pending:
+                visiting.add(id(n))
+                stack.extend(pending)
+                continue
+
+            stack.pop()
+            visiting.discard(id(n))
+            parent_results = [results.get(id(p), (False, 0)) for p in parents]
+            in_module = any(r[0] for r in parent_results)
+            if n is self.ancestor:
+                paths = 1
+            else:
+                paths = sum(r[1] for r in parent_results if r[0])
+            results[id(n)] = (in_module, paths if in_module else 0)
+
+        return results[id(node)]
@@ -14,6 +14,10 @@ class ArgsConverterVisitor(BaseVisitor):
     Retrieve the type for a `vy_ast.arg` node and set it to its Cairo type
     """
 
+    NODE_TYPES = (vy_ast.arg,)
+    # The enum converter sets the type of arguments that are enums
+    RUNS_AFTER = ("I", "EC")
+
     def visit_arg(self, node: vy_ast.arg, ast: vy_ast.Module, context: ASTContext):
         if node._metadata.get("type") is not None:
             return
@@ -4,6 +4,7 @@ from vyro.cairo.import_directives import add_builtin_to_module
 from vyro.cairo.nodes import CairoAssert
 from vyro.cairo.types import FeltDefinition
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import ASSERT
 from vyro.transpiler.utils import (
     create_assign_node,
     create_name_node,
@@ -15,6 +16,13 @@ from vyro.transpiler.visitor import BaseVisitor
 
 
 class AssertHandlerVisitor(BaseVisitor):
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # Statements that earlier passes insert for the condition must precede the
+    # assignment of the condition, and the constructor handler must not mistake
+    # the assignment for an immutable
+    RUNS_AFTER = ("I", "SA", "EC", "BC", "Bf", "Ch")
+    TRIGGERS = (ASSERT,)
+
     def visit_Assert(self, node: vy_ast.Assert, ast: vy_ast.Module, context: ASTContext):
         # Assign `test` condition to the RHS of an `Assign` node, to be inserted
         # before the `with_attr` block.
@@ -22,17 +30,17 @@ class AssertHandlerVisitor(BaseVisitor):
         node._children.remove(condition)
 
         temp_name_node = create_name_node(context)
-        temp_name_node._metadata["type"] = FeltDefinition()
+        temp_name_node._metadata["type"] = FeltDefinition.get_instance()
 
         assign_node = create_assign_node(context, [temp_name_node], condition)
-        assign_node._metadata["type"] = FeltDefinition()
+        assign_node._metadata["type"] = FeltDefinition.get_instance()
 
         scope_node, scope_node_body = get_scope(node)
         insert_statement_before(assign_node, node, scope_node, scope_node_body)
 
         # Generate a new `test` condition where we assert newly assigned name node is True
         cairo_assert_target = create_name_node(context, name=temp_name_node.id)
-        temp_name_node._metadata["type"] = FeltDefinition()
+        temp_name_node._metadata["type"] = FeltDefinition.get_instance()
 
         # Generate nodes for `CairoAssert`
         cairo_assert_value = create_name_node(context, name="TRUE")
@@ -12,6 +12,7 @@ from vyro.transpiler.utils import (
     get_scope,
     get_stmt_node,
     insert_statement_before,
+    replace_in_tree,
 )
 from vyro.transpiler.visitor import BaseVisitor
 
@@ -41,7 +42,7 @@ class BlockConstantHandlerVisitor(BaseVisitor):
 
         # Insert syscall statement before current statement
         temp_name_node = create_name_node(context)
-        temp_name_node._metadata["type"] = FeltDefinition()
+        temp_name_node._metadata["type"] = FeltDefinition.get_instance()
 
         syscall_node = create_call_node(context, syscall_name)
         assign_node = create_assign_node(context, [temp_name_node], syscall_node)
@@ -66,4 +67,4 @@ class BlockConstantHandlerVisitor(BaseVisitor):
 
         # Replace builtin constant with `Name` node
         temp_name_node_dup = create_name_node(context, name=temp_name_node.id)
-        ast.replace_in_tree(node, temp_name_node_dup)
+        replace_in_tree(ast, node, temp_name_node_dup)
@@ -1,6 +1,7 @@
 from vyper import ast as vy_ast
 
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import BLOCK_CONSTANT, MSG_SENDER
 from vyro.transpiler.passes.builtin_constants.block_constant_handler import (
     BlockConstantHandlerVisitor,
 )
@@ -11,6 +12,8 @@ PASSES = [MsgSenderConverterVisitor(), BlockConstantHandlerVisitor()]
 
 
 class BuiltinConstantHandlerVisitor(BaseVisitor):
+    TRIGGERS = (BLOCK_CONSTANT, MSG_SENDER)
+
     def visit_Module(self, node: vy_ast.Module, ast: vy_ast.Module, context: ASTContext):
         for v in PASSES:
             v.visit(node, ast, context)
@@ -7,7 +7,9 @@ from vyro.transpiler.utils import (
     create_assign_node,
     create_call_node,
     create_name_node,
+    get_descendants,
     insert_statement_before,
+    replace_in_tree,
 )
 from vyro.transpiler.visitor import BaseVisitor
 
@@ -19,20 +21,20 @@ class MsgSenderConverterVisitor(BaseVisitor):
 
     def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
         # Search for `msg.sender`
-        nodes_to_replace = node.get_descendants(
-            vy_ast.Attribute, {"attr": "sender", "value.id": "msg"}, reverse=True
+        nodes_to_replace = get_descendants(
+            node, vy_ast.Attribute, {"attr": "sender", "value.id": "msg"}, reverse=True
         )
 
         # If found, create a new `Assign` statement to `get_caller_address`
         if len(nodes_to_replace) > 0:
             temp_name_node = create_name_node(context)
-            temp_name_node._metadata["type"] = FeltDefinition()
+            temp_name_node._metadata["type"] = FeltDefinition.get_instance()
 
             syscall_node = create_call_node(context, "get_caller_address")
-            syscall_node.func._metadata["type"] = FeltDefinition()
+            syscall_node.func._metadata["type"] = FeltDefinition.get_instance()
 
             wrapped_call = create_assign_node(context, [temp_name_node], syscall_node)
-            wrapped_call._metadata["type"] = FeltDefinition()
+            wrapped_call._metadata["type"] = FeltDefinition.get_instance()
 
             add_builtin_to_module(ast, "get_caller_address")
 
@@ -45,10 +47,10 @@ class MsgSenderConverterVisitor(BaseVisitor):
             temp_name_reference_node = create_name_node(context, name=temp_name_node_ref)
 
             first_call_node = nodes_to_replace.pop()
-            ast.replace_in_tree(first_call_node, temp_name_node)
+            replace_in_tree(ast, first_call_node, temp_name_node)
 
             # Replace all descendants of the FunctionDef node with the replace variable
 
             for n in nodes_to_replace:
                 temp_name_reference_node = create_name_node(context, name=temp_name_node_ref)
-                ast.replace_in_tree(n, temp_name_reference_node)
+                replace_in_tree(ast, n, temp_name_reference_node)
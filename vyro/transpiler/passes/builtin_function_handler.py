@@ -1,7 +1,7 @@
 import copy
+from functools import lru_cache
 
 from vyper import ast as vy_ast
-from vyper.builtin_functions.functions import get_builtin_functions
 from vyper.semantics.types.abstract import IntegerAbstractType, SignedIntegerAbstractType
 from vyper.utils import int_bounds
 
@@ -19,11 +19,20 @@ from vyro.transpiler.utils import (
     get_stmt_node,
     insert_statement_after,
     insert_statement_before,
+    reindex,
+    replace_in_tree,
     set_parent,
 )
 from vyro.transpiler.visitor import BaseVisitor
 
-VY_BUILTIN_FNS = get_builtin_functions()
+
+@lru_cache(maxsize=None)
+def get_vy_builtin_fns():
+    # Imported on first use instead of at import time, as the Vyper builtin
+    # functions module instantiates every builtin function and its code generator.
+    from vyper.builtin_functions.functions import get_builtin_functions
+
+    return get_builtin_functions()
 
 
 class BuiltinFunctionHandlerVisitor(BaseVisitor):
@@ -36,6 +45,7 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
 
         # Replace `Call` with `mul256`
         node.func.id = "mul256"
+        reindex(node.func)
         add_builtin_to_module(ast, "mul256")
 
         # Cast denom as Uint256
@@ -60,7 +70,7 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
         denom_node = create_call_node(context, "Uint256", keywords=keywords)
 
         denom_str_node = node.args[1]
-        ast.replace_in_tree(denom_str_node, denom_node)
+        replace_in_tree(ast, denom_str_node, denom_node)
 
     def _handle_convert(self, node: vy_ast.Call, ast: vy_ast.Module, context: ASTContext):
         in_vy_typ = node.args[0]._metadata.get("type")
@@ -92,12 +102,12 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
 
                 # Replace call node with temporary name node
                 temp_name_node_dup = create_name_node(context, name=temp_name_node.id)
-                ast.replace_in_tree(node, temp_name_node_dup)
+                replace_in_tree(ast, node, temp_name_node_dup)
 
             else:
                 # Unwrap `convert` call
                 src = copy.deepcopy(node.args[0])
-                ast.replace_in_tree(node, src)
+                replace_in_tree(ast, node, src)
 
                 if in_vy_typ._bits > out_vy_typ._bits:
                     # Get bound values
@@ -138,12 +148,12 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
         replacement_node = vy_ast.Int(node_id=context.reserve_id(), value=0)
 
         if isinstance(cairo_typ, FeltDefinition):
-            replacement_node._metadata["type"] = FeltDefinition()
+            replacement_node._metadata["type"] = FeltDefinition.get_instance()
         elif isinstance(cairo_typ, CairoUint256Definition):
-            replacement_node._metadata["type"] = CairoUint256Definition()
+            replacement_node._metadata["type"] = CairoUint256Definition.get_instance()
 
         # Replace `Call` node
-        ast.replace_in_tree(node, replacement_node)
+        replace_in_tree(ast, node, replacement_node)
 
     def _handle_max(self, node: vy_ast.Call, ast: vy_ast.Module, context: ASTContext):
         self._handle_minmax(node, ast, context, "max")
@@ -170,7 +180,7 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
         for a in node.args:
             set_parent(a, wrapped_call_node)
 
-        ast.replace_in_tree(node, wrapped_call_node)
+        replace_in_tree(ast, node, wrapped_call_node)
 
     def _handle_min(self, node: vy_ast.Call, ast: vy_ast.Module, context: ASTContext):
         self._handle_minmax(node, ast, context, "min")
@@ -181,7 +191,7 @@ class BuiltinFunctionHandlerVisitor(BaseVisitor):
         if not hasattr(call_typ, "_id"):
             return
 
-        if call_typ._id in VY_BUILTIN_FNS:
+        if call_typ._id in get_vy_builtin_fns():
             handle_fn = getattr(self, f"_handle_{call_typ._id}", None)
             if handle_fn is None:
                 raise UnsupportedFeature(
@@ -7,25 +7,28 @@ from vyro.transpiler.visitor import BaseVisitor
 
 
 class CairoImporterVisitor(BaseVisitor):
-    def visit(self, node, ast, context):
-        type_ = node._metadata.get("type")
-        if isinstance(type_, CairoUint256Definition):
-            add_builtin_to_module(ast, "Uint256")
+    NODE_TYPES = (vy_ast.VyperNode,)
 
-        super().visit(node, ast, context)
+    def __init__(self) -> None:
+        self.is_uint256_used = False
 
-    def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
-        fn_typ = node._metadata.get("type")
+    def visit(self, node, ast, context):
+        self.visit_node(node, ast, context)
+        super().visit(node, ast, context)
 
-        return_typ = fn_typ.return_type
-        if isinstance(return_typ, CairoUint256Definition):
-            add_builtin_to_module(ast, "Uint256")
+    def visit_node(self, node: vy_ast.VyperNode, ast: vy_ast.Module, context: ASTContext):
+        type_ = node._metadata.get("type")
+        if isinstance(type_, CairoUint256Definition):
+            self.is_uint256_used = True
 
-        super().visit_FunctionDef(node, ast, context)
+        if isinstance(node, vy_ast.FunctionDef):
+            return_typ = type_.return_type
+            if isinstance(return_typ, CairoUint256Definition):
+                self.is_uint256_used = True
 
-    def visit_Module(self, node: vy_ast.Module, ast: vy_ast.Module, context: ASTContext):
+    def finish(self, ast: vy_ast.Module, context: ASTContext):
         # Add import for hash builtin
         add_builtin_to_module(ast, "HashBuiltin")
 
-        for i in node.body:
-            self.visit(i, ast, context)
+        if self.is_uint256_used:
+            add_builtin_to_module(ast, "Uint256")
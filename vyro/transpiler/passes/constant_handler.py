@@ -1,10 +1,12 @@
+from typing import Any, Callable, Dict, Tuple
+
 from vyper import ast as vy_ast
 from vyper.utils import bytes_to_int, hex_to_int
 
 from vyro.cairo.import_directives import add_builtin_to_module
 from vyro.exceptions import FeltOverflowException
 from vyro.transpiler.context import ASTContext
-from vyro.transpiler.utils import convert_node_type_definition, create_name_node
+from vyro.transpiler.utils import convert_node_type_definition, create_name_node, replace_in_tree
 from vyro.transpiler.visitor import BaseVisitor
 from vyro.utils.utils import CAIRO_PRIME
 
@@ -14,35 +16,37 @@ STR_LIMIT = 31
 class ConstantHandlerVisitor(BaseVisitor):
     """
     Convert constant values to their integer equivalent.
+
+    Each literal is converted when it is visited, and the converted value is cached
+    so that literals with the same value are only converted and checked once.
     """
 
+    def __init__(self) -> None:
+        # Converted values of the literals visited so far, keyed by class and value
+        self._converted: Dict[Tuple[type, Any], Any] = {}
+
     def _assert_valid_felt(self, node: vy_ast.Constant, int_value: int):
         if int_value > CAIRO_PRIME:
             raise FeltOverflowException(
                 f"Value of constant ({node.value}) exceeds maximum felt value ({CAIRO_PRIME})", node
             )
 
-    def visit_Bytes(self, node: vy_ast.Bytes, ast: vy_ast.Module, context: ASTContext):
-        byte_value = node.value
-        int_value = bytes_to_int(byte_value)
+    def _get_int_value(self, node: vy_ast.Constant, convert_fn: Callable[[Any], int]) -> int:
+        key = (type(node), node.value)
+        int_value = self._converted.get(key)
+        if int_value is None:
+            int_value = convert_fn(node.value)
+            self._assert_valid_felt(node, int_value)
+            self._converted[key] = int_value
+        return int_value
 
-        self._assert_valid_felt(node, int_value)
-
-        # Search for folded nodes
-        for n in ast.get_descendants(vy_ast.Bytes, {"value": byte_value}, reverse=True):
-            replacement_int = vy_ast.Int.from_node(n, value=int_value)
-            ast.replace_in_tree(n, replacement_int)
+    def visit_Bytes(self, node: vy_ast.Bytes, ast: vy_ast.Module, context: ASTContext):
+        int_value = self._get_int_value(node, bytes_to_int)
+        replace_in_tree(ast, node, vy_ast.Int.from_node(node, value=int_value))
 
     def visit_Hex(self, node: vy_ast.Hex, ast: vy_ast.Module, context: ASTContext):
-        hex_value = node.value
-        int_value = hex_to_int(hex_value)
-
-        self._assert_valid_felt(node, int_value)
-
-        # Search for folded nodes
-        for n in ast.get_descendants(vy_ast.Hex, {"value": hex_value}, reverse=True):
-            replacement_int = vy_ast.Int.from_node(node, value=int_value)
-            ast.replace_in_tree(n, replacement_int)
+        int_value = self._get_int_value(node, hex_to_int)
+        replace_in_tree(ast, node, vy_ast.Int.from_node(node, value=int_value))
 
     def visit_Int(self, node: vy_ast.Int, ast: vy_ast.Module, context: ASTContext):
         int_value = node.value
@@ -62,17 +66,15 @@ class ConstantHandlerVisitor(BaseVisitor):
     def visit_NameConstant(
         self, node: vy_ast.NameConstant, ast: vy_ast.Module, context: ASTContext
     ):
-        bool_value = node.value
-
-        # Convert boolean value to string
-        bool_str = str(bool_value).upper()
-
-        add_builtin_to_module(ast, bool_str)
-
-        # Search for folded nodes
-        for n in ast.get_descendants(vy_ast.NameConstant, {"value": bool_value}, reverse=True):
-            replacement_node = create_name_node(context, name=bool_str)
-            ast.replace_in_tree(n, replacement_node)
+        key = (type(node), node.value)
+        bool_str = self._converted.get(key)
+        if bool_str is None:
+            # Convert boolean value to string
+            bool_str = self._converted[key] = str(node.value).upper()
+            add_builtin_to_module(ast, bool_str)
+
+        replacement_node = create_name_node(context, name=bool_str)
+        replace_in_tree(ast, node, replacement_node)
 
     def visit_Str(self, node: vy_ast.Str, ast: vy_ast.Module, context: ASTContext):
         str_value = node.value
@@ -2,11 +2,21 @@ from vyper import ast as vy_ast
 
 from vyro.cairo.types import FeltDefinition
 from vyro.transpiler.context import ASTContext
-from vyro.transpiler.utils import create_name_node, get_cairo_type, set_parent
+from vyro.transpiler.features import CONSTRUCTOR
+from vyro.transpiler.symbol_table import IMMUTABLE, get_symbol_table
+from vyro.transpiler.utils import (
+    create_name_node,
+    get_ancestor,
+    get_cairo_type,
+    replace_in_tree,
+    set_parent,
+)
 from vyro.transpiler.visitor import BaseVisitor
 
 
 class ConstructorHandler(BaseVisitor):
+    TRIGGERS = (CONSTRUCTOR,)
+
     def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
         fn_typ = node._metadata.get("type")
 
@@ -15,6 +25,8 @@ class ConstructorHandler(BaseVisitor):
             return
 
         # Change `__init__` to `constructor`
+        symbol_table = get_symbol_table(ast)
+        symbol_table.rename(symbol_table.get(node.name), "constructor")
         node.name = "constructor"
 
         # Filter for immutable declarations and visit
@@ -28,15 +40,14 @@ class ConstructorHandler(BaseVisitor):
     def visit_Assign(self, node: vy_ast.Assign, ast: vy_ast.Module, context: ASTContext):
         # Check if it is an immutable
         varname = node.target.id
-        is_immutable = ast.get_descendants(
-            vy_ast.VariableDecl, {"is_immutable": True, "target.id": varname}
-        )
+        symbol_table = get_symbol_table(ast)
+        symbol = symbol_table.get(varname)
 
-        if len(is_immutable) == 0:
+        if symbol is None or symbol.kind != IMMUTABLE:
             return
 
         # Get type
-        var_decl = is_immutable.pop()
+        var_decl = symbol.node
         vy_typ = var_decl._metadata["type"]
         cairo_typ = get_cairo_type(vy_typ)
 
@@ -47,7 +58,7 @@ class ConstructorHandler(BaseVisitor):
         node._children.remove(node.target)
 
         self_node = create_name_node(context, name="self")
-        self_node._metadata["type"] = FeltDefinition()
+        self_node._metadata["type"] = FeltDefinition.get_instance()
 
         attribute_node = vy_ast.Attribute(
             node_id=context.reserve_id(), attr=varname, value=self_node, ast_type="Attribute"
@@ -62,29 +73,22 @@ class ConstructorHandler(BaseVisitor):
         # Replace subsequent references of immutable variable with `self.varname`
         # to make use of the storage var pass to read from storage
 
-        contract_fns = ast.get_descendants(vy_ast.FunctionDef)
-
-        for fn in contract_fns:
-            fn_typ = fn._metadata.get("type")
+        immutable_references = symbol_table.get_references(symbol)
 
+        for i in immutable_references:
             # Skip constructor because it has been handled
-            if fn_typ.is_constructor:
+            fn_node = get_ancestor(i, vy_ast.FunctionDef)
+            if fn_node is None or fn_node._metadata["type"].is_constructor:
                 continue
 
-            immutable_references = fn.get_descendants(vy_ast.Name, {"id": varname})
-
-            for i in immutable_references:
-                self_node = create_name_node(context, name="self")
-                self_node._metadata["type"] = FeltDefinition()
+            self_node = create_name_node(context, name="self")
+            self_node._metadata["type"] = FeltDefinition.get_instance()
 
-                attribute_node = vy_ast.Attribute(
-                    node_id=context.reserve_id(),
-                    attr=varname,
-                    value=self_node,
-                    ast_type="Attribute",
-                )
-                attribute_node._metadata["type"] = cairo_typ
+            attribute_node = vy_ast.Attribute(
+                node_id=context.reserve_id(), attr=varname, value=self_node, ast_type="Attribute"
+            )
+            attribute_node._metadata["type"] = cairo_typ
 
-                set_parent(self_node, attribute_node)
+            set_parent(self_node, attribute_node)
 
-                ast.replace_in_tree(i, attribute_node)
+            replace_in_tree(ast, i, attribute_node)
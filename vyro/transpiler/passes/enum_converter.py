@@ -1,18 +1,25 @@
+from typing import Dict, Tuple
+
 from vyper import ast as vy_ast
 from vyper.semantics.types.user.enum import EnumDefinition
 
 from vyro.cairo.import_directives import add_builtin_to_module
-from vyro.cairo.types import CairoUint256Definition, FeltDefinition
+from vyro.cairo.types import CairoTypeDefinition, CairoUint256Definition, FeltDefinition
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import ENUM
+from vyro.transpiler.symbol_table import CONSTANT, Symbol, get_symbol_table
 from vyro.transpiler.utils import (
     add_implicit_to_function,
     create_assign_node,
     create_call_node,
     create_name_node,
     get_cairo_type,
+    get_descendants,
     get_scope,
     get_stmt_node,
     insert_statement_before,
+    reindex,
+    replace_in_tree,
     set_parent,
 )
 from vyro.transpiler.visitor import BaseVisitor
@@ -24,9 +31,12 @@ class EnumConverterVisitor(BaseVisitor):
     of enums into bitwise operations.
 
     Enums with 251 or less members are converted to felts. Otherwise, they are
-    converted to Uint256.
+    converted to Uint256. The value of each member is declared as a module-level
+    constant, and references to members are replaced with the constant.
     """
 
+    TRIGGERS = (ENUM,)
+
     def visit(self, node: vy_ast.VyperNode, ast: vy_ast.Module, context: ASTContext):
         vyper_typ = node._metadata.get("type")
         if isinstance(vyper_typ, EnumDefinition):
@@ -82,16 +92,16 @@ class EnumConverterVisitor(BaseVisitor):
         bitwise_and_name_node_dup = create_name_node(context, name=bitwise_and_name_node.id)
 
         is_zero_name_node = create_name_node(context)
-        is_zero_name_node._metadata["type"] = FeltDefinition()
+        is_zero_name_node._metadata["type"] = FeltDefinition.get_instance()
 
         wrapped_is_zero_call = create_call_node(
             context, is_zero_op, args=[bitwise_and_name_node_dup]
         )
         set_parent(bitwise_and_name_node_dup, wrapped_is_zero_call)
-        wrapped_is_zero_call._metadata["type"] = FeltDefinition()
+        wrapped_is_zero_call._metadata["type"] = FeltDefinition.get_instance()
 
         is_zero_assign = create_assign_node(context, [is_zero_name_node], wrapped_is_zero_call)
-        is_zero_assign._metadata["type"] = FeltDefinition()
+        is_zero_assign._metadata["type"] = FeltDefinition.get_instance()
 
         insert_statement_before(is_zero_assign, stmt_node, scope_node, scope_node_body)
 
@@ -100,82 +110,84 @@ class EnumConverterVisitor(BaseVisitor):
             is_zero_name_node_dup = create_name_node(context, name=is_zero_name_node.id)
 
             is_zero_name_node = create_name_node(context)
-            is_zero_name_node._metadata["type"] = FeltDefinition()
+            is_zero_name_node._metadata["type"] = FeltDefinition.get_instance()
 
             wrapped_is_zero_call = create_call_node(
                 context, "vyro_is_zero", args=[is_zero_name_node_dup]
             )
             add_builtin_to_module(ast, "vyro_is_zero")
             set_parent(is_zero_name_node_dup, wrapped_is_zero_call)
-            wrapped_is_zero_call._metadata["type"] = FeltDefinition()
+            wrapped_is_zero_call._metadata["type"] = FeltDefinition.get_instance()
 
             is_zero_assign = create_assign_node(context, [is_zero_name_node], wrapped_is_zero_call)
-            is_zero_assign._metadata["type"] = FeltDefinition()
+            is_zero_assign._metadata["type"] = FeltDefinition.get_instance()
 
             insert_statement_before(is_zero_assign, stmt_node, scope_node, scope_node_body)
 
         replacement_name_node = create_name_node(context, name=is_zero_name_node.id)
-        replacement_name_node._metadata["type"] = FeltDefinition()
+        replacement_name_node._metadata["type"] = FeltDefinition.get_instance()
 
-        ast.replace_in_tree(node, replacement_name_node)
+        replace_in_tree(ast, node, replacement_name_node)
 
     def visit_EnumDef(self, node: vy_ast.EnumDef, ast: vy_ast.Module, context: ASTContext):
         enum_name = node.name
         members_len = len(node.body)
-        cairo_typ = FeltDefinition() if members_len <= 251 else CairoUint256Definition()
-
         is_uint256 = False if members_len <= 251 else True
+        cairo_typ = (
+            CairoUint256Definition.get_instance() if is_uint256 else FeltDefinition.get_instance()
+        )
 
-        count = 0
-        for member in node.body:
+        # Values of each member are declared once as module-level constants. Cairo
+        # constants can only be felts, so the value of a Uint256 member is declared
+        # as a pair of constants for its low and high parts.
+        constants = []
+        members = {}
+        for count, member in enumerate(node.body):
             member_name = member.value.id
             int_value = 2**count
 
-            count += 1
-
-            # Replace enum with integer values
-            member_references = ast.get_descendants(
-                vy_ast.Attribute, {"attr": member_name, "value.id": enum_name}
-            )
-
-            for r in member_references:
-                if not is_uint256:
-                    replacement_int = vy_ast.Int(node_id=context.reserve_id(), value=int_value)
-                    replacement_int._metadata["type"] = cairo_typ
-                else:
-                    lo = int_value & ((1 << 128) - 1)
-                    hi = int_value >> 128
-
-                    # Cast literals as Uint256
-                    keywords = [
-                        vy_ast.keyword(
-                            node_id=context.reserve_id(),
-                            arg="low",
-                            value=vy_ast.Int(
-                                node_id=context.reserve_id(), value=lo, ast_type="Int"
-                            ),
-                            ast_type="keyword",
-                        ),
-                        vy_ast.keyword(
-                            node_id=context.reserve_id(),
-                            arg="high",
-                            value=vy_ast.Int(
-                                node_id=context.reserve_id(), value=hi, ast_type="Int"
-                            ),
-                            ast_typ="keyword",
-                        ),
-                    ]
-                    replacement_int = create_call_node(context, "Uint256", keywords=keywords)
-                    replacement_int._metadata["type"] = cairo_typ
-
-                ast.replace_in_tree(r, replacement_int)
-
-            type_references = ast.get_descendants(vy_ast.arg, {"annotation.id": enum_name})
-            for t in type_references:
-                t.annotation.id = "Uint256"
-                t._metadata["type"] = cairo_typ
+            constant_name = f"{enum_name}_{member_name}"
+            if not is_uint256:
+                constants.append((constant_name, int_value))
+            else:
+                constants.append((f"{constant_name}_LOW", int_value & ((1 << 128) - 1)))
+                constants.append((f"{constant_name}_HIGH", int_value >> 128))
+            members[member_name] = constant_name
+
+        node._metadata["constants"] = constants
+
+        symbol_table = get_symbol_table(ast)
+        for constant_name, _ in constants:
+            symbol_table.declare(Symbol(constant_name, CONSTANT, node))
+
+        self._enums[enum_name] = (cairo_typ, members)
+
+    def _get_member_reference(
+        self, constant_name: str, cairo_typ: CairoTypeDefinition, context: ASTContext
+    ) -> vy_ast.VyperNode:
+        if isinstance(cairo_typ, FeltDefinition):
+            ref = create_name_node(context, name=constant_name)
+        else:
+            # Cast constants as Uint256
+            keywords = [
+                vy_ast.keyword(
+                    node_id=context.reserve_id(),
+                    arg=arg,
+                    value=create_name_node(context, name=f"{constant_name}_{arg.upper()}"),
+                    ast_type="keyword",
+                )
+                for arg in ("low", "high")
+            ]
+            ref = create_call_node(context, "Uint256", keywords=keywords)
+
+        ref._metadata["type"] = cairo_typ
+        return ref
 
     def visit_Module(self, node: vy_ast.Module, ast: vy_ast.Module, context: ASTContext):
+        # Enum types keyed by name, as a tuple of the Cairo type and the name of the
+        # constant of each member
+        self._enums: Dict[str, Tuple[CairoTypeDefinition, Dict[str, str]]] = {}
+
         # visit `Compare` nodes first to convert membership comparisons to bitwise ops
         # before the Vyper enum type definition is changed to the Cairo equivalent
         compares = node.get_descendants(vy_ast.Compare)
@@ -183,3 +195,23 @@ class EnumConverterVisitor(BaseVisitor):
             self.visit(c, ast, context)
 
         super().visit_Module(node, ast, context)
+
+        # Replace enum members and types in a single scan of the module
+        for n in get_descendants(ast, (vy_ast.Attribute, vy_ast.arg)):
+            if isinstance(n, vy_ast.Attribute):
+                enum_name = n.value.get("id")
+                if enum_name not in self._enums:
+                    continue
+
+                cairo_typ, members = self._enums[enum_name]
+                if n.attr not in members:
+                    continue
+
+                replace_in_tree(
+                    ast, n, self._get_member_reference(members[n.attr], cairo_typ, context)
+                )
+
+            elif isinstance(n.annotation, vy_ast.Name) and n.annotation.id in self._enums:
+                n._metadata["type"] = self._enums[n.annotation.id][0]
+                n.annotation.id = "Uint256"
+                reindex(n.annotation)
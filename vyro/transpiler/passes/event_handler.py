@@ -5,11 +5,17 @@ from vyper.semantics.types.utils import get_type_from_annotation
 from vyro.cairo.import_directives import add_builtin_to_module
 from vyro.cairo.types import CairoUint256Definition
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import EVENT
 from vyro.transpiler.utils import get_cairo_type
 from vyro.transpiler.visitor import BaseVisitor
 
 
 class EventHandlerVisitor(BaseVisitor):
+    NODE_TYPES = (vy_ast.EventDef,)
+    # Imports are added to the directives that the initialisation pass creates
+    RUNS_AFTER = ("I",)
+    TRIGGERS = (EVENT,)
+
     def visit_EventDef(self, node: vy_ast.EventDef, ast: vy_ast.Module, context: ASTContext):
         # Iterate over event members
         for i in node.body:
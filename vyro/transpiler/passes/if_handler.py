@@ -4,6 +4,7 @@ from vyro.cairo.import_directives import add_builtin_to_module
 from vyro.cairo.nodes import CairoIfTest
 from vyro.cairo.types import FeltDefinition
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import IF
 from vyro.transpiler.utils import (
     create_assign_node,
     create_name_node,
@@ -15,11 +16,16 @@ from vyro.transpiler.visitor import BaseVisitor
 
 
 class IfHandlerVisitor(BaseVisitor):
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # The conditions are moved out of `If` nodes after static arrays are converted
+    RUNS_AFTER = ("I", "SA")
+    TRIGGERS = (IF,)
+
     def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
         # Extract `If` nodes to prevent infinite loop
         if_nodes = node.get_descendants(vy_ast.If)
         for if_node in if_nodes:
-            self.visit_If(if_node, ast, context)
+            self.visit(if_node, ast, context)
 
     def visit_If(self, node: vy_ast.If, ast: vy_ast.Module, context: ASTContext):
 
@@ -29,7 +35,7 @@ class IfHandlerVisitor(BaseVisitor):
         node._children.remove(node.test)
 
         temp_name_node = create_name_node(context)
-        temp_name_node._metadata["type"] = FeltDefinition()
+        temp_name_node._metadata["type"] = FeltDefinition.get_instance()
 
         assign_condition_node = create_assign_node(context, [temp_name_node], condition)
 
@@ -38,10 +44,10 @@ class IfHandlerVisitor(BaseVisitor):
 
         # Replace 'test' for `If` node with `CairoIfTest` of temporary variable to TRUE
         temp_name_node_dup = create_name_node(context, name=temp_name_node.id)
-        temp_name_node_dup._metadata["type"] = FeltDefinition()
+        temp_name_node_dup._metadata["type"] = FeltDefinition.get_instance()
 
         true_constant_node = create_name_node(context, name="TRUE")
-        true_constant_node._metadata["type"] = FeltDefinition()
+        true_constant_node._metadata["type"] = FeltDefinition.get_instance()
         add_builtin_to_module(ast, "TRUE")
 
         compare_node = CairoIfTest(
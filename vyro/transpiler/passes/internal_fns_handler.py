@@ -1,11 +1,21 @@
 from vyper import ast as vy_ast
 
 from vyro.transpiler.context import ASTContext
-from vyro.transpiler.utils import create_name_node
+from vyro.transpiler.utils import create_name_node, replace_in_tree
 from vyro.transpiler.visitor import BaseVisitor
 
 
 class InternalFunctionsHandler(BaseVisitor):
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # Attributes of `self` are handled by these passes before calls are unwrapped
+    RUNS_AFTER = ("SA", "Ch")
+
+    def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
+        # Visit calls in a single scan, including calls in the arguments of other calls
+        calls = node.get_descendants(vy_ast.Call)
+        for c in calls:
+            self.visit(c, ast, context)
+
     def visit_Call(self, node: vy_ast.Call, ast: vy_ast.Module, context: ASTContext):
         fn_typ = node.func._metadata.get("type")
 
@@ -16,4 +26,4 @@ class InternalFunctionsHandler(BaseVisitor):
             fn_name_node._metadata["type"] = fn_typ
 
             # Replace `self.foo` with `foo`
-            ast.replace_in_tree(node.func, fn_name_node)
+            replace_in_tree(ast, node.func, fn_name_node)
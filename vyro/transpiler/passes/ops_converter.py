@@ -4,6 +4,7 @@ from vyro.cairo.import_directives import add_builtin_to_module
 from vyro.cairo.types import CairoUint256Definition, FeltDefinition
 from vyro.exceptions import UnsupportedOperation
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.traversal import SKIP_CHILDREN, IterativeVisitor
 from vyro.transpiler.utils import (
     add_implicit_to_function,
     convert_node_type_definition,
@@ -14,9 +15,9 @@ from vyro.transpiler.utils import (
     get_scope,
     get_stmt_node,
     insert_statement_before,
+    replace_in_tree,
     set_parent,
 )
-from vyro.transpiler.visitor import BaseVisitor
 
 BINOP_TABLE = {
     # operation: [felt op, uint256 op]
@@ -41,13 +42,13 @@ COMPARE_TABLE = {
 UNARY_OP_TABLE = {"bitwise not": ["bitwise_not", "uint256_not"]}
 
 
-class OpsConverterVisitor(BaseVisitor):
+class OpsConverterVisitor(IterativeVisitor):
     """
     Handles arithmetic, bitwise and boolean operations that require a Cairo builtin,
     and AugAssign nodes.
     """
 
-    def visit_AugAssign(self, node: vy_ast.AugAssign, ast: vy_ast.Module, context: ASTContext):
+    def enter_AugAssign(self, node: vy_ast.AugAssign, ast: vy_ast.Module, context: ASTContext):
         # Replace AugAssign with Assign
         target = node.target
         op = node.op
@@ -77,13 +78,11 @@ class OpsConverterVisitor(BaseVisitor):
             ann_assign._metadata["type"] = cairo_typ
 
             # Replace `AugAssign` node with `AnnAssign`
-            ast.replace_in_tree(node, ann_assign)
+            replace_in_tree(ast, node, ann_assign)
 
-    def visit_BinOp(self, node: vy_ast.BinOp, ast: vy_ast.Module, context: ASTContext):
-
-        # Convert nested `BinOp` nodes first
-        super().visit_BinOp(node, ast, context)
+        return SKIP_CHILDREN
 
+    def leave_BinOp(self, node: vy_ast.BinOp, ast: vy_ast.Module, context: ASTContext):
         cairo_typ = convert_node_type_definition(node)
 
         op = node.op
@@ -103,14 +102,14 @@ class OpsConverterVisitor(BaseVisitor):
             temp_left = create_name_node(context)
             temp_right = create_name_node(context)
 
-            temp_left._metadata["type"] = FeltDefinition()
-            temp_right._metadata["type"] = FeltDefinition()
+            temp_left._metadata["type"] = FeltDefinition.get_instance()
+            temp_right._metadata["type"] = FeltDefinition.get_instance()
 
             wrapped_left = create_call_node(context, "uint256_to_felt", args=[node.left])
-            wrapped_left._metadata["type"] = FeltDefinition()
+            wrapped_left._metadata["type"] = FeltDefinition.get_instance()
 
             wrapped_right = create_call_node(context, "uint256_to_felt", args=[node.right])
-            wrapped_right._metadata["type"] = FeltDefinition()
+            wrapped_right._metadata["type"] = FeltDefinition.get_instance()
 
             add_builtin_to_module(ast, "uint256_to_felt")
 
@@ -121,15 +120,15 @@ class OpsConverterVisitor(BaseVisitor):
             temp_left_dup = create_name_node(context, name=temp_left.id)
             temp_right_dup = create_name_node(context, name=temp_right.id)
 
-            temp_left_dup._metadata["type"] = FeltDefinition()
-            temp_right_dup._metadata["type"] = FeltDefinition()
+            temp_left_dup._metadata["type"] = FeltDefinition.get_instance()
+            temp_right_dup._metadata["type"] = FeltDefinition.get_instance()
 
             # Exponentiate
             wrapped_op = create_call_node(context, vyro_op, args=[temp_left_dup, temp_right_dup])
-            wrapped_op._metadata["type"] = FeltDefinition()
+            wrapped_op._metadata["type"] = FeltDefinition.get_instance()
 
             convert_ret_node = create_name_node(context)
-            convert_ret_node._metadata["type"] = FeltDefinition()
+            convert_ret_node._metadata["type"] = FeltDefinition.get_instance()
 
             convert_assign_node = create_assign_node(context, [convert_ret_node], wrapped_op)
 
@@ -137,15 +136,15 @@ class OpsConverterVisitor(BaseVisitor):
 
             # Convert back to Uint256
             reconvert_arg_node = create_name_node(context, name=convert_ret_node.id)
-            reconvert_arg_node._metadata["type"] = FeltDefinition()
+            reconvert_arg_node._metadata["type"] = FeltDefinition.get_instance()
 
             wrapped_op = create_call_node(context, "felt_to_uint256", args=[reconvert_arg_node])
-            wrapped_op._metadata["type"] = CairoUint256Definition()
+            wrapped_op._metadata["type"] = CairoUint256Definition.get_instance()
 
             add_builtin_to_module(ast, "felt_to_uint256")
 
             reconvert_target_node = create_name_node(context)
-            reconvert_target_node._metadata["type"] = CairoUint256Definition()
+            reconvert_target_node._metadata["type"] = CairoUint256Definition.get_instance()
 
             reconvert_node = create_assign_node(context, [reconvert_target_node], wrapped_op)
 
@@ -165,7 +164,7 @@ class OpsConverterVisitor(BaseVisitor):
 
             # Replace `BinOp` with reconverted node
             replacement_node = create_name_node(context, name=reconvert_target_node.id)
-            ast.replace_in_tree(node, replacement_node)
+            replace_in_tree(ast, node, replacement_node)
             return
 
         if isinstance(op, (vy_ast.BitAnd, vy_ast.BitOr, vy_ast.BitXor)):
@@ -188,14 +187,11 @@ class OpsConverterVisitor(BaseVisitor):
 
         # Replace `BinOp` node with wrapped call reference
         temp_name_node_dup = create_name_node(context, name=temp_name_node.id)
-        ast.replace_in_tree(node, temp_name_node_dup)
+        replace_in_tree(ast, node, temp_name_node_dup)
 
         add_builtin_to_module(ast, vyro_op)
 
-    def visit_BoolOp(self, node: vy_ast.BoolOp, ast: vy_ast.Module, context: ASTContext):
-        # Convert nested `BoolOp` nodes first
-        super().visit_BoolOp(node, ast, context)
-
+    def leave_BoolOp(self, node: vy_ast.BoolOp, ast: vy_ast.Module, context: ASTContext):
         if isinstance(node.op, vy_ast.And):
             vyro_op = "bitwise_and"
         elif isinstance(node.op, vy_ast.Or):
@@ -206,17 +202,14 @@ class OpsConverterVisitor(BaseVisitor):
 
         # Wrap operation in a function call
         wrapped_op = create_call_node(context, vyro_op, args=node.values)
-        wrapped_op._metadata["type"] = FeltDefinition()
+        wrapped_op._metadata["type"] = FeltDefinition.get_instance()
 
         # Replace `BoolOp` node with wrapped call
-        ast.replace_in_tree(node, wrapped_op)
+        replace_in_tree(ast, node, wrapped_op)
 
         add_builtin_to_module(ast, vyro_op)
 
-    def visit_Compare(self, node: vy_ast.Compare, ast: vy_ast.Module, context: ASTContext):
-        # Convert nested `Compare` nodes first
-        super().visit_Compare(node, ast, context)
-
+    def leave_Compare(self, node: vy_ast.Compare, ast: vy_ast.Module, context: ASTContext):
         op = node.op
 
         if isinstance(op, (vy_ast.In, vy_ast.NotIn)):
@@ -226,7 +219,7 @@ class OpsConverterVisitor(BaseVisitor):
         left = node.left
         right = node.right
 
-        output_typ = FeltDefinition()
+        output_typ = FeltDefinition.get_instance()
 
         typ = node.left._metadata.get("type") or node.right._metadata.get("type")
         cairo_typ = get_cairo_type(typ)
@@ -256,9 +249,9 @@ class OpsConverterVisitor(BaseVisitor):
         temp_name_node_dup = create_name_node(context, name=temp_name_node.id)
         temp_name_node_dup._metadata["type"] = output_typ
 
-        ast.replace_in_tree(node, temp_name_node_dup)
+        replace_in_tree(ast, node, temp_name_node_dup)
 
-    def visit_UnaryOp(self, node: vy_ast.UnaryOp, ast: vy_ast.Module, context: ASTContext):
+    def enter_UnaryOp(self, node: vy_ast.UnaryOp, ast: vy_ast.Module, context: ASTContext):
         cairo_typ = convert_node_type_definition(node)
 
         op = node.op
@@ -269,7 +262,7 @@ class OpsConverterVisitor(BaseVisitor):
 
         # Early termination if not in conversion table
         if op_description not in UNARY_OP_TABLE:
-            return
+            return SKIP_CHILDREN
 
         is_uint256 = isinstance(cairo_typ, CairoUint256Definition)
 
@@ -287,6 +280,8 @@ class OpsConverterVisitor(BaseVisitor):
         wrapped_op._metadata["type"] = cairo_typ
 
         # Replace `BinOp` node with wrapped call
-        ast.replace_in_tree(node, wrapped_op)
+        replace_in_tree(ast, node, wrapped_op)
 
         add_builtin_to_module(ast, vyro_op)
+
+        return SKIP_CHILDREN
@@ -17,6 +17,12 @@ class ReturnValueHandler(BaseVisitor):
     Replaces the return value with a local variable if it is an expression.
     """
 
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # Statements that earlier passes insert for the return value must precede the
+    # assignment of the return value, and the builtin function handler checks the
+    # Vyper return type
+    RUNS_AFTER = ("SA", "EC", "BC", "Bf", "Ch")
+
     def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
         fn_typ = node._metadata.get("type")
 
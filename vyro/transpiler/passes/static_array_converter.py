@@ -1,4 +1,3 @@
-import copy
 from typing import List
 
 from vyper import ast as vy_ast
@@ -9,7 +8,10 @@ from vyper.semantics.types.utils import get_type_from_annotation
 from vyper.semantics.types.value.address import AddressDefinition
 
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.features import STATIC_ARRAY
+from vyro.transpiler.symbol_table import STORAGE, Symbol, get_symbol_table
 from vyro.transpiler.utils import (
+    add_to_body,
     convert_node_type_definition,
     create_assign_node,
     create_name_node,
@@ -17,6 +19,8 @@ from vyro.transpiler.utils import (
     get_scope,
     get_stmt_node,
     insert_statement_after,
+    remove_statement,
+    replace_in_tree,
     set_parent,
 )
 from vyro.transpiler.visitor import BaseVisitor
@@ -30,6 +34,8 @@ class StaticArrayConverterVisitor(BaseVisitor):
     and writing `array[i][j] = k` is equivalent to `array_storage.write(i, j, k)`.
     """
 
+    TRIGGERS = (STATIC_ARRAY,)
+
     def _write_memory_array_to_storage(
         self,
         storage_var_name: str,
@@ -45,26 +51,19 @@ class StaticArrayConverterVisitor(BaseVisitor):
         Helper function to append statements to write a declared memory array to storage
         to the body of the given scope node.
 
-        This function recursively visits a List node in a depth-first manner, since
-        the AST tree for a nested array is declared in the reverse manner.
+        This function visits a List node in a depth-first manner with an explicit
+        stack, since the AST tree for a nested array is declared in the reverse manner.
         """
-        if isinstance(value_node, vy_ast.List):
-            # Visit nested list first
-            for idx, element in enumerate(value_node.elements):
-                new_idx_list = copy.deepcopy(idx_list)
-                new_idx_list.append(idx)
-                self._write_memory_array_to_storage(
-                    storage_var_name,
-                    context,
-                    stmt_node,
-                    scope_node,
-                    scope_node_body,
-                    element,
-                    vy_typ,
-                    new_idx_list,
-                )
+        stack = [(value_node, idx_list)]
+        while stack:
+            value_node, idx_list = stack.pop()
+
+            if isinstance(value_node, vy_ast.List):
+                # Visit nested list first
+                for idx, element in reversed(list(enumerate(value_node.elements))):
+                    stack.append((element, idx_list + [idx]))
+                continue
 
-        else:
             # Index are reversed: a[i][j] is arranged as j as outer and i as nested subscript
             # We loop through the list construct the nodes from most nested to top level
             nested_value_node = None
@@ -157,10 +156,15 @@ class StaticArrayConverterVisitor(BaseVisitor):
         cairo_typ = get_cairo_type(vy_typ)
 
         # Create the storage mapping
-        fn_name = node.get_ancestor(vy_ast.FunctionDef).name
+        fn_node = node.get_ancestor(vy_ast.FunctionDef)
+        fn_name = fn_node.name
         var_name = node.target.id
         var_decl_name = f"{fn_name}_{var_name}_MEM"
 
+        # Get the symbol table before the storage mapping is added to the module
+        symbol_table = get_symbol_table(ast)
+        symbol = symbol_table.get(var_name, fn_node)
+
         var_decl_name_node = create_name_node(context, name=var_decl_name)
         var_decl_name_node._metadata["type"] = cairo_typ
 
@@ -174,7 +178,8 @@ class StaticArrayConverterVisitor(BaseVisitor):
         var_decl_node._metadata["type"] = cairo_typ
 
         set_parent(var_decl_name_node, var_decl_node)
-        ast.add_to_body(var_decl_node)
+        add_to_body(ast, var_decl_node)
+        symbol_table.declare(Symbol(var_decl_name, STORAGE, var_decl_node))
 
         # Write the values to storage
         stmt_node = get_stmt_node(node)
@@ -184,7 +189,11 @@ class StaticArrayConverterVisitor(BaseVisitor):
         )
 
         # Find references to the memory array and replace with storage mapping read
-        array_references = scope_node.get_descendants(vy_ast.Subscript, {"value.id": var_name})
+        array_references = [
+            r._parent
+            for r in symbol_table.get_references(symbol)
+            if isinstance(r._parent, vy_ast.Subscript) and r._parent.value is r
+        ]
         for r in array_references:
             # Re-use existing index node with indexes
             index_node = r.slice
@@ -212,10 +221,11 @@ class StaticArrayConverterVisitor(BaseVisitor):
             set_parent(index_node, subscript_node)
             set_parent(var_decl_ref_node, subscript_node)
 
-            ast.replace_in_tree(r, subscript_node)
+            replace_in_tree(ast, r, subscript_node)
 
         # Remove original AnnAssign node
-        scope_node_body.remove(node)
+        remove_statement(node, scope_node_body)
+        symbol_table.remove(symbol)
 
     def visit_VariableDecl(
         self, node: vy_ast.VariableDecl, ast: vy_ast.Module, context: ASTContext
@@ -0,0 +1,114 @@
+from typing import Dict, List
+
+from vyper import ast as vy_ast
+
+from vyro.cairo.nodes import CairoStorageRead, CairoStorageWrite
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.dataflow import (
+    StorageKey,
+    count_assignments,
+    get_storage_key,
+    get_storage_name,
+    get_value_key,
+    get_written_storage,
+    may_write_storage,
+    replace_child,
+)
+from vyro.transpiler.utils import create_assign_node, create_name_node
+from vyro.transpiler.visitor import BaseVisitor
+
+
+class StorageReadEliminationVisitor(BaseVisitor):
+    """
+    Reuse the value of an earlier read from storage, instead of reading the same
+    storage variable with the same arguments again.
+
+    A read can reuse the value of an earlier read, or the value of an earlier write,
+    in the same list of statements or in an enclosing list of statements. The value
+    is discarded on a write to the same storage variable with any arguments, and on
+    a call to a function that is not imported from a library, as it could write to
+    the storage variable.
+
+    Only arguments and values that are literals, constants or names that are
+    assigned at most once in the function are reused, so that they are known to
+    have the same value at the later read.
+    """
+
+    # Each function is handled on its own, so the pass can be fused with others
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # Storage reads and the values they are compared by are final after these passes
+    RUNS_AFTER = ("Sv", "Oc", "Co", "Ui")
+
+    def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
+        self._assignments = count_assignments(node)
+        self._visit_body(node.body, {}, context)
+
+    def _visit_body(
+        self,
+        body: List[vy_ast.VyperNode],
+        values: Dict[StorageKey, vy_ast.VyperNode],
+        context: ASTContext,
+    ):
+        """
+        Replace reads in a list of statements with values that are known to be in
+        storage, and update `values` with the values in storage after the statements.
+        """
+        for stmt in list(body):
+            if isinstance(stmt, CairoStorageRead):
+                key = get_storage_key(stmt, self._assignments)
+                if key is None:
+                    continue
+
+                if key in values:
+                    self._replace_read(stmt, values[key], context)
+                elif self._assignments.get(stmt.target.id) == 1:
+                    values[key] = stmt.target
+
+            elif isinstance(stmt, CairoStorageWrite):
+                storage_name = get_storage_name(stmt)
+                for k in [k for k in values if k[0] == storage_name]:
+                    del values[k]
+
+                key = get_storage_key(stmt, self._assignments)
+                value = stmt.value[-1]
+                if (
+                    key is not None
+                    and isinstance(value, (vy_ast.Int, vy_ast.Name))
+                    and get_value_key(value, self._assignments) is not None
+                ):
+                    values[key] = value
+
+            elif isinstance(stmt, vy_ast.If):
+                if may_write_storage(stmt):
+                    values.clear()
+
+                # Values before the `If` are in storage at the start of each branch
+                for branch in (stmt.body, stmt.orelse):
+                    self._visit_body(branch, dict(values), context)
+
+                written, has_call = get_written_storage(stmt.body + stmt.orelse)
+                if has_call:
+                    values.clear()
+                for k in [k for k in values if k[0] in written]:
+                    del values[k]
+
+            elif may_write_storage(stmt) or isinstance(stmt, vy_ast.For):
+                values.clear()
+
+    def _replace_read(self, node: CairoStorageRead, value: vy_ast.VyperNode, context: ASTContext):
+        # Replace the read with an assignment of the known value, which is forwarded
+        # to the references of the target by `TemporaryForwardingVisitor`
+        target = node.target
+        typ = target._metadata.get("type")
+
+        if isinstance(value, vy_ast.Name):
+            value_node = create_name_node(context, name=value.id)
+        else:
+            value_node = vy_ast.Int(node_id=context.reserve_id(), value=value.value)
+        value_node._metadata["type"] = typ
+
+        node._children.discard(target)
+        assign_node = create_assign_node(context, [target], value_node)
+        assign_node._metadata["type"] = typ
+
+        replace_child(node._parent, node, assign_node)
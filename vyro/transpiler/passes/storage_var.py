@@ -7,30 +7,48 @@ from vyper.semantics.types.function import ContractFunction, FunctionVisibility,
 from vyro.cairo.nodes import CairoStorageRead, CairoStorageWrite
 from vyro.cairo.types import CairoMappingDefinition, CairoTypeDefinition
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.symbol_table import IMMUTABLE, STORAGE, get_symbol_table
 from vyro.transpiler.utils import (
+    add_to_body,
     convert_node_type_definition,
     create_assign_node,
     create_name_node,
     extract_mapping_args,
+    get_ancestor,
     get_cairo_type,
     get_scope,
     initialise_function_implicits,
     insert_statement_before,
+    replace_in_tree,
     set_parent,
 )
 from vyro.transpiler.visitor import BaseVisitor
 
 
 class StorageVarVisitor(BaseVisitor):
+    def _get_storage_vars(
+        self, node: vy_ast.VyperNode, ast: vy_ast.Module
+    ) -> List[vy_ast.Attribute]:
+        """
+        Return the references to storage variables in a node, including the node itself.
+        """
+        symbol_table = get_symbol_table(ast)
+        return [
+            i
+            for i in node.get_descendants(vy_ast.Attribute, {"value.id": "self"}, include_self=True)
+            if getattr(symbol_table.get(i.attr), "kind", None) in (STORAGE, IMMUTABLE)
+        ]
+
     def _get_highest_subscript_parent_node(self, node: vy_ast.VyperNode) -> vy_ast.VyperNode:
         """
-        Return the top level subscript node recursively, or the node itself.
+        Return the top level subscript node, or the node itself.
         """
-        subscript_node = node.get_ancestor(vy_ast.Subscript)
-        if subscript_node is None:
-            return node
+        subscript_node = get_ancestor(node, vy_ast.Subscript)
+        while subscript_node is not None:
+            node = subscript_node
+            subscript_node = get_ancestor(node, vy_ast.Subscript)
 
-        return self._get_highest_subscript_parent_node(subscript_node)
+        return node
 
     def _get_rhs_keys(
         self, node: vy_ast.VyperNode, context: ASTContext, keys_: List[str] = None
@@ -41,28 +59,25 @@ class StorageVarVisitor(BaseVisitor):
         if keys_ is None:
             keys_ = []
 
-        if not isinstance(node, vy_ast.Subscript):
-            return keys_
+        while isinstance(node, vy_ast.Subscript):
+            if isinstance(node.slice.value, vy_ast.Name):
+                # Add current key to start of list
+                key_name = node.slice.value.id
 
-        if isinstance(node.slice.value, vy_ast.Name):
-            # Add current key to start of list
-            key_name = node.slice.value.id
+                name_node = create_name_node(context, name=key_name)
+                keys_.insert(0, name_node)
 
-            name_node = create_name_node(context, name=key_name)
-            keys_.insert(0, name_node)
-
-        elif isinstance(node.slice.value, vy_ast.Int):
-            # Add integer key to start of list
-            int_node = vy_ast.Int(
-                node_id=context.reserve_id(),
-                value=node.slice.value.value,
-                ast_type="Int",
-            )
-            keys_.insert(0, int_node)
+            elif isinstance(node.slice.value, vy_ast.Int):
+                # Add integer key to start of list
+                int_node = vy_ast.Int(
+                    node_id=context.reserve_id(),
+                    value=node.slice.value.value,
+                    ast_type="Int",
+                )
+                keys_.insert(0, int_node)
 
-        # Nested mapping
-        if isinstance(node.value, vy_ast.Subscript):
-            self._get_rhs_keys(node.value, context, keys_)
+            # Nested mapping
+            node = node.value
 
         return keys_
 
@@ -109,36 +124,50 @@ class StorageVarVisitor(BaseVisitor):
 
         # Duplicate name node
         temp_name_node_copy = create_name_node(context, name=temp_name_node.id)
-        ast.replace_in_tree(contract_var_node, temp_name_node_copy)
+        replace_in_tree(ast, contract_var_node, temp_name_node_copy)
 
-    def visit_AnnAssign(self, node: vy_ast.AnnAssign, ast: vy_ast.Module, context: ASTContext):
-        cairo_typ = convert_node_type_definition(node.target)
-        # Handle storage variables on RHS of assignment
-        rhs = node.value
-        rhs_contract_vars = rhs.get_descendants(
-            vy_ast.Attribute, {"value.id": "self"}, include_self=True
-        )
+    def _handle_rhs_contract_vars(
+        self,
+        ast: vy_ast.Module,
+        context: ASTContext,
+        parent_node: vy_ast.VyperNode,
+        cairo_typ: CairoTypeDefinition,
+    ):
+        """
+        Helper function to extract each storage variable referenced in the RHS of the
+        `parent_node` assignment with `_handle_rhs`, starting from the last one.
+        """
+        while True:
+            rhs_contract_vars = self._get_storage_vars(parent_node.value, ast)
+            if not rhs_contract_vars:
+                return
 
-        if rhs_contract_vars:
             contract_var = rhs_contract_vars.pop()
             contract_var_name = contract_var.attr
+
             # Check for nested mappings
             contract_var = self._get_highest_subscript_parent_node(contract_var)
 
             # Check if RHS is of a different type than the value (e.g. struct member)
+            rhs_cairo_typ = cairo_typ
             contract_var_vy_typ = contract_var._metadata.get("type", None)
             if contract_var_vy_typ is not None:
-                cairo_typ = get_cairo_type(contract_var_vy_typ)
+                rhs_cairo_typ = get_cairo_type(contract_var_vy_typ)
+
+            self._handle_rhs(
+                contract_var_name, contract_var, ast, context, parent_node, rhs_cairo_typ
+            )
 
-            self._handle_rhs(contract_var_name, contract_var, ast, context, node, cairo_typ)
+    def visit_AnnAssign(self, node: vy_ast.AnnAssign, ast: vy_ast.Module, context: ASTContext):
+        cairo_typ = convert_node_type_definition(node.target)
+        # Handle storage variables on RHS of assignment
+        self._handle_rhs_contract_vars(ast, context, node, cairo_typ)
 
     def visit_Assign(self, node: vy_ast.Assign, ast: vy_ast.Module, context: ASTContext):
 
         # Check for storage variable on LHS of assignment
         lhs = node.target
-        contract_vars = lhs.get_descendants(
-            vy_ast.Attribute, {"value.id": "self"}, include_self=True
-        )
+        contract_vars = self._get_storage_vars(lhs, ast)
         cairo_typ = convert_node_type_definition(node.target)
         lhs_replaced = False
         if contract_vars:
@@ -182,7 +211,7 @@ class StorageVarVisitor(BaseVisitor):
             storage_write_node.target._metadata["type"] = cairo_typ
 
             # Replace assign node with RHS
-            ast.replace_in_tree(node, storage_write_node)
+            replace_in_tree(ast, node, storage_write_node)
             # Add RHS node before storage write node
             insert_statement_before(
                 rhs_assignment_node, storage_write_node, scope_node, scope_node_body
@@ -191,34 +220,16 @@ class StorageVarVisitor(BaseVisitor):
             lhs_replaced = True
 
         # Handle storage variables on RHS of assignment
-        rhs = node.value
-        rhs_contract_vars = rhs.get_descendants(
-            vy_ast.Attribute, {"value.id": "self"}, include_self=True
-        )
-        if rhs_contract_vars:
-            contract_var = rhs_contract_vars.pop()
-            contract_var_name = contract_var.attr
-
-            # Update parent node argument to `_handle_rhs` if LHS is replaced
-            if lhs_replaced is True:
-                node = rhs_assignment_node
-
-            # Check for nested mappings
-            contract_var = self._get_highest_subscript_parent_node(contract_var)
-
-            # Check if RHS is of a different type than the value (e.g. struct member)
-            contract_var_vy_typ = contract_var._metadata.get("type", None)
-            if contract_var_vy_typ is not None:
-                cairo_typ = get_cairo_type(contract_var_vy_typ)
+        # Update parent node argument to `_handle_rhs` if LHS is replaced
+        if lhs_replaced is True:
+            node = rhs_assignment_node
 
-            self._handle_rhs(contract_var_name, contract_var, ast, context, node, cairo_typ)
+        self._handle_rhs_contract_vars(ast, context, node, cairo_typ)
 
     def visit_AugAssign(self, node: vy_ast.AugAssign, ast: vy_ast.Module, context: ASTContext):
         # Check for storage variable on LHS of assignment
         lhs = node.target
-        contract_vars = lhs.get_descendants(
-            vy_ast.Attribute, {"value.id": "self"}, include_self=True
-        )
+        contract_vars = self._get_storage_vars(lhs, ast)
         cairo_typ = convert_node_type_definition(node.target)
 
         lhs_replaced = False
@@ -305,7 +316,7 @@ class StorageVarVisitor(BaseVisitor):
             storage_write_node.target._metadata["type"] = cairo_typ
 
             # Replace assign node with RHS
-            ast.replace_in_tree(node, storage_write_node)
+            replace_in_tree(ast, node, storage_write_node)
             # Add RHS node before storage write node
             insert_statement_before(
                 rhs_assignment_node, storage_write_node, scope_node, scope_node_body
@@ -317,27 +328,11 @@ class StorageVarVisitor(BaseVisitor):
             lhs_replaced = True
 
         # Handle storage variables on RHS of assignment
-        rhs = node.value
-        rhs_contract_vars = rhs.get_descendants(
-            vy_ast.Attribute, {"value.id": "self"}, include_self=True
-        )
-        if rhs_contract_vars:
-            contract_var = rhs_contract_vars.pop()
-            contract_var_name = contract_var.attr
-
-            # Update parent node argument to `_handle_rhs` if LHS is replaced
-            if lhs_replaced is True:
-                node = rhs_assignment_node
-
-            # Check for nested mappings
-            contract_var = self._get_highest_subscript_parent_node(contract_var)
-
-            # Check if RHS is of a different type than the value (e.g. struct member)
-            contract_var_vy_typ = contract_var._metadata.get("type", None)
-            if contract_var_vy_typ is not None:
-                cairo_typ = get_cairo_type(contract_var_vy_typ)
+        # Update parent node argument to `_handle_rhs` if LHS is replaced
+        if lhs_replaced is True:
+            node = rhs_assignment_node
 
-            self._handle_rhs(contract_var_name, contract_var, ast, context, node, cairo_typ)
+        self._handle_rhs_contract_vars(ast, context, node, cairo_typ)
 
     def visit_VariableDecl(
         self, node: vy_ast.VariableDecl, ast: vy_ast.Module, context: ASTContext
@@ -430,4 +425,4 @@ class StorageVarVisitor(BaseVisitor):
 
             fn_node._metadata["type"] = fn_node_typ
 
-            ast.add_to_body(fn_node)
+            add_to_body(ast, fn_node)
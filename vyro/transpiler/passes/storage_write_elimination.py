@@ -0,0 +1,90 @@
+from typing import FrozenSet, List
+
+from vyper import ast as vy_ast
+
+from vyro.cairo.nodes import CairoStorageRead, CairoStorageWrite
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.dataflow import (
+    StorageKey,
+    count_assignments,
+    get_storage_key,
+    get_storage_name,
+    may_write_storage,
+)
+from vyro.transpiler.utils import remove_statement
+from vyro.transpiler.visitor import BaseVisitor
+
+
+class StorageWriteEliminationVisitor(BaseVisitor):
+    """
+    Remove writes to storage that are overwritten before they can be observed.
+
+    A write is removed if every path from the write to the end of the function
+    writes the same storage variable with the same arguments, before any read of
+    the storage variable, any return and any call to a function that is not imported
+    from a library. The value stays in its local variable, so only the final write
+    on each path is performed.
+
+    This pass depends on `StorageReadEliminationVisitor` running first. A write
+    followed by a read of the same slot, e.g. `self.x = a` followed by
+    `self.x += b`, is only dead once the read has been replaced with the written
+    value by that pass.
+    """
+
+    # Each function is handled on its own, so the pass can be fused with others
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    RUNS_AFTER = ("Sr",)
+
+    def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
+        self._assignments = count_assignments(node)
+
+        # The value in storage is observed at the end of the function
+        self._visit_body(node.body, frozenset())
+
+    def _visit_body(
+        self, body: List[vy_ast.VyperNode], overwritten: FrozenSet[StorageKey]
+    ) -> FrozenSet[StorageKey]:
+        """
+        Remove overwritten writes in a list of statements, walking it backwards once.
+
+        `overwritten` are the storage slots that are overwritten on every path from
+        the end of `body`, before they can be observed. Returns the storage slots
+        that are overwritten in the same way from the start of `body`.
+        """
+        dead = []
+        for stmt in reversed(body):
+            if isinstance(stmt, vy_ast.Return):
+                overwritten = frozenset()
+                continue
+
+            if isinstance(stmt, CairoStorageWrite):
+                key = get_storage_key(stmt, self._assignments)
+                if key is not None:
+                    if key in overwritten and not may_write_storage(stmt):
+                        dead.append(stmt)
+                    overwritten |= {key}
+
+            elif isinstance(stmt, CairoStorageRead):
+                storage_name = get_storage_name(stmt)
+                overwritten = frozenset(k for k in overwritten if k[0] != storage_name)
+
+            elif isinstance(stmt, vy_ast.If):
+                # A slot is overwritten before the `If` only if it is overwritten
+                # on both branches
+                overwritten = self._visit_body(stmt.body, overwritten) & self._visit_body(
+                    stmt.orelse, overwritten
+                )
+
+            elif isinstance(stmt, vy_ast.For):
+                # The next iteration of the loop is unknown, and the loop may not run
+                overwritten &= self._visit_body(stmt.body, frozenset())
+
+            # Calls in the statement are evaluated before it writes to storage
+            if may_write_storage(stmt):
+                overwritten = frozenset()
+
+        for stmt in dead:
+            remove_statement(stmt, body)
+            stmt._parent._children.discard(stmt)
+
+        return overwritten
@@ -8,6 +8,11 @@ from vyro.transpiler.visitor import BaseVisitor
 
 
 class StructConverterVisitor(BaseVisitor):
+    NODE_TYPES = (vy_ast.Assign,)
+    # Struct values of `AnnAssign` nodes are moved into an `Assign` by the
+    # initialisation pass
+    RUNS_AFTER = ("I",)
+
     def visit_Assign(self, node: vy_ast.Assign, ast: vy_ast.Module, context: ASTContext):
         value_node = node.value
         if isinstance(value_node, vy_ast.Call):
@@ -0,0 +1,110 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from vyper import ast as vy_ast
+
+from vyro.cairo.nodes import CairoAssert, CairoStorageRead, CairoStorageWrite
+from vyro.transpiler.context import ASTContext
+from vyro.transpiler.dataflow import (
+    count_assignments,
+    get_assignment_targets,
+    get_children,
+    get_statements,
+    replace_child,
+)
+from vyro.transpiler.utils import create_name_node, remove_statement
+from vyro.transpiler.visitor import BaseVisitor
+
+# Prefix of the temporary variables created by `create_name_node`
+TEMP_PREFIX = "VYRO_VAR_"
+
+# Nodes that a literal can be forwarded into, i.e. where Cairo accepts any expression
+LITERAL_PARENTS = (vy_ast.Call, vy_ast.keyword, vy_ast.Return, vy_ast.Tuple)
+
+
+class TemporaryForwardingVisitor(BaseVisitor):
+    """
+    Forward copies into temporary variables to the references of the temporary.
+
+    Lowering passes assign intermediate values to a fresh `VYRO_VAR_{node_id}`,
+    which frequently results in copies such as `let VYRO_VAR_2 = VYRO_VAR_1;` or
+    `let VYRO_VAR_3 = TRUE;`. If the temporary and the copied variable are each
+    assigned only once in the function, the references to the temporary are
+    replaced with the copied value and the assignment is removed.
+
+    Literals and constants are only forwarded into call arguments, return values,
+    storage reads and writes, and the value of an assignment.
+    """
+
+    # Each function is handled on its own, so the pass can be fused with others
+    NODE_TYPES = (vy_ast.FunctionDef,)
+    # Temporaries are only forwarded once every pass that creates them has run
+    RUNS_AFTER = ("Sv", "Oc", "Co", "Ui")
+
+    def visit_FunctionDef(self, node: vy_ast.FunctionDef, ast: vy_ast.Module, context: ASTContext):
+        statements = get_statements(node.body)
+        assignments = count_assignments(node)
+
+        # References to each name with their parent node
+        references: Dict[str, List[Tuple[vy_ast.Name, vy_ast.VyperNode]]] = defaultdict(list)
+
+        for stmt, _ in statements:
+            targets = get_assignment_targets(stmt)
+
+            # Nested statements are visited on their own
+            if isinstance(stmt, vy_ast.If):
+                roots = [stmt.test]
+            elif isinstance(stmt, vy_ast.For):
+                roots = [stmt.iter]
+            else:
+                roots = [c for c in get_children(stmt) if all(c is not t for t in targets)]
+
+            stack = [(c, stmt) for c in roots]
+            while stack:
+                n, parent = stack.pop()
+                if isinstance(n, vy_ast.Name):
+                    references[n.id].append((n, parent))
+                else:
+                    stack.extend((c, n) for c in get_children(n))
+
+        for stmt, body in statements:
+            if type(stmt) is not vy_ast.Assign or not isinstance(stmt.target, vy_ast.Name):
+                continue
+
+            name = stmt.target.id
+            if not name.startswith(TEMP_PREFIX) or assignments[name] != 1:
+                continue
+
+            # Names that are not assigned in the function are constants e.g. `TRUE`
+            value = stmt.value
+            if isinstance(value, vy_ast.Name) and assignments[value.id] > 0:
+                if value.id == name or assignments[value.id] > 1:
+                    continue
+            elif isinstance(value, (vy_ast.Int, vy_ast.Name)):
+                if not all(self._is_literal_allowed(r, p) for r, p in references[name]):
+                    continue
+            else:
+                continue
+
+            typ = stmt.target._metadata.get("type")
+            for ref, parent in references.pop(name, []):
+                if isinstance(value, vy_ast.Name):
+                    replacement = create_name_node(context, name=value.id)
+                    references[value.id].append((replacement, parent))
+                else:
+                    replacement = vy_ast.Int(node_id=context.reserve_id(), value=value.value)
+                replacement._metadata["type"] = typ
+
+                replace_child(parent, ref, replacement)
+
+            remove_statement(stmt, body)
+            stmt._parent._children.discard(stmt)
+
+    def _is_literal_allowed(self, ref: vy_ast.Name, parent: vy_ast.VyperNode) -> bool:
+        if isinstance(parent, LITERAL_PARENTS):
+            return True
+        if isinstance(parent, CairoAssert):
+            return False
+        if isinstance(parent, (CairoStorageRead, CairoStorageWrite)):
+            return ref is not parent.target
+        return isinstance(parent, (vy_ast.Assign, vy_ast.AnnAssign)) and parent.value is ref
@@ -11,6 +11,7 @@ from vyro.transpiler.utils import (
     get_cairo_type,
     get_scope,
     insert_statement_before,
+    replace_in_tree,
     set_parent,
 )
 from vyro.transpiler.visitor import BaseVisitor
@@ -85,7 +86,7 @@ class Uint256HandlerVisitor(BaseVisitor):
         wrapped_uint256_op._metadata["type"] = cairo_typ
 
         # Replace `BinOp` node with wrapped call
-        ast.replace_in_tree(node, wrapped_uint256_op)
+        replace_in_tree(ast, node, wrapped_uint256_op)
 
         add_builtin_to_module(ast, uint256_op)
 
@@ -120,7 +121,7 @@ class Uint256HandlerVisitor(BaseVisitor):
 
                 add_builtin_to_module(ast, "Uint256")
 
-                ast.replace_in_tree(node, wrapped_convert)
+                replace_in_tree(ast, node, wrapped_convert)
 
     def visit_Module(self, node: vy_ast.Module, ast: vy_ast.Module, context: ASTContext):
         # Skip contract vars
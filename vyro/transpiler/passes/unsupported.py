@@ -6,6 +6,8 @@ from vyro.transpiler.visitor import BaseVisitor
 
 
 class UnsupportedVisitor(BaseVisitor):
+    NODE_TYPES = (vy_ast.For,)
+
     def _visit_unsupported_node(self, node: vy_ast.VyperNode):
         raise UnsupportedNode(f"{type(node)} is not supported.", node)
 
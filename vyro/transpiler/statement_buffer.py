@@ -0,0 +1,176 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from vyper import ast as vy_ast
+
+# Buffer of the pass that is currently running, if statement insertions are buffered
+_statement_buffer: ContextVar[Optional["StatementEditBuffer"]] = ContextVar(
+    "statement_buffer", default=None
+)
+
+
+def get_statement_buffer() -> Optional["StatementEditBuffer"]:
+    """
+    Returns the buffer of the pass that is currently running, if there is one.
+    """
+    return _statement_buffer.get()
+
+
+class _BodyEdits:
+    """
+    Statements to insert into a single list of statements.
+    """
+
+    def __init__(self, body: List[vy_ast.VyperNode]) -> None:
+        self.body = body
+
+        # Statements to insert before and after each anchor statement, keyed by the
+        # id of the anchor, in the order that they were inserted. A statement inserted
+        # after an anchor precedes those inserted after it earlier.
+        self.before: Dict[int, List[vy_ast.VyperNode]] = {}
+        self.after: Dict[int, List[vy_ast.VyperNode]] = {}
+
+    def expand(self, node: vy_ast.VyperNode) -> List[vy_ast.VyperNode]:
+        """
+        Returns a statement preceded and followed by the statements inserted around
+        it, including those inserted around inserted statements.
+        """
+        result = []
+        stack: List[Tuple[vy_ast.VyperNode, bool]] = [(node, False)]
+        while stack:
+            n, is_expanded = stack.pop()
+            if is_expanded:
+                result.append(n)
+                continue
+
+            stack.extend((i, False) for i in self.after.get(id(n), []))
+            stack.append((n, True))
+            stack.extend((i, False) for i in reversed(self.before.get(id(n), [])))
+
+        return result
+
+    def apply(self):
+        self.body[:] = [i for n in self.body for i in self.expand(n)]
+
+
+class StatementEditBuffer:
+    """
+    Buffer of the statements that a pass inserts with `insert_statement_before` and
+    `insert_statement_after` in `vyro.transpiler.utils`.
+
+    Each insertion is recorded relative to its anchor statement in O(1), and each
+    list of statements is rebuilt once when the buffer is flushed at the end of the
+    pass, instead of searching and shifting the list for every insertion. Inserted
+    statements can be used as anchors for further insertions before the flush.
+
+    Statements that are inserted into a list are not visited by the pass that
+    inserts them, as the pass iterates over the list before the flush.
+    """
+
+    def __init__(self) -> None:
+        # Edits keyed by the id of the list of statements
+        self._edits: Dict[int, _BodyEdits] = {}
+
+        # Edits of the list of statements that each statement is in, keyed by the id
+        # of the statement, including statements not yet inserted
+        self._anchors: Dict[int, _BodyEdits] = {}
+
+        # List of statements that each inserted statement is pending in
+        self._pending: Dict[int, List[vy_ast.VyperNode]] = {}
+
+    @classmethod
+    @contextmanager
+    def activate(cls) -> Iterator["StatementEditBuffer"]:
+        """
+        Buffer statement insertions within the context, and flush the buffer on exit.
+        """
+        buffer = cls()
+        token = _statement_buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            _statement_buffer.reset(token)
+        buffer.flush()
+
+    def _get_edits(self, body: List[vy_ast.VyperNode]) -> _BodyEdits:
+        edits = self._edits.get(id(body))
+        if edits is None:
+            edits = self._edits[id(body)] = _BodyEdits(body)
+            for i in body:
+                self._anchors[id(i)] = edits
+        return edits
+
+    def _check_anchor(self, edits: _BodyEdits, anchor: vy_ast.VyperNode):
+        if self._anchors.get(id(anchor)) is not edits:
+            raise ValueError(f"{type(anchor).__name__} node is not in the list of statements")
+
+    def insert_before(
+        self, node: vy_ast.VyperNode, before: vy_ast.VyperNode, body: List[vy_ast.VyperNode]
+    ):
+        edits = self._get_edits(body)
+        self._check_anchor(edits, before)
+        edits.before.setdefault(id(before), []).append(node)
+        self._anchors[id(node)] = edits
+        self._pending[id(node)] = body
+
+    def insert_after(
+        self, node: vy_ast.VyperNode, after: vy_ast.VyperNode, body: List[vy_ast.VyperNode]
+    ):
+        edits = self._get_edits(body)
+        self._check_anchor(edits, after)
+        edits.after.setdefault(id(after), []).append(node)
+        self._anchors[id(node)] = edits
+        self._pending[id(node)] = body
+
+    def get_pending_body(self, node: vy_ast.VyperNode) -> Optional[List[vy_ast.VyperNode]]:
+        """
+        Returns the list of statements that a statement is pending insertion into.
+        """
+        return self._pending.get(id(node))
+
+    def replace(self, old_node: vy_ast.VyperNode, new_node: vy_ast.VyperNode):
+        """
+        Update the buffer before a statement is replaced in its list of statements.
+
+        Statements inserted around the old statement are moved to the new statement.
+        If the old statement is pending insertion, its list is flushed first so that
+        it can be replaced in the list.
+        """
+        pending_body = self._pending.get(id(old_node))
+        if pending_body is not None:
+            self.flush_body(pending_body)
+            return
+
+        edits = self._anchors.pop(id(old_node), None)
+        if edits is None:
+            return
+
+        self._anchors[id(new_node)] = edits
+        for anchors in (edits.before, edits.after):
+            if id(old_node) in anchors:
+                anchors[id(new_node)] = anchors.pop(id(old_node))
+
+    def flush_body(self, body: List[vy_ast.VyperNode]):
+        """
+        Apply the insertions into a single list of statements, e.g. before it is
+        modified in another way.
+        """
+        edits = self._edits.pop(id(body), None)
+        if edits is None:
+            return
+
+        edits.apply()
+        for n in body:
+            self._anchors.pop(id(n), None)
+            self._pending.pop(id(n), None)
+
+    def flush(self):
+        """
+        Apply all insertions.
+        """
+        for edits in self._edits.values():
+            edits.apply()
+        self._edits.clear()
+        self._anchors.clear()
+        self._pending.clear()
@@ -0,0 +1,217 @@
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+from vyper import ast as vy_ast
+
+from vyro.exceptions import TranspilerPanic
+from vyro.transpiler.node_index import get_root
+from vyro.transpiler.utils import get_descendants
+
+# Key of the symbol table in the metadata of the `Module` node
+SYMBOL_TABLE_KEY = "symbol_table"
+
+# Kinds of declarations
+ARGUMENT = "argument"
+CONSTANT = "constant"
+ENUM = "enum"
+EVENT = "event"
+FUNCTION = "function"
+IMMUTABLE = "immutable"
+LOCAL = "local"
+STORAGE = "storage"
+STRUCT = "struct"
+
+# Kinds of module-level declarations that are referenced as `self.<name>`
+SELF_KINDS = (FUNCTION, STORAGE)
+
+MODULE_KINDS = {
+    vy_ast.EnumDef: ENUM,
+    vy_ast.EventDef: EVENT,
+    vy_ast.FunctionDef: FUNCTION,
+    vy_ast.StructDef: STRUCT,
+}
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """
+    Declaration of a name.
+
+    Attributes
+    ----------
+    name : str
+        The declared name.
+    kind : str
+        The kind of declaration, e.g. `STORAGE` or `LOCAL`.
+    node : VyperNode
+        The declaration node.
+    scope : FunctionDef, optional
+        The function that a local variable or argument is declared in, or None for
+        module-level declarations.
+    """
+
+    name: str
+    kind: str
+    node: vy_ast.VyperNode
+    scope: Optional[vy_ast.FunctionDef] = None
+
+
+def _get_variable_kind(node: vy_ast.VariableDecl) -> str:
+    if node.is_constant:
+        return CONSTANT
+    if node.is_immutable:
+        return IMMUTABLE
+    return STORAGE
+
+
+class SymbolTable:
+    """
+    Declarations of a module, built in a single walk of the module.
+
+    The table is built from the source code before the first pass. Passes that add,
+    rename or remove declarations update it with `declare`, `rename` and `remove`,
+    so that it holds the declarations of the current AST. References to a
+    declaration are looked up in the node index of the module, so they reflect the
+    current state of the AST.
+    """
+
+    def __init__(self, module: vy_ast.Module) -> None:
+        self.module = module
+
+        self._symbols: Dict[str, Symbol] = {}
+
+        # Arguments and local variables keyed by the id of their function
+        self._locals: Dict[int, Dict[str, Symbol]] = {}
+
+        for node in module.body:
+            if isinstance(node, vy_ast.VariableDecl):
+                name = node.target.id
+                self._declare(Symbol(name, _get_variable_kind(node), node))
+            elif type(node) in MODULE_KINDS:
+                self._declare(Symbol(node.name, MODULE_KINDS[type(node)], node))
+
+                if isinstance(node, vy_ast.FunctionDef):
+                    self._declare_locals(node)
+
+    @classmethod
+    def attach(cls, module: vy_ast.Module) -> "SymbolTable":
+        """
+        Build a symbol table for a module, and store it in the metadata of the module.
+        """
+        table = cls(module)
+        module._metadata[SYMBOL_TABLE_KEY] = table
+        return table
+
+    def _get_scope_symbols(self, scope: Optional[vy_ast.FunctionDef]) -> Dict[str, Symbol]:
+        if scope is None:
+            return self._symbols
+        return self._locals.setdefault(id(scope), {})
+
+    def _declare(self, symbol: Symbol):
+        self._get_scope_symbols(symbol.scope).setdefault(symbol.name, symbol)
+
+    def declare(self, symbol: Symbol):
+        """
+        Add a declaration that a pass has added to the module.
+        """
+        scope_symbols = self._get_scope_symbols(symbol.scope)
+        if symbol.name in scope_symbols:
+            raise TranspilerPanic(f"`{symbol.name}` is already declared")
+        scope_symbols[symbol.name] = symbol
+
+    def remove(self, symbol: Symbol):
+        """
+        Remove a declaration that a pass has removed from the module.
+        """
+        scope_symbols = self._get_scope_symbols(symbol.scope)
+        if scope_symbols.get(symbol.name) is not symbol:
+            raise TranspilerPanic(f"`{symbol.name}` is not declared")
+        del scope_symbols[symbol.name]
+
+    def rename(self, symbol: Symbol, name: str) -> Symbol:
+        """
+        Rename a declaration that a pass has renamed, and return the new symbol.
+        Declarations keep their position in `get_symbols`.
+        """
+        scope_symbols = self._get_scope_symbols(symbol.scope)
+        if scope_symbols.get(symbol.name) is not symbol:
+            raise TranspilerPanic(f"`{symbol.name}` is not declared")
+        if name in scope_symbols:
+            raise TranspilerPanic(f"`{name}` is already declared")
+
+        renamed = replace(symbol, name=name)
+        items = [(name, renamed) if k == symbol.name else (k, v) for k, v in scope_symbols.items()]
+        scope_symbols.clear()
+        scope_symbols.update(items)
+        return renamed
+
+    def _declare_locals(self, fn_node: vy_ast.FunctionDef):
+        for a in fn_node.args.args:
+            self._declare(Symbol(a.arg, ARGUMENT, a, fn_node))
+
+        declarations = []
+        stack: List[vy_ast.VyperNode] = list(fn_node.body)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (vy_ast.AnnAssign, vy_ast.For)) and isinstance(
+                node.target, vy_ast.Name
+            ):
+                declarations.append(node)
+
+            stack.extend(node._children)
+
+        # The first declaration of a name in the function takes precedence
+        for node in sorted(declarations, key=lambda n: (n.lineno, n.col_offset)):
+            self._declare(Symbol(node.target.id, LOCAL, node, fn_node))
+
+    def get(self, name: str, scope: Optional[vy_ast.FunctionDef] = None) -> Optional[Symbol]:
+        """
+        Returns the declaration of a name, looking up the arguments and local
+        variables of `scope` first if it is given.
+        """
+        if scope is not None:
+            symbol = self._locals.get(id(scope), {}).get(name)
+            if symbol is not None:
+                return symbol
+
+        return self._symbols.get(name)
+
+    def get_symbols(self, kind: str) -> List[Symbol]:
+        """
+        Returns the module-level declarations of a kind, in the order they are declared.
+        """
+        return [i for i in self._symbols.values() if i.kind == kind]
+
+    def get_references(self, symbol: Symbol) -> List[vy_ast.VyperNode]:
+        """
+        Returns the nodes that refer to a declaration, in the order they appear.
+
+        Storage variables and functions are referred to by `Attribute` nodes of
+        `self`, and other declarations by `Name` nodes.
+        """
+        ancestor = symbol.scope if symbol.scope is not None else self.module
+
+        if symbol.kind in SELF_KINDS:
+            return get_descendants(
+                ancestor, vy_ast.Attribute, {"attr": symbol.name, "value.id": "self"}
+            )
+
+        # The name that a variable is declared with is not a reference
+        declared = getattr(symbol.node, "target", None)
+        return [
+            i
+            for i in get_descendants(ancestor, vy_ast.Name, {"id": symbol.name})
+            if i is not declared
+        ]
+
+
+def get_symbol_table(node: vy_ast.VyperNode) -> SymbolTable:
+    """
+    Returns the symbol table of the module that a node belongs to, and builds it if
+    the module does not have one yet.
+    """
+    module = get_root(node)
+    table = module._metadata.get(SYMBOL_TABLE_KEY)
+    if table is None:
+        table = SymbolTable.attach(module)
+    return table
@@ -1,8 +1,12 @@
 import json
+from contextlib import ExitStack
+from typing import Dict, FrozenSet, List, Optional
 
 from vyper import ast as vy_ast
 
-from vyro.transpiler.context import ASTContext
+from vyro.transpiler.context import ASTContext, NodeIdAllocator
+from vyro.transpiler.features import scan_features
+from vyro.transpiler.node_index import NodeIndex
 from vyro.transpiler.passes import (
     ArgsConverterVisitor,
     AssertHandlerVisitor,
@@ -19,11 +23,19 @@ from vyro.transpiler.passes import (
     OpsConverterVisitor,
     ReturnValueHandler,
     StaticArrayConverterVisitor,
+    StorageReadEliminationVisitor,
     StorageVarVisitor,
+    StorageWriteEliminationVisitor,
     StructConverterVisitor,
+    TemporaryForwardingVisitor,
     Uint256HandlerVisitor,
     UnsupportedVisitor,
 )
+from vyro.transpiler.profiler import PassProfiler
+from vyro.transpiler.statement_buffer import StatementEditBuffer
+from vyro.transpiler.symbol_table import SymbolTable
+from vyro.transpiler.tree_diff import TreeDiffWriter
+from vyro.transpiler.visitor import BaseVisitor, CompositeVisitor
 
 PASSES = {
     "Fc": UnsupportedVisitor,
@@ -44,15 +56,98 @@ PASSES = {
     "Co": ConstantHandlerVisitor,
     "Ui": Uint256HandlerVisitor,
     "Ar": ArgsConverterVisitor,
+    "Sr": StorageReadEliminationVisitor,
+    "Sw": StorageWriteEliminationVisitor,
+    "Tf": TemporaryForwardingVisitor,
     "CI": CairoImporterVisitor,
 }
 
 
-def transpile(ast: vy_ast.Module, print_tree: bool = False):
-    ctx = ASTContext.get_context(ast)
-    for k, v in PASSES.items():
-        visitor = v()
-        visitor.visit(ast, ast, ctx)
+def _get_fusable_group(
+    groups: List[List[str]], passes: Dict[str, type], pass_: type
+) -> Optional[List[str]]:
+    # The nearest group of fusable passes that the pass can be moved back to, without
+    # moving it ahead of or fusing it with a pass that it runs after
+    for group in reversed(groups):
+        if any(p in pass_.RUNS_AFTER for p in group):
+            return None
+        if passes[group[0]].NODE_TYPES is not None:
+            return group
+
+    return None
+
+
+def get_pass_groups(passes: Dict[str, type]) -> List[List[str]]:
+    """
+    Group fusable passes (i.e. passes with `NODE_TYPES`) so that they are run in a
+    single traversal of the AST.
+
+    A fusable pass is moved back to the nearest group of fusable passes, ahead of
+    the passes in between, unless it lists a pass of that group or of the passes in
+    between in `RUNS_AFTER`. Otherwise, it starts a new group. The order in which
+    passes add import directives does not matter, as they are sorted by the writer.
+    """
+    groups: List[List[str]] = []
+    for k, v in passes.items():
+        if v.NODE_TYPES is not None:
+            group = _get_fusable_group(groups, passes, v)
+            if group is not None:
+                group.append(k)
+                continue
+
+        groups.append([k])
+
+    return groups
+
+
+def get_passes(features: FrozenSet[str]) -> Dict[str, type]:
+    """
+    Returns the passes to run on a module with the given features, skipping passes
+    whose triggers are not present.
+    """
+    return {
+        k: v for k, v in PASSES.items() if v.TRIGGERS is None or features.intersection(v.TRIGGERS)
+    }
+
+
+def transpile(
+    ast: vy_ast.Module,
+    print_tree: bool = False,
+    allocator: Optional[NodeIdAllocator] = None,
+    profiler: Optional[PassProfiler] = None,
+    tree_diff: Optional[TreeDiffWriter] = None,
+):
+    ctx = ASTContext.get_context(ast, allocator)
+    NodeIndex.attach(ast)
+    SymbolTable.attach(ast)
+
+    groups = get_pass_groups(get_passes(scan_features(ast)))
+    if print_tree or profiler is not None or tree_diff is not None:
+        # Run each pass separately so that it can be inspected on its own, in the
+        # same order as the fused passes
+        groups = [[k] for g in groups for k in g]
+
+    if tree_diff is not None:
+        tree_diff.start(ast)
+
+    # Diffs are named after the position of the pass in `PASSES`, so that the name
+    # does not depend on which passes are skipped
+    positions = {k: idx for idx, k in enumerate(PASSES)}
+
+    for keys in groups:
+        key = "+".join(keys)
+        visitors: List[BaseVisitor] = [PASSES[k]() for k in keys]
+        visitor = visitors[0] if len(visitors) == 1 else CompositeVisitor(visitors)
+        v = type(visitor)
+
+        with ExitStack() as stack:
+            if tree_diff is not None:
+                stack.enter_context(tree_diff.record(positions[keys[0]], key, v, ast))
+            if profiler is not None:
+                stack.enter_context(profiler.profile(key, visitor, ctx))
+
+            with StatementEditBuffer.activate():
+                visitor.visit(ast, ast, ctx)
 
         if print_tree is True:
             ast_dict = ast.to_dict()
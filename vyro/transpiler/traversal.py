@@ -0,0 +1,139 @@
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vyper import ast as vy_ast
+
+from vyro.exceptions import UnsupportedNode
+from vyro.transpiler.visitor import BaseVisitor
+
+# Returned by a pre-order hook to skip the children of the node
+SKIP_CHILDREN = "skip_children"
+
+# Fields of each node class that hold its children, in the order that `BaseVisitor`
+# visits them. Node classes that are not listed have no children to visit.
+CHILD_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "arguments": ("args",),
+    "keyword": ("value",),
+    "AnnAssign": ("target", "value"),
+    "Assert": ("test",),
+    "Assign": ("target", "value"),
+    "Attribute": ("value",),
+    "AugAssign": ("op", "target", "value"),
+    "BinOp": ("left", "op", "right"),
+    "BoolOp": ("op", "values"),
+    "Call": ("func", "args", "keywords"),
+    "Compare": ("left", "right"),
+    "Dict": ("keys", "values"),
+    "EnumDef": ("body",),
+    "Expr": ("value",),
+    "For": ("iter", "target", "body"),
+    "FunctionDef": ("args", "body", "returns"),
+    "If": ("test", "body", "orelse"),
+    "Import": ("name",),
+    "Index": ("value",),
+    "List": ("elements",),
+    "Log": ("value.args",),
+    "Module": ("body",),
+    "Return": ("value",),
+    "Subscript": ("slice", "value"),
+    "Tuple": ("elements",),
+    "UnaryOp": ("op", "operand"),
+    "VariableDecl": ("target", "value"),
+}
+
+
+# Getters of the fields in `CHILD_FIELDS`, keyed by node class
+_child_getters: Dict[type, Tuple[Callable, ...]] = {}
+
+
+def get_child_nodes(node: vy_ast.VyperNode) -> List[vy_ast.VyperNode]:
+    """
+    Returns the children of a node in the order that `BaseVisitor` visits them.
+    """
+    node_type = type(node)
+    getters = _child_getters.get(node_type)
+    if getters is None:
+        fields = CHILD_FIELDS.get(node_type.__name__, ())
+        getters = _child_getters[node_type] = tuple(attrgetter(f) for f in fields)
+
+    children = []
+    for getter in getters:
+        value = getter(node)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            children.extend(value)
+        else:
+            children.append(value)
+
+    return children
+
+
+class IterativeVisitor(BaseVisitor):
+    """
+    Base class for passes that walk the AST with an explicit stack instead of
+    recursion, so that deeply nested expressions do not hit the recursion limit.
+
+    The AST is walked in the same order as `BaseVisitor`. Instead of `visit_NodeType`
+    functions, a pass implements hooks for the relevant node classes:
+      - `enter_NodeType(node, ast, context)` is called before the children of the node
+        are visited. It may return `SKIP_CHILDREN` to not visit the children.
+      - `leave_NodeType(node, ast, context)` is called after the children of the node
+        have been visited.
+
+    The children of a node are read after its `enter_NodeType` hook is called. A node
+    that replaces one of its siblings in the tree must therefore do so before the
+    parent node is entered for the replacement to be visited.
+    """
+
+    # Hooks keyed by node class, filled the first time a node class is visited
+    _hooks: Dict[type, Tuple[Optional[Callable], Optional[Callable]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._hooks = {}
+
+    def _get_hooks(self, node: vy_ast.VyperNode) -> Tuple[Optional[Callable], Optional[Callable]]:
+        node_type = type(node)
+        try:
+            return self._hooks[node_type]
+        except KeyError:
+            pass
+
+        name = node_type.__name__
+        if getattr(type(self), f"visit_{name}", None) is None:
+            raise UnsupportedNode(f"{name} node is not yet supported in visitor", node)
+
+        hooks = (
+            getattr(type(self), f"enter_{name}", None),
+            getattr(type(self), f"leave_{name}", None),
+        )
+        self._hooks[node_type] = hooks
+        return hooks
+
+    def visit(self, node, ast, context):
+        # Each entry is a node and whether its children have been visited
+        hooks = self._hooks
+        stack: List[Tuple[vy_ast.VyperNode, bool]] = [(node, False)]
+        while stack:
+            n, is_visited = stack.pop()
+            enter_fn, leave_fn = hooks.get(type(n)) or self._get_hooks(n)
+
+            if not is_visited and self.visit_hook is not None:
+                self.visit_hook(n)
+
+            if is_visited:
+                if leave_fn is not None:
+                    leave_fn(self, n, ast, context)
+                if isinstance(n, vy_ast.Module):
+                    self.finish(ast, context)
+                continue
+
+            if enter_fn is not None and enter_fn(self, n, ast, context) == SKIP_CHILDREN:
+                children = []
+            else:
+                children = get_child_nodes(n)
+
+            if leave_fn is not None or isinstance(n, vy_ast.Module):
+                stack.append((n, True))
+            stack.extend((c, False) for c in reversed(children))
@@ -0,0 +1,229 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
+
+from vyper import ast as vy_ast
+from vyper.ast.nodes import NODE_SRC_ATTRIBUTES
+
+# Fields that are not compared between snapshots
+SKIPPED_FIELDS = set(NODE_SRC_ATTRIBUTES) | {"ast_type", "node_id"}
+
+# Nodes are keyed by their `node_id`, or by the key of their parent, the field and
+# the position in the field if they do not have a unique `node_id`
+NodeKey = Union[int, Tuple[Hashable, str, int]]
+
+
+class NodeSnapshot(NamedTuple):
+    node: vy_ast.VyperNode
+    parent: Optional[NodeKey]
+    scalars: Tuple[Tuple[str, str], ...]
+    children: Tuple[Tuple[str, Tuple[NodeKey, ...]], ...]
+    typ: Optional[str]
+
+
+def _get_fields(node: vy_ast.VyperNode) -> List[str]:
+    return sorted(i for i in node.get_fields() if i not in SKIPPED_FIELDS)
+
+
+def get_function(ast: vy_ast.Module, name: str) -> Optional[vy_ast.FunctionDef]:
+    """
+    Returns the function of a module with the given name, or None if there is none.
+    """
+    fn_nodes = [i for i in ast.body if isinstance(i, vy_ast.FunctionDef) and i.name == name]
+    return fn_nodes[0] if fn_nodes else None
+
+
+def _get_roots(ast: vy_ast.Module, function_id: Optional[int]) -> List[vy_ast.VyperNode]:
+    if function_id is None:
+        return [ast]
+    return [i for i in ast.body if isinstance(i, vy_ast.FunctionDef) and i.node_id == function_id]
+
+
+def take_snapshot(
+    ast: vy_ast.Module, function_id: Optional[int] = None
+) -> Dict[NodeKey, NodeSnapshot]:
+    """
+    Record the fields of every node in the AST, or of the function with the given
+    `node_id`.
+
+    Nodes are keyed by their `node_id`, so a node that a pass replaces with a copy
+    is reported as changed. Operators may share a `node_id`, as the Python parser
+    reuses them, and some nodes created by the transpiler do not have one, so these
+    are keyed by their position in their parent instead.
+    """
+    snapshot: Dict[NodeKey, NodeSnapshot] = {}
+
+    # Keys of the nodes seen so far by identity, as a node may be referenced twice
+    keys: Dict[int, NodeKey] = {}
+    node_ids = set()
+
+    def get_key(node: vy_ast.VyperNode, parent: Optional[NodeKey], field: str, idx: int):
+        if id(node) not in keys:
+            node_id = getattr(node, "node_id", None)
+            if node_id is None or node_id in node_ids:
+                keys[id(node)] = (parent, field, idx)
+            else:
+                node_ids.add(node_id)
+                keys[id(node)] = node_id
+        return keys[id(node)]
+
+    stack: List[Tuple[vy_ast.VyperNode, Optional[NodeKey], NodeKey]] = [
+        (root, None, get_key(root, None, "body", idx))
+        for idx, root in enumerate(_get_roots(ast, function_id))
+    ]
+    while stack:
+        node, parent, key = stack.pop()
+        if key in snapshot:
+            continue
+
+        scalars = []
+        children = []
+        for field in _get_fields(node):
+            value = getattr(node, field, None)
+            if isinstance(value, vy_ast.VyperNode):
+                value = [value]
+            elif not isinstance(value, list) or not any(
+                isinstance(i, vy_ast.VyperNode) for i in value
+            ):
+                scalars.append((field, repr(value)))
+                continue
+
+            child_keys = []
+            for idx, child in enumerate(value):
+                if isinstance(child, vy_ast.VyperNode):
+                    child_keys.append(get_key(child, key, field, idx))
+                    stack.append((child, key, child_keys[-1]))
+            children.append((field, tuple(child_keys)))
+
+        typ = node._metadata.get("type")
+        snapshot[key] = NodeSnapshot(
+            node, parent, tuple(scalars), tuple(children), str(typ) if typ is not None else None
+        )
+
+    return snapshot
+
+
+def _get_label(node: vy_ast.VyperNode) -> str:
+    node_id = getattr(node, "node_id", None)
+    return f"{type(node).__name__}#{node_id if node_id is not None else '?'}"
+
+
+def _describe(s: NodeSnapshot) -> str:
+    parts = [_get_label(s.node)]
+    parts.extend(f"{k}={v}" for k, v in s.scalars if v != "None")
+    if s.typ:
+        parts.append(f"type={s.typ}")
+    lineno = getattr(s.node, "lineno", None)
+    if lineno is not None:
+        parts.append(f"(line {lineno})")
+    return " ".join(parts)
+
+
+def _sort_key(s: NodeSnapshot) -> Tuple[float, float]:
+    # Nodes without a source position are listed last
+    lineno = getattr(s.node, "lineno", None)
+    col_offset = getattr(s.node, "col_offset", None)
+    return (
+        lineno if lineno is not None else float("inf"),
+        col_offset if col_offset is not None else float("inf"),
+    )
+
+
+def diff_snapshots(
+    before: Dict[NodeKey, NodeSnapshot], after: Dict[NodeKey, NodeSnapshot]
+) -> List[str]:
+    """
+    Returns the lines of a diff listing the nodes that were added, removed or changed.
+    """
+
+    def label(snapshots: Dict[NodeKey, NodeSnapshot], key: Optional[NodeKey]) -> str:
+        if key is None:
+            return "-"
+        return _get_label(snapshots[key].node)
+
+    lines = []
+    for s in sorted((s for k, s in before.items() if k not in after), key=_sort_key):
+        lines.append(f"- {_describe(s)} in {label(before, s.parent)}")
+
+    for s in sorted((s for k, s in after.items() if k not in before), key=_sort_key):
+        lines.append(f"+ {_describe(s)} in {label(after, s.parent)}")
+
+    for key, s in sorted(after.items(), key=lambda i: _sort_key(i[1])):
+        old = before.get(key)
+        if old is None or old[1:] == s[1:]:
+            continue
+
+        lines.append(f"~ {_describe(s)}")
+        if old.parent != s.parent:
+            lines.append(f"    parent: {label(before, old.parent)} -> {label(after, s.parent)}")
+        if old.typ != s.typ:
+            lines.append(f"    type: {old.typ} -> {s.typ}")
+
+        old_scalars, new_scalars = dict(old.scalars), dict(s.scalars)
+        for k in sorted(old_scalars.keys() | new_scalars.keys()):
+            if old_scalars.get(k) != new_scalars.get(k):
+                lines.append(f"    {k}: {old_scalars.get(k)} -> {new_scalars.get(k)}")
+
+        old_children, new_children = dict(old.children), dict(s.children)
+        for k in sorted(old_children.keys() | new_children.keys()):
+            if old_children.get(k) != new_children.get(k):
+                old_labels = ", ".join(label(before, i) for i in old_children.get(k, ()))
+                new_labels = ", ".join(label(after, i) for i in new_children.get(k, ()))
+                lines.append(f"    {k}: [{old_labels}] -> [{new_labels}]")
+
+    return lines
+
+
+class TreeDiffWriter:
+    """
+    Writes the changes made to the AST by each transpiler pass to a directory,
+    as a cheaper alternative to printing the whole AST after every pass.
+
+    Each pass is written to a file named after its position in `PASSES` and its
+    key, e.g. `13_Sv.diff`. The diff can be limited to a single function and to a
+    subset of passes. The function is looked up by name before the first pass, so
+    that it is still followed once a pass renames it, e.g. `__init__`.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        function: Optional[str] = None,
+        passes: Optional[List[str]] = None,
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.function = function
+        self.passes = passes
+
+        self._function_id: Optional[int] = None
+
+    def start(self, ast: vy_ast.Module):
+        """
+        Resolve the function that the diffs are limited to, before the first pass.
+        """
+        if self.function is None:
+            return
+
+        fn_node = get_function(ast, self.function)
+        if fn_node is None:
+            raise ValueError(f"Function `{self.function}` does not exist")
+        self._function_id = fn_node.node_id
+
+    @contextmanager
+    def record(self, idx: int, key: str, visitor_type: type, ast: vy_ast.Module):
+        if self.passes is not None and key not in self.passes:
+            yield
+            return
+
+        before = take_snapshot(ast, self._function_id)
+        yield
+        after = take_snapshot(ast, self._function_id)
+
+        lines = diff_snapshots(before, after)
+        header = f"# Pass {key} ({visitor_type.__name__}): {len(lines)} changes"
+        if self.function:
+            header += f" in function {self.function}"
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{idx:02d}_{key}.diff"
+        path.write_text("\n".join([header, *lines]) + "\n")
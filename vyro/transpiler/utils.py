@@ -1,5 +1,5 @@
 from string import ascii_lowercase as alc
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from vyper import ast as vy_ast
 from vyper.semantics.types import AddressDefinition
@@ -18,16 +18,106 @@ from vyro.cairo.types import (
 )
 from vyro.exceptions import TranspilerPanic, UnsupportedType
 from vyro.transpiler.context import ASTContext
+from vyro.transpiler.node_index import NODE_INDEX_KEY, get_node_index
+from vyro.transpiler.statement_buffer import get_statement_buffer
+
+# Cairo types of Vyper types that are converted by their class alone, keyed by the
+# class and the flags of the Vyper type
+_CAIRO_TYPES: Dict[Tuple[type, bool, bool, bool], CairoTypeDefinition] = {}
 
 
 def set_parent(child: vy_ast.VyperNode, parent: vy_ast.VyperNode):
     """
-    Replica of `set_parent` in `vyper/ast/nodes.py`
+    Replica of `set_parent` in `vyper/ast/nodes.py`, which also adds the child
+    to the node index of the module.
     """
     child._parent = parent
     child._depth = getattr(parent, "_depth", -1) + 1
     parent._children.add(child)
 
+    index = get_node_index(parent)
+    if index is not None:
+        index.add(child, parent)
+
+
+def replace_in_tree(ast: vy_ast.Module, old_node: vy_ast.VyperNode, new_node: vy_ast.VyperNode):
+    """
+    Wrapper of `vy_ast.Module.replace_in_tree` that also adds the new node to the
+    node index of the module.
+    """
+    buffer = get_statement_buffer()
+    if buffer is not None:
+        buffer.replace(old_node, new_node)
+
+    ast.replace_in_tree(old_node, new_node)
+
+    index = ast._metadata.get(NODE_INDEX_KEY)
+    if index is not None:
+        index.add(new_node, new_node._parent)
+
+
+def add_to_body(ast: vy_ast.Module, node: vy_ast.VyperNode):
+    """
+    Wrapper of `vy_ast.Module.add_to_body` that also adds the node to the node
+    index of the module.
+    """
+    ast.add_to_body(node)
+
+    index = ast._metadata.get(NODE_INDEX_KEY)
+    if index is not None:
+        index.add(node, ast)
+
+
+def remove_statement(node: vy_ast.VyperNode, body: List[Optional[vy_ast.VyperNode]]):
+    """
+    Remove a statement from a list of statements, e.g. one returned by `get_scope`.
+    """
+    buffer = get_statement_buffer()
+    if buffer is not None:
+        buffer.flush_body(body)
+
+    body.remove(node)
+
+
+def reindex(node: vy_ast.VyperNode):
+    """
+    Update the node index after the `id` of a `Name` node or the `attr` of an
+    `Attribute` node has been changed.
+    """
+    index = get_node_index(node)
+    if index is not None:
+        index.reindex(node)
+
+
+def get_descendants(
+    node: vy_ast.VyperNode,
+    node_type: Union[type, Tuple[type, ...], None] = None,
+    filters: Optional[dict] = None,
+    include_self: bool = False,
+    reverse: bool = False,
+) -> List[vy_ast.VyperNode]:
+    """
+    Equivalent of `VyperNode.get_descendants`, which uses the node index of the
+    module if there is one instead of searching every descendant of `node`.
+    """
+    index = get_node_index(node)
+    if index is None:
+        return node.get_descendants(node_type, filters, include_self, reverse)
+    return index.get_descendants(node, node_type, filters, include_self, reverse)
+
+
+def get_ancestor(
+    node: vy_ast.VyperNode, node_type: Union[type, Tuple[type, ...]]
+) -> Optional[vy_ast.VyperNode]:
+    """
+    Equivalent of `VyperNode.get_ancestor` with a node type, which walks up the
+    parent chain in a loop instead of recursively.
+    """
+    parent = node._parent
+    while parent is not None and not isinstance(parent, node_type):
+        parent = parent._parent
+    return parent
+
 
 def insert_statement_after(
     node: vy_ast.VyperNode,
@@ -51,8 +141,12 @@ def insert_statement_after(
         The list to add `node` to.
     """
     assert hasattr(body_node, "body")
-    node_idx = body.index(after)
-    body.insert(node_idx + 1, node)
+    buffer = get_statement_buffer()
+    if buffer is not None:
+        buffer.insert_after(node, after, body)
+    else:
+        node_idx = body.index(after)
+        body.insert(node_idx + 1, node)
     set_parent(node, body_node)
 
 
@@ -78,8 +172,12 @@ def insert_statement_before(
         The list to add `node` to.
     """
     assert hasattr(body_node, "body")
-    node_idx = body.index(before)
-    body.insert(node_idx, node)
+    buffer = get_statement_buffer()
+    if buffer is not None:
+        buffer.insert_before(node, before, body)
+    else:
+        node_idx = body.index(before)
+        body.insert(node_idx, node)
     set_parent(node, body_node)
 
 
@@ -103,6 +201,9 @@ def get_cairo_type(typ: BaseTypeDefinition) -> CairoTypeDefinition:
     """
     Convert a type definition to its Cairo type.
     If the type definition is already a `CairoTypeDefinition`, return.
+
+    The Cairo types returned are interned, and the Cairo type of types that are
+    converted by their class alone is memoized.
     """
     if typ is None:
         raise TranspilerPanic("No type provided for conversion")
@@ -110,54 +211,51 @@ def get_cairo_type(typ: BaseTypeDefinition) -> CairoTypeDefinition:
     if isinstance(typ, (CairoTypeDefinition, StructDefinition)):
         return typ
 
+    flags = (typ.is_constant, typ.is_public, typ.is_immutable)
+    key = (type(typ), *flags)
+    cairo_typ = _CAIRO_TYPES.get(key)
+    if cairo_typ is not None:
+        return cairo_typ
+
     if isinstance(typ, IntegerAbstractType):
 
         if typ._bits > 251:
-            return CairoUint256Definition(
-                is_constant=typ.is_constant, is_public=typ.is_public, is_immutable=typ.is_immutable
-            )
+            cairo_typ = CairoUint256Definition.get_instance(*flags)
 
         else:
-            return FeltDefinition(
-                is_constant=typ.is_constant, is_public=typ.is_public, is_immutable=typ.is_immutable
-            )
+            cairo_typ = FeltDefinition.get_instance(*flags)
 
     elif isinstance(typ, (FixedAbstractType, DynamicArrayDefinition)):
         raise UnsupportedType(f"`{type(typ)}` type is not supported.")
 
     elif isinstance(typ, AddressDefinition):
-        return FeltDefinition(
-            is_constant=typ.is_constant, is_public=typ.is_public, is_immutable=typ.is_immutable
-        )
+        cairo_typ = FeltDefinition.get_instance(*flags)
 
     elif isinstance(typ, MappingDefinition):
         key_types, value_type = get_hashmap_types(typ)
         # Ensure key types and value type are converted
         key_types = list(map(get_cairo_type, key_types))
         value_type = get_cairo_type(value_type)
-        return CairoMappingDefinition(
-            typ.is_constant, typ.is_public, typ.is_immutable, key_types, value_type
-        )
+        return CairoMappingDefinition.get_instance(*flags, key_types, value_type)
 
     elif isinstance(typ, ArrayDefinition):
         # Convert static arrays to mappings
         key_types, value_type = get_array_types(typ)
         value_type = get_cairo_type(value_type)
-        return CairoMappingDefinition(
-            typ.is_constant, typ.is_public, typ.is_immutable, key_types, value_type
-        )
+        return CairoMappingDefinition.get_instance(*flags, key_types, value_type)
 
     elif isinstance(typ, EnumDefinition):
+        # Enums depend on their members
         if len(typ.members) <= 251:
-            return FeltDefinition(
-                is_constant=typ.is_constant, is_public=typ.is_public, is_immutable=typ.is_immutable
-            )
+            return FeltDefinition.get_instance(*flags)
         else:
-            return CairoUint256Definition(
-                is_constant=typ.is_constant, is_public=typ.is_public, is_immutable=typ.is_immutable
-            )
+            return CairoUint256Definition.get_instance(*flags)
 
-    return FeltDefinition(typ.is_constant, typ.is_public, typ.is_immutable)
+    else:
+        cairo_typ = FeltDefinition.get_instance(*flags)
+
+    _CAIRO_TYPES[key] = cairo_typ
+    return cairo_typ
 
 
 def add_implicit_to_function(node: vy_ast.VyperNode, implicit: str):
@@ -235,7 +333,7 @@ def get_array_types(
 
     if keys is None:
         keys = []
-    keys.append(FeltDefinition())
+    keys.append(FeltDefinition.get_instance())
 
     if isinstance(typ.value_type, ArrayDefinition):
         return get_array_types(typ.value_type, keys)
@@ -285,12 +383,53 @@ def extract_mapping_args(
     return ret
 
 
-def get_stmt_node(node: vy_ast.VyperNode) -> vy_ast.VyperNode:
-    parent = node.get_ancestor()
+def _resolve_scope(
+    node: vy_ast.VyperNode,
+) -> Tuple[vy_ast.VyperNode, vy_ast.VyperNode, List[Optional[vy_ast.VyperNode]]]:
+    """
+    Returns a tuple of the statement node, the scope node and the list of statements
+    that the scope node holds the node in, in a single walk up the parent chain.
+
+    The walk records the child of each ancestor that the node is reached from, so
+    only the statement lists of the enclosing `If` nodes need to be checked instead
+    of every node in them.
+    """
+    buffer = get_statement_buffer()
+
+    stmt_node = None
+    child, parent = node, node._parent
+    while parent is not None:
+        if isinstance(parent, (vy_ast.FunctionDef, vy_ast.If)):
+            if stmt_node is None:
+                stmt_node = child
 
-    if isinstance(parent, (vy_ast.FunctionDef, vy_ast.If)):
-        return node
-    return get_stmt_node(parent)
+            if isinstance(parent, vy_ast.FunctionDef):
+                result = (stmt_node, parent, parent.body)
+                break
+
+            # The node may also be in `vy_ast.If.test`, in which case the scope is
+            # that of the `If` node
+            pending_body = buffer.get_pending_body(child) if buffer is not None else None
+            if pending_body is parent.body or any(i is child for i in parent.body):
+                result = (stmt_node, parent, parent.body)
+                break
+            if pending_body is parent.orelse or any(i is child for i in parent.orelse):
+                result = (stmt_node, parent, parent.orelse)
+                break
+
+        child, parent = parent, parent._parent
+    else:
+        raise TranspilerPanic(f"`{type(node).__name__}` node is not in a function")
+
+    return result
+
+
+def get_stmt_node(node: vy_ast.VyperNode) -> vy_ast.VyperNode:
+    """
+    Returns the ancestor of a node, or the node itself, whose parent is the first
+    `vy_ast.FunctionDef` or `vy_ast.If` node above it.
+    """
+    return _resolve_scope(node)[0]
 
 
 def get_scope(node: vy_ast.VyperNode) -> Tuple[vy_ast.VyperNode, List[Optional[vy_ast.VyperNode]]]:
@@ -303,26 +442,4 @@ def get_scope(node: vy_ast.VyperNode) -> Tuple[vy_ast.VyperNode, List[Optional[v
         vy_ast.If.body
         vy_ast.If.orelse
     """
-    scope_node = node.get_ancestor((vy_ast.FunctionDef, vy_ast.If))
-
-    if isinstance(scope_node, vy_ast.If):
-        # `If` node has `body` and `orelse`. We need to check if the node exists
-        # in either list of all descendant nodes.
-
-        body_nodes = []
-        for n in scope_node.body:
-            body_nodes.extend(n.get_descendants(include_self=True))
-
-        orelse_nodes = []
-        for n in scope_node.orelse:
-            orelse_nodes.extend(n.get_descendants(include_self=True))
-
-        if node in body_nodes:
-            return (scope_node, scope_node.body)
-        elif node in orelse_nodes:
-            return (scope_node, scope_node.orelse)
-        else:
-            # Get `FunctionDef` node instead (e.g. node is in `vy_ast.If.test`)
-            return get_scope(scope_node)
-
-    return (scope_node, scope_node.body)
+    return _resolve_scope(node)[1:]
@@ -1,3 +1,5 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
 from vyro.exceptions import UnsupportedNode
 
 
@@ -6,12 +8,64 @@ class BaseVisitor:
     Base class for Vyper AST tree visitor.
     """
 
+    # Visitor functions keyed by node class. Each subclass has its own table, which
+    # is filled the first time a node class is visited.
+    _dispatch: Dict[type, Optional[Callable]] = {}
+
+    # Node classes that the pass acts on. A pass that sets `NODE_TYPES` acts on each
+    # of these nodes without depending on the rest of the tree, and otherwise walks
+    # the tree with the traversal of `BaseVisitor`. Such passes can be fused with
+    # other passes into a single traversal by `CompositeVisitor`.
+    NODE_TYPES: Optional[Tuple[type, ...]] = None
+
+    # Keys of passes in `PASSES` that must be completed for the whole tree before
+    # this pass runs. A fusable pass may be moved ahead of the passes before it to be
+    # fused with an earlier group, but not ahead of or into a group with these passes.
+    RUNS_AFTER: Tuple[str, ...] = ()
+
+    # Constructs in `vyro.transpiler.features` that the pass acts on. The pass is
+    # skipped if none of them are present in the module. Passes without triggers
+    # are always run.
+    TRIGGERS: Optional[Tuple[str, ...]] = None
+
+    # Called with each node that the pass visits, e.g. by `PassProfiler`. It is set
+    # on an instance, so other instances of the pass are not affected.
+    visit_hook: Optional[Callable] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
     def visit(self, node, ast, context, *args):
-        node_type = type(node).__name__
-        visitor_fn = getattr(self, f"visit_{node_type}", None)
+        if self.visit_hook is not None:
+            self.visit_hook(node)
+
+        node_type = type(node)
+        try:
+            visitor_fn = self._dispatch[node_type]
+        except KeyError:
+            visitor_fn = getattr(type(self), f"visit_{node_type.__name__}", None)
+            self._dispatch[node_type] = visitor_fn
+
         if visitor_fn is None:
-            raise UnsupportedNode(f"{node_type} node is not yet supported in visitor", node)
-        visitor_fn(node, ast, context, *args)
+            raise UnsupportedNode(
+                f"{node_type.__name__} node is not yet supported in visitor", node
+            )
+        visitor_fn(self, node, ast, context, *args)
+
+    def visit_node(self, node, ast, context):
+        """
+        Visit a node of a class in `NODE_TYPES` without visiting its children.
+        """
+        if self.visit_hook is not None:
+            self.visit_hook(node)
+        getattr(self, f"visit_{type(node).__name__}")(node, ast, context)
+
+    def finish(self, ast, context):
+        """
+        Called after every node of the module has been visited.
+        """
+        pass
 
     def visit_arg(self, node, ast, context):
         pass
@@ -77,6 +131,9 @@ class BaseVisitor:
     def visit_CairoAssert(self, node, ast, context):
         pass
 
+    def visit_CairoCachedFunction(self, node, ast, context):
+        pass
+
     def visit_CairoIfTest(self, node, ast, context):
         pass
 
@@ -208,6 +265,8 @@ class BaseVisitor:
         for i in node.body:
             self.visit(i, ast, context)
 
+        self.finish(ast, context)
+
     def visit_Mult(self, node, ast, context):
         pass
 
@@ -269,3 +328,25 @@ class BaseVisitor:
         self.visit(node.target, ast, context)
         if node.value:
             self.visit(node.value, ast, context)
+
+
+class CompositeVisitor(BaseVisitor):
+    """
+    Run several fusable passes in a single traversal of the AST.
+
+    Each node is visited by the passes in order before its children are visited.
+    """
+
+    def __init__(self, visitors: List[BaseVisitor]) -> None:
+        self.visitors = visitors
+
+    def visit(self, node, ast, context):
+        for v in self.visitors:
+            if isinstance(node, v.NODE_TYPES):
+                v.visit_node(node, ast, context)
+
+        super().visit(node, ast, context)
+
+    def finish(self, ast, context):
+        for v in self.visitors:
+            v.finish(ast, context)
@@ -0,0 +1,178 @@
+import hashlib
+import os
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from vyro._config import __version__
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+# Default upper bound for the total size of cached Cairo files
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Fraction of `max_size` that the cache is reduced to when it is full, so that a
+# full cache is not scanned again on every write
+EVICTION_TARGET = 0.9
+
+CACHE_SUFFIX = ".cairo"
+
+# File in the cache directory that holds the total size of the cached Cairo files
+SIZE_INDEX = "size"
+
+# Keys and class names of the transpiler passes in `PASSES`, in order. Kept as a
+# constant so that a cache lookup does not import the transpiler, and checked
+# against `PASSES` in the tests.
+PASS_LIST = (
+    "Fc:UnsupportedVisitor,I:InitialisationVisitor,SA:StaticArrayConverterVisitor,"
+    "SC:StructConverterVisitor,IfH:IfHandlerVisitor,EC:EnumConverterVisitor,"
+    "BC:BuiltinConstantHandlerVisitor,Bf:BuiltinFunctionHandlerVisitor,"
+    "Ch:ConstructorHandler,Ev:EventHandlerVisitor,Ah:AssertHandlerVisitor,"
+    "If:InternalFunctionsHandler,Rv:ReturnValueHandler,Sv:StorageVarVisitor,"
+    "Oc:OpsConverterVisitor,Co:ConstantHandlerVisitor,Ui:Uint256HandlerVisitor,"
+    "Ar:ArgsConverterVisitor,Sr:StorageReadEliminationVisitor,"
+    "Sw:StorageWriteEliminationVisitor,Tf:TemporaryForwardingVisitor,"
+    "CI:CairoImporterVisitor"
+)
+
+
+def get_default_cache_dir() -> Path:
+    """
+    Returns the cache directory, which can be overridden with the `VYRO_CACHE_DIR`
+    environment variable.
+    """
+    cache_dir = os.environ.get("VYRO_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home) / "vyro"
+
+
+class TranspileCache:
+    """
+    Content-addressed on-disk cache of transpiled Cairo output.
+
+    Entries are keyed by a hash of the Vyper source, the vyro and vyper versions and
+    the list of transpiler passes, so a change to any of them results in a cache miss.
+    The total size of the cache is bounded, and the least recently used entries are
+    evicted first. The total size is kept in an index file, so that the cache
+    directory is only scanned when it is full.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path, None] = None, max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else get_default_cache_dir()
+        self.max_size = max_size
+
+        self._salt = "\0".join([__version__, version("vyper"), PASS_LIST]).encode()
+
+    def get_key(self, source: bytes) -> str:
+        h = hashlib.sha256(self._salt)
+        h.update(b"\0")
+        h.update(source)
+        return h.hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached Cairo for `key`, or None if there is no entry.
+        """
+        path = self._get_path(key)
+        try:
+            output = path.read_text()
+            # Mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return output
+
+    def put(self, key: str, output: str):
+        """
+        Store the Cairo output for `key`, evicting old entries if the cache is full.
+        """
+        path = self._get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+
+        # Write to a temporary file first so that concurrent readers never see
+        # a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(output)
+        os.replace(tmp_path, path)
+
+        total_size = self._update_size(path.stat().st_size - old_size)
+        if total_size > self.max_size:
+            self.evict()
+
+    def _update_size(self, delta: int = 0, total_size: Optional[int] = None) -> int:
+        """
+        Add `delta` to the total size in the index file, or set it to `total_size`,
+        and return the new total. The index is rebuilt from the cache directory if it
+        does not exist.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / SIZE_INDEX, "a+") as fh:
+            # Writers in other processes (e.g. with `--jobs`) wait for the lock
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+
+            if total_size is None:
+                fh.seek(0)
+                text = fh.read().strip()
+                total_size = int(text) + delta if text else self._get_total_size()
+
+            fh.seek(0)
+            fh.truncate()
+            fh.write(str(total_size))
+
+        return total_size
+
+    def _get_entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def _get_total_size(self) -> int:
+        return sum(size for _, size, _ in self._get_entries())
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache is within a fraction
+        of `max_size`, and update the index of the total size.
+        """
+        entries = self._get_entries()
+        total_size = sum(size for _, size, _ in entries)
+
+        target_size = int(self.max_size * EVICTION_TARGET)
+        if total_size > self.max_size:
+            for _, size, path in sorted(entries):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+                total_size -= size
+                if total_size <= target_size:
+                    break
+
+        self._update_size(total_size=total_size)
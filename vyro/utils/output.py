@@ -1,3 +1,24 @@
+from pathlib import Path
+
+
 def write_cairo(source_code: str, file_name: str):
     f = open(file_name, "w")
     f.write(source_code)
+
+
+def write_cairo_if_changed(source_code: str, file_name: str) -> bool:
+    """
+    Write the Cairo output to a file, unless the file already has the same contents.
+
+    Returns True if the file was written.
+    """
+    path = Path(file_name)
+    try:
+        if path.read_text() == source_code:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_cairo(source_code, file_name)
+    return True
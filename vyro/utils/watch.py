@@ -0,0 +1,108 @@
+import hashlib
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# Seconds between polls of the watched directory
+DEFAULT_INTERVAL = 0.5
+
+# Seconds without further changes before a burst of changes is reported
+DEFAULT_DEBOUNCE = 0.2
+
+
+def get_file_hash(path: Path) -> Optional[str]:
+    """
+    Returns the sha256 hash of the contents of a file, or None if it does not exist.
+    """
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class ContractWatcher:
+    """
+    Polls a directory for changes to Vyper contracts.
+
+    The modification time and size of each contract is checked on every poll, and
+    contracts are only hashed when these change. A contract is reported as changed
+    only if its hash differs from the last one seen, so saving a file without
+    editing it does not trigger a re-transpilation.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        pattern: str = "*.vy",
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        self.root = Path(root)
+        self.pattern = pattern
+        self.interval = interval
+        self.debounce = debounce
+
+        self._stats: Dict[Path, Tuple[int, int]] = {}
+        self._hashes: Dict[Path, str] = {}
+
+    def _stat_all(self) -> Dict[Path, Tuple[int, int]]:
+        stats = {}
+        for path in self.root.rglob(self.pattern):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+
+        return stats
+
+    def poll(self) -> Tuple[List[Path], List[Path]]:
+        """
+        Returns the contracts that changed and the contracts that were removed since
+        the last poll. On the first poll, every contract is reported as changed.
+        """
+        stats = self._stat_all()
+
+        changed = []
+        for path, stat in list(stats.items()):
+            if self._stats.get(path) == stat:
+                continue
+
+            h = get_file_hash(path)
+            if h is None:
+                # Removed since it was listed, and reported on the next poll
+                del stats[path]
+                continue
+
+            if self._hashes.get(path) != h:
+                self._hashes[path] = h
+                changed.append(path)
+
+        removed = [p for p in self._stats if p not in stats]
+        for path in removed:
+            self._hashes.pop(path, None)
+
+        self._stats = stats
+        return sorted(changed), sorted(removed)
+
+    def wait(self) -> Tuple[List[Path], List[Path]]:
+        """
+        Block until a contract is modified, added or removed, and return the result
+        of `poll` once no further changes have been seen for `debounce` seconds.
+        """
+        while True:
+            stats = self._stat_all()
+            if stats != self._stats:
+                break
+            time.sleep(self.interval)
+
+        # Editors and version control often touch files several times in a row, so
+        # wait for the burst to settle before re-transpiling
+        while True:
+            time.sleep(self.debounce)
+            new_stats = self._stat_all()
+            if new_stats == stats:
+                break
+            stats = new_stats
+
+        return self.poll()
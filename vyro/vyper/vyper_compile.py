@@ -1,4 +1,3 @@
-import copy
 from collections import OrderedDict
 from pathlib import Path
 
@@ -21,16 +20,25 @@ def get_vyper_ast(file_name: str, root_folder: str = ".") -> vy_ast.Module:
 
     file_path = Path(file_name)
     with file_path.open() as fh:
-        # trailing newline fixes python parsing bug when source ends in a comment
-        # https://bugs.python.org/issue35107
-        source_code = fh.read() + "\n"
+        source_code = fh.read()
+
+    return get_vyper_ast_from_source(source_code, file_name)
+
+
+def get_vyper_ast_from_source(source_code: str, file_name: str = "<unknown>") -> vy_ast.Module:
+
+    # trailing newline fixes python parsing bug when source ends in a comment
+    # https://bugs.python.org/issue35107
+    source_code += "\n"
 
     vyper_ast: vy_ast.Module = generate_ast(source_code, 0, file_name)
     vy_ast.validation.validate_literal_nodes(vyper_ast)
-    vyper_ast_folded = copy.deepcopy(vyper_ast)
-    vy_ast.folding.fold(vyper_ast_folded)
-    validate_semantics(vyper_ast_folded, None)
+
+    # Fold in place. Unlike the Vyper compiler, we do not need to keep the unfolded
+    # AST around, so there is no need to copy the tree first.
+    vy_ast.folding.fold(vyper_ast)
+    validate_semantics(vyper_ast, None)
 
     # Skip expansion of Vyper AST
 
-    return vyper_ast_folded
+    return vyper_ast